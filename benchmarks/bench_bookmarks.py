@@ -0,0 +1,135 @@
+"""Bookmark import benchmark: full and incremental imports of large libraries.
+
+Writes a synthetic Chromium Bookmarks file and a Firefox places.sqlite with
+--count bookmarks each (nested folders, some duplicate URLs), then times
+diff_bookmarks for the first import, an unchanged re-import, and a
+re-import after --churn of the bookmarks were edited, renamed or deleted.
+Peak Python heap for each pass is measured by tracemalloc in a separate run.
+
+Usage: python benchmarks/bench_bookmarks.py [--count 50000] [--churn 0.01] [--json]
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bookmarks
+from bookmarks import diff_bookmarks
+
+FOLDERS = ["Work", "Docs", "News", "Shopping", "Travel", "Recipes", "Music", "Research", "Tools", "Reading"]
+
+
+def bookmark_urls(count, seed):
+    rng = random.Random(seed)
+    # About 2% repeat an earlier URL with different casing or a trailing slash.
+    urls = []
+    for i in range(count):
+        if urls and rng.random() < 0.02:
+            urls.append(rng.choice(urls).replace("https://", "HTTPS://") + "/")
+        else:
+            urls.append(f"https://site{i % 5000}.example.com/page/{i}")
+    return urls
+
+
+def write_chromium(path, urls, seed):
+    rng = random.Random(seed)
+    folders = {name: {"type": "folder", "name": name, "children": []} for name in FOLDERS}
+    for name in FOLDERS[:3]:
+        folders[name]["children"].append({"type": "folder", "name": f"{name} archive", "children": []})
+    for i, url in enumerate(urls):
+        folder = folders[rng.choice(FOLDERS)]
+        target = folder["children"][0] if folder["children"] and folder["children"][0]["type"] == "folder" and i % 4 == 0 else folder
+        target["children"].append({"type": "url", "name": f"Bookmark {i}", "url": url, "date_added": "13300000000000000"})
+    data = {"checksum": "", "version": 1, "roots": {
+        "bookmark_bar": {"type": "folder", "name": "Bookmarks bar", "children": list(folders.values())},
+        "other": {"type": "folder", "name": "Other bookmarks", "children": []},
+        "synced": {"type": "folder", "name": "Mobile bookmarks", "children": []},
+    }}
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def write_firefox(path, urls, seed):
+    rng = random.Random(seed)
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE moz_places (id INTEGER PRIMARY KEY, url TEXT)")
+    db.execute("CREATE TABLE moz_bookmarks (id INTEGER PRIMARY KEY, type INTEGER, fk INTEGER, parent INTEGER, title TEXT, guid TEXT)")
+    db.executemany("INSERT INTO moz_bookmarks (id, type, parent, title, guid) VALUES (?, 2, ?, ?, ?)",
+                   [(1, 0, "", "root________"), (2, 1, "toolbar", "toolbar_____"), (3, 1, "menu", "menu________"),
+                    (4, 1, "tags", bookmarks.FIREFOX_TAGS_GUID), (5, 4, "reading", None)]
+                   + [(10 + i, 2, name, None) for i, name in enumerate(FOLDERS)])
+    db.executemany("INSERT INTO moz_places (id, url) VALUES (?, ?)", [(i + 1, url.replace("page", "ff")) for i, url in enumerate(urls)])
+    db.executemany("INSERT INTO moz_bookmarks (type, fk, parent, title) VALUES (1, ?, ?, ?)",
+                   [(i + 1, rng.choice([2, 3] + list(range(10, 10 + len(FOLDERS)))), f"FF bookmark {i}") for i in range(len(urls))])
+    # Every tenth URL is also tagged, which adds a row under the tags root that the import must skip.
+    db.executemany("INSERT INTO moz_bookmarks (type, fk, parent, title) VALUES (1, ?, 5, NULL)", [(i + 1,) for i in range(0, len(urls), 10)])
+    db.commit()
+    db.close()
+
+
+def churn(urls, fraction, seed):
+    rng = random.Random(seed)
+    urls = list(urls)
+    for i in rng.sample(range(len(urls)), int(len(urls) * fraction)):
+        urls[i] = f"https://changed{i}.example.org/"
+    return urls[: len(urls) - int(len(urls) * fraction / 2)]
+
+
+def measure(sources, state):
+    start = time.perf_counter()
+    changes = diff_bookmarks(sources, state)
+    elapsed = time.perf_counter() - start
+    if changes.failed:
+        # Timing only the sources that could be read would understate the import.
+        raise RuntimeError(f"unreadable bench sources: {changes.failed}")
+    # A second pass for memory only: tracemalloc slows allocation-heavy code several-fold.
+    tracemalloc.start()
+    diff_bookmarks(sources, state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return changes, {"seconds": round(elapsed, 3), "peak_mb": round(peak / (1024 * 1024), 1), "added": len(changes.added),
+                     "updated": len(changes.updated), "removed": len(changes.removed), "skipped_sources": changes.unchanged_sources}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50000, help="bookmarks per browser")
+    parser.add_argument("--churn", type=float, default=0.01, help="share of bookmarks changed before the incremental pass")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="ql_bench_bookmarks_")
+    chromium, firefox = os.path.join(workdir, "Bookmarks"), os.path.join(workdir, "places.sqlite")
+    urls = bookmark_urls(args.count, 1)
+    write_chromium(chromium, urls, 2)
+    write_firefox(firefox, urls, 3)
+    sources = [("Chrome (bench)", chromium), ("Firefox (bench)", firefox)]
+
+    results = {"count": args.count * len(sources), "streaming_json": bookmarks.HAS_IJSON}
+    changes, results["first_import"] = measure(sources, {})
+    state = changes.state
+    changes, results["unchanged_reimport"] = measure(sources, state)
+    # Bump the mtime explicitly; a rewrite within the same timestamp tick would look unchanged.
+    write_chromium(chromium, churn(urls, args.churn, 4), 2)
+    stat = os.stat(chromium)
+    os.utime(chromium, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changes, results["incremental_reimport"] = measure(sources, state)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{results['count']} bookmarks, streaming JSON parser: {'yes' if results['streaming_json'] else 'no (json fallback)'}")
+        for name in ("first_import", "unchanged_reimport", "incremental_reimport"):
+            r = results[name]
+            print(f"{name:<22}{r['seconds']:>8.3f}s  peak {r['peak_mb']:>6.1f}MB  +{r['added']} ~{r['updated']} -{r['removed']}  skipped {r['skipped_sources']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Favicon service benchmark against a local HTTP stand-in.
+
+Starts --hosts keep-alive HTTP/1.1 servers on 127.0.0.1. Most serve an ICO
+at /favicon.ico, some redirect it to /static/icon.png, some answer 404 and
+some answer 200 with an HTML page. --links URLs spread over those origins are
+then looked up the way the launcher's rows do, repeatedly, as if the list
+were re-rendered while fetches are still in flight. Reports:
+- the time spent in request() (the GUI-thread cost per row)
+- the time until every origin has resolved
+- the most requests any origin received, which must be 1
+- how many icons and misses were recorded
+- how many origins a second, cold-started service re-fetches (0: misses are
+  cached on disk)
+
+Usage: python benchmarks/bench_favicons.py [--links 5000] [--hosts 50] [--delay 0.02] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from favicons import FaviconService, favicon_path
+
+ICO = b"\x00\x00\x01\x00\x01\x00\x10\x10" + b"\x00" * 300
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+
+class StandIn:
+    """Keep-alive HTTP/1.1 server for one origin; kind picks how it answers /favicon.ico."""
+    def __init__(self, kind, delay):
+        self.kind = kind
+        self.delay = delay
+        self.favicon_requests = 0
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b"\r\n", 1)[0].decode().split(" ")[1]
+                await asyncio.sleep(self.delay)
+                if path == "/favicon.ico":
+                    self.favicon_requests += 1
+                status, headers, body = self.respond(path)
+                lines = [f"HTTP/1.1 {status} X"] + [f"{k}: {v}" for k, v in headers.items()] + [f"Content-Length: {len(body)}", "", ""]
+                writer.write("\r\n".join(lines).encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, path):
+        if path == "/favicon.ico":
+            if self.kind == "ico":
+                return 200, {"Content-Type": "image/x-icon"}, ICO
+            if self.kind == "redirect":
+                return 301, {"Location": "/static/icon.png"}, b""
+            if self.kind == "html":
+                return 200, {"Content-Type": "text/html"}, b"<html>Page not found</html>"
+        if path == "/static/icon.png":
+            return 200, {"Content-Type": "image/png"}, PNG
+        return 404, {}, b"not found"
+
+
+def serve(hosts, delay, ready):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    kinds = ["ico"] * 6 + ["redirect", "redirect", "missing", "html"]
+    servers = []
+    for i in range(hosts):
+        stand_in = StandIn(kinds[i % len(kinds)], delay)
+        server = loop.run_until_complete(asyncio.start_server(stand_in.handle, "127.0.0.1", 0))
+        servers.append((stand_in, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"))
+    ready.append(servers)
+    loop.run_forever()
+
+
+def resolve_all(cache_dir, urls, origins, passes):
+    done = threading.Event()
+    resolved = []
+
+    def on_icon(origin, path):
+        resolved.append(path)
+        if len(resolved) == len(origins):
+            done.set()
+
+    service = FaviconService(cache_dir, on_icon)
+    start = time.perf_counter()
+    request_time = 0.0
+    queued = 0
+    for _ in range(passes):
+        for url in urls:
+            origin = url.rsplit("/", 2)[0]
+            started = time.perf_counter()
+            if not favicon_path(cache_dir, origin).exists():
+                queued += service.request(origin)
+            request_time += time.perf_counter() - started
+    if queued:
+        done.wait(30)
+    elapsed = time.perf_counter() - start
+    service.stop()
+    return service, queued, request_time, elapsed, resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=5000)
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02, help="server think time per request in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    ready = []
+    threading.Thread(target=serve, args=(args.hosts, args.delay, ready), daemon=True).start()
+    while not ready:
+        time.sleep(0.01)
+    servers = ready[0]
+    origins = [origin for _, origin in servers]
+    urls = [f"{origins[i % len(origins)]}/page/{i}" for i in range(args.links)]
+    cache_dir = tempfile.mkdtemp(prefix="ql_bench_favicons_")
+
+    passes = 3
+    service, queued, request_time, elapsed, resolved = resolve_all(cache_dir, urls, origins, passes)
+    # A fresh service reads the misses file back; nothing should be fetched again.
+    before = sum(s.favicon_requests for s, _ in servers)
+    second, requeued, _, _, _ = resolve_all(cache_dir, urls, origins, 1)
+    refetched = sum(s.favicon_requests for s, _ in servers) - before
+
+    report = {
+        "links": args.links,
+        "origins": len(origins),
+        "lookups": args.links * passes,
+        "request_us_per_lookup": round(request_time / (args.links * passes) * 1e6, 2),
+        "resolve_seconds": round(elapsed, 3),
+        "queued": queued,
+        "max_requests_per_origin": max(s.favicon_requests for s, _ in servers),
+        "icons": service.fetched,
+        "misses": service.failed,
+        "cold_start_requeued": requeued,
+        "cold_start_refetched": refetched,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:<24}{value}")
+    if report["max_requests_per_origin"] > 1:
+        print("an origin was fetched more than once")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
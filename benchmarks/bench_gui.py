@@ -0,0 +1,317 @@
+"""Headless GUI benchmarks over synthetic catalogs.
+
+Generates a .desktop application tree, links/recent/pinned JSON and an icon
+cache for each scale, then drives a real AppLauncher on Qt's offscreen
+platform: the AppLoaderThread scan, update_content per keystroke (first
+visible rows), rendering every row of the catalog, tab switches, sort modes,
+an icon-size slider drag, theme switches, opening the settings dialog,
+run_selected (with launching stubbed out), persistence writes and delegate
+paint. Each figure is the median of --repeat runs in
+seconds. Results can be saved with --output and checked against a saved
+baseline with --compare, which exits non-zero on regressions.
+
+Usage: python benchmarks/bench_gui.py [--scales 1000,10000,100000] [--repeat 5]
+                                      [--output results.json] [--compare baseline.json]
+       python benchmarks/bench_gui.py --current results.json --compare baseline.json
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import platform
+import random
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+WORDS = ["studio", "code", "paint", "music", "photo", "office", "terminal", "mail", "chat", "video",
+         "browser", "notes", "calc", "vault", "sync", "draw", "player", "reader", "editor", "monitor",
+         "backup", "game", "shell", "stream", "design", "cloud", "scan", "print", "map", "clock"]
+CATEGORIES = ["Accessories", "Development", "Graphics", "Internet", "Multimedia", "Office", "System", "Utilities", "Games", "Education"]
+QUERY = "studio"
+
+
+def tiny_png():
+    """A valid 1x1 RGBA PNG, enough for QIcon to load from the disk cache."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(b"\x00\x46\x82\xb4\xff")) + chunk(b"IEND", b"")
+
+
+def synthetic_name(rng, i):
+    return f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS).capitalize()} {i}"
+
+
+def make_fixture(root, size, seed=0):
+    """Write an application tree and launcher JSON for size apps under root; returns the tree path."""
+    rng = random.Random(seed)
+    apps_dir = os.path.join(root, "applications")
+    icons_dir = os.path.join(root, "icon_cache")
+    os.makedirs(icons_dir, exist_ok=True)
+    for category in CATEGORIES:
+        os.makedirs(os.path.join(apps_dir, category, "Tools"), exist_ok=True)
+    apps = []
+    png = tiny_png()
+    for i in range(size):
+        name = synthetic_name(rng, i)
+        category = rng.choice(CATEGORIES)
+        # Most shortcuts sit in category folders like a Start Menu; some are flat like /usr/share/applications.
+        folder = apps_dir if i % 10 == 0 else os.path.join(apps_dir, category, "Tools" if i % 7 == 0 else "")
+        path = os.path.join(folder, f"app{i}.desktop")
+        with open(path, "w") as f:
+            f.write(f"[Desktop Entry]\nType=Application\nName={name}\nExec=/bin/true %U\nCategories={category};\n")
+        apps.append((name, path, category))
+        if i < 5000:
+            with open(os.path.join(icons_dir, f"{hashlib.md5(path.encode()).hexdigest()}.png"), "wb") as f:
+                f.write(png)
+    links = [{"name": synthetic_name(rng, i), "url": f"https://example{i}.invalid/", "category": rng.choice(CATEGORIES), "is_favorite": i % 20 == 0}
+             for i in range(max(size // 10, 1))]
+    recent = [{"name": name, "path": path, "category": category, "type": "app", "timestamp": f"2024-01-{1 + i % 28:02d}T12:00:00", "launch_count": 1 + i % 5}
+              for i, (name, path, category) in enumerate(rng.sample(apps, min(50, size)))]
+    pinned = [{"name": name, "path": path, "category": category, "type": "app"}
+              for name, path, category in rng.sample(apps, min(max(size // 100, 1), 200))]
+    for file, data in (("links.json", links), ("recent.json", recent), ("pinned.json", pinned)):
+        with open(os.path.join(root, file), "w") as f:
+            json.dump(data, f)
+    return apps_dir
+
+
+def median_time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def bench_scale(qt, launcher_module, size, repeat, workdir):
+    from PyQt5.QtCore import QRect, QItemSelection, QItemSelectionModel
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtWidgets import QStyleOptionViewItem
+
+    apps_dir = make_fixture(workdir, size)
+    os.chdir(workdir)
+    results = {}
+
+    loaded = {}
+    scanner = launcher_module.AppLoaderThread(paths=[apps_dir])
+    scanner.appsLoaded.connect(lambda apps: loaded.update(apps=apps))
+    results["scan_s"] = median_time(scanner.run, repeat)
+
+    launcher = launcher_module.AppLauncher(single_instance=False)
+    launcher.startup_stages = []
+    launcher.enable_animations = False
+    # Favicons would be fetched over the network; the figures are for the GUI thread alone.
+    launcher.favicons_enabled = False
+    launcher.show_notification = lambda *args, **kwargs: None
+    launched = []
+    launcher.launch_item = lambda path, item_type, focus=True: launched.append(path)
+    launcher.apps = loaded["apps"]
+    launcher.links = launcher.load_links()
+    launcher.recent_items = launcher.load_recent()
+    launcher.pinned_items = launcher.load_pinned()
+    launcher.show()
+    qt.processEvents()
+
+    def keystrokes():
+        per_key = []
+        for end in range(1, len(QUERY) + 1):
+            launcher.search_cache.clear()
+            start = time.perf_counter()
+            launcher.search_bar.setText(QUERY[:end])
+            launcher.update_content()
+            per_key.append(time.perf_counter() - start)
+            launcher.search_timer.stop()
+        return per_key
+
+    runs = [keystrokes() for _ in range(repeat)]
+    per_key = sorted(t for run in runs for t in run)
+    results["keystroke_median_s"] = per_key[len(per_key) // 2]
+    results["keystroke_max_s"] = per_key[-1]
+    launcher.search_bar.setText("")
+    launcher.search_timer.stop()
+
+    def render_all():
+        # Empty query: first rows synchronously, then every queued batch drained.
+        launcher.search_cache.clear()
+        launcher.update_content()
+        launcher.finish_rendering()
+    results["render_all_s"] = median_time(render_all, repeat)
+
+    for index, tab in ((1, "links"), (2, "recent"), (3, "pinned"), (0, "apps")):
+        def switch(index=index):
+            launcher.search_cache.clear()
+            launcher.show_content(index)
+        results[f"tab_switch_{tab}_s"] = median_time(switch, repeat)
+
+    for mode in ("Name", "Category", "LastUsed"):
+        results[f"sort_{mode.lower()}_s"] = median_time(lambda: launcher.set_sort_mode(mode), repeat)
+    launcher.set_sort_mode("Name")
+
+    def drag_icon_size():
+        # One slider step: the settings transaction plus the effects tick it schedules.
+        for size in range(24, 65, 4):
+            launcher.change_icon_size(size)
+            launcher.apply_pending_effects()
+    results["icon_size_drag_step_s"] = median_time(drag_icon_size, repeat) / len(range(24, 65, 4))
+    launcher.flush_settings()
+
+    def switch_themes():
+        for mode in ("light", "highcontrast", "dark"):
+            launcher.change_theme(mode)
+            launcher.apply_pending_effects()
+            qt.processEvents()
+    results["theme_switch_s"] = median_time(switch_themes, repeat) / 3
+    launcher.flush_settings()
+
+    def open_settings():
+        dialog = launcher_module.SettingsDialog(launcher)
+        dialog.show()
+        qt.processEvents()
+        dialog.close()
+        dialog.deleteLater()
+    results["settings_dialog_open_s"] = median_time(open_settings, repeat)
+    qt.processEvents()
+
+    def run_selected():
+        launcher.finish_rendering()
+        model = launcher.content_model
+        rows = min(200, model.rowCount())
+        selection = QItemSelection(model.index(0, 0), model.index(rows - 1, 0))
+        launcher.content_list.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+        launcher.run_selected()
+    results["run_selected_200_s"] = median_time(run_selected, repeat)
+
+    # Also a smoke test of the focus-existing path, which start_services normally sets up.
+    from proctable import ProcessTable
+    launcher.process_table = ProcessTable()
+    launcher.process_table.track(os.getpid(), [sys.executable])
+
+    def focus_existing():
+        # Offscreen there is no window to raise, so the launch falls through once the focus thread reports back.
+        del launched[:]
+        launcher.focus_running_instance(sys.executable, launcher.process_table.find([sys.executable]))
+        deadline = time.perf_counter() + 5
+        while not launched and time.perf_counter() < deadline:
+            qt.processEvents()
+        if not launched:
+            raise RuntimeError("focus-existing path never reported back")
+    results["focus_existing_s"] = median_time(focus_existing, repeat)
+
+    results["save_links_s"] = median_time(launcher.save_links, repeat)
+    results["save_recent_s"] = median_time(launcher.save_recent, repeat)
+    results["save_pinned_s"] = median_time(launcher.save_pinned, repeat)
+    results["save_settings_s"] = median_time(launcher.save_settings, repeat)
+    results["save_catalog_s"] = median_time(lambda: launcher_module.save_catalog(launcher.apps), repeat)
+
+    launcher.show_content(0)
+    launcher.finish_rendering()
+    delegate = launcher.content_list.itemDelegate()
+    model = launcher.content_model
+    rows = min(500, model.rowCount())
+    image = QImage(600, 64, QImage.Format_ARGB32_Premultiplied)
+
+    def paint():
+        painter = QPainter(image)
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 600, 64)
+        option.widget = launcher.content_list
+        for row in range(rows):
+            delegate.paint(painter, option, model.index(row, 0))
+        painter.end()
+    results["paint_per_row_s"] = median_time(paint, repeat) / max(rows, 1)
+
+    launcher.monitor.stop()
+    launcher.prewarm.stop()
+    launcher.favicons.stop()
+    launcher.hide()
+    launcher.deleteLater()
+    qt.processEvents()
+    return {key: round(value, 6) for key, value in results.items()}
+
+
+def compare(current, baseline, tolerance):
+    """Print current vs. baseline per scale and metric; returns the regressions."""
+    regressions = []
+    print(f"{'scale':>7} {'metric':<22}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for scale, metrics in current["scales"].items():
+        base = baseline.get("scales", {}).get(scale, {})
+        for metric, value in metrics.items():
+            if metric not in base:
+                continue
+            ratio = value / base[metric] if base[metric] else float("inf")
+            # Sub-millisecond noise is not a regression even when the ratio is large.
+            flag = ratio > 1 + tolerance and value - base[metric] > 0.001
+            if flag:
+                regressions.append((scale, metric, ratio))
+            print(f"{scale:>7} {metric:<22}{base[metric] * 1000:>10.2f}ms{value * 1000:>10.2f}ms{ratio:>7.2f}x{'  !' if flag else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1000,10000,100000", help="comma-separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--current", help="compare this saved results file instead of running")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging, e.g. 0.2 = 20%%")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    if args.current:
+        with open(args.current) as f:
+            results = json.load(f)
+    else:
+        from PyQt5.QtWidgets import QApplication
+        qt = QApplication.instance() or QApplication(sys.argv[:1])
+        base = tempfile.mkdtemp(prefix="ql_bench_gui_")
+        cwd = os.getcwd()
+        os.chdir(base)
+        # open.py sets up logging and the app icon cache relative to the working directory.
+        launcher_module = importlib.import_module("open")
+        results = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": os.environ["QT_QPA_PLATFORM"],
+            "repeat": args.repeat,
+            "scales": {},
+        }
+        try:
+            for size in (int(s) for s in args.scales.split(",")):
+                workdir = os.path.join(base, str(size))
+                os.makedirs(workdir)
+                results["scales"][str(size)] = bench_scale(qt, launcher_module, size, args.repeat, workdir)
+                if not args.json:
+                    print(f"{size:>7} apps:")
+                    for metric, value in results["scales"][str(size)].items():
+                        print(f"    {metric:<22}{value * 1000:10.3f}ms")
+        finally:
+            os.chdir(cwd)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Second-invocation latency vs. cold start of the launcher.
+
+Starts a resident launcher (offscreen Qt), records how long it takes until
+it accepts forwarded commands (the cold start), then times repeated
+`python open.py <command>` invocations that are forwarded to it and exit.
+With --standin a tiny socket server replaces the GUI so the forwarding path
+can be measured on machines without PyQt5 (POSIX only); cold start is then
+not measured.
+
+Usage: python benchmarks/bench_instance.py [--runs 10] [--command show] [--standin]
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from instance import send_command
+
+
+def run_standin(path, stop):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(8)
+    server.settimeout(0.2)
+    while not stop.is_set():
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            continue
+        with conn:
+            conn.recv(4096)
+            conn.sendall(b"ok\n")
+    server.close()
+
+
+def wait_until_listening(timeout=60.0):
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if send_command({"command": "show", "arg": ""}) == "ok":
+            return time.perf_counter() - start
+        time.sleep(0.01)
+    raise RuntimeError("Resident instance did not start listening")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--command", default="show", help="command to forward, e.g. 'search code'")
+    parser.add_argument("--standin", action="store_true", help="use a socket stand-in instead of the GUI")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    # The launcher writes its state, catalog and log to its working directory; keep those out of the checkout.
+    workdir = tempfile.mkdtemp(prefix="ql_bench_")
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env["QUANTUM_LAUNCHER_INSTANCE"] = os.path.join(workdir, "instance.sock")
+    os.environ["QUANTUM_LAUNCHER_INSTANCE"] = env["QUANTUM_LAUNCHER_INSTANCE"]
+
+    resident = None
+    stop = threading.Event()
+    cold = None
+    if args.standin:
+        threading.Thread(target=run_standin, args=(env["QUANTUM_LAUNCHER_INSTANCE"], stop), daemon=True).start()
+        wait_until_listening()
+    else:
+        start = time.perf_counter()
+        resident = subprocess.Popen([sys.executable, os.path.join(ROOT, "open.py")], cwd=workdir, env=env,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wait_until_listening()
+        cold = time.perf_counter() - start
+
+    forwarded = []
+    try:
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(ROOT, "open.py")] + args.command.split(), cwd=workdir, env=env, check=True)
+            forwarded.append(time.perf_counter() - start)
+    finally:
+        stop.set()
+        if resident:
+            resident.terminate()
+            resident.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    forwarded.sort()
+    result = {
+        "command": args.command,
+        "runs": args.runs,
+        "cold_start_s": round(cold, 4) if cold is not None else None,
+        "forwarded_median_s": round(forwarded[len(forwarded) // 2], 4),
+        "forwarded_min_s": round(forwarded[0], 4),
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        if cold is not None:
+            print(f"  cold start to listening : {cold * 1000:8.1f}ms")
+        print(f"  forwarded '{args.command}' median : {result['forwarded_median_s'] * 1000:8.1f}ms (min {result['forwarded_min_s'] * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Link checker benchmark against a local HTTP stand-in.
+
+Starts --hosts keep-alive HTTP/1.1 servers on 127.0.0.1 (one port each, so
+each looks like a separate origin to the checker) that serve healthy pages,
+redirects, 404s, HEAD-rejecting endpoints and slow responses. It then
+checks --links URLs spread over them and reports:
+- the wall time
+- the peak number of concurrent requests any single server saw, which must
+  stay at or below --per-host
+- how the results were classified
+- how long a second, fully cached pass takes
+
+Usage: python benchmarks/bench_linkcheck.py [--links 3000] [--hosts 20] [--per-host 4] [--delay 0.02] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkcheck import LinkHealthCache, check_links
+
+
+class StandIn:
+    """A minimal keep-alive HTTP/1.1 server that records its peak in-flight requests."""
+    def __init__(self, delay):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                method, path, _ = head.split(b"\r\n", 1)[0].decode().split(" ", 2)
+                self.active += 1
+                self.requests += 1
+                self.peak = max(self.peak, self.active)
+                try:
+                    status, headers, body = await self.respond(method, path)
+                finally:
+                    self.active -= 1
+                lines = [f"HTTP/1.1 {status} X"] + [f"{k}: {v}" for k, v in headers.items()] + [f"Content-Length: {len(body)}", "", ""]
+                writer.write("\r\n".join(lines).encode() + (body if method != "HEAD" else b""))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, path):
+        kind = path.split("/")[1]
+        if kind == "slow":
+            await asyncio.sleep(self.delay * 5)
+        else:
+            await asyncio.sleep(self.delay)
+        if kind == "redirect":
+            return 301, {"Location": "/ok/" + path.rsplit("/", 1)[1]}, b""
+        if kind == "missing":
+            return 404, {}, b"not found"
+        if kind == "nohead" and method == "HEAD":
+            return 405, {}, b""
+        return 200, {"Content-Type": "text/html"}, b"<html>ok</html>"
+
+
+def serve(hosts, delay, ready):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    servers = []
+    for _ in range(hosts):
+        stand_in = StandIn(delay)
+        server = loop.run_until_complete(asyncio.start_server(stand_in.handle, "127.0.0.1", 0))
+        servers.append((stand_in, server.sockets[0].getsockname()[1]))
+    ready.append(servers)
+    loop.run_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=3000)
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.02, help="server think time per request in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    ready = []
+    threading.Thread(target=serve, args=(args.hosts, args.delay, ready), daemon=True).start()
+    while not ready:
+        time.sleep(0.01)
+    servers = ready[0]
+
+    rng = random.Random(0)
+    kinds = ["ok"] * 14 + ["redirect", "redirect", "missing", "nohead", "slow"]
+    urls = [f"http://127.0.0.1:{servers[i % len(servers)][1]}/{rng.choice(kinds)}/{i}" for i in range(args.links)]
+    # A dead origin: nothing listens on port 9 on a typical machine, so connections are refused.
+    urls += [f"http://127.0.0.1:9/dead/{i}" for i in range(10)]
+
+    cache = LinkHealthCache(os.path.join(tempfile.mkdtemp(prefix="ql_bench_links_"), "link_health.json"))
+    start = time.perf_counter()
+    results = check_links(urls, cache, per_host=args.per_host, timeout=5.0)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    check_links(urls, cache, per_host=args.per_host)
+    cached = time.perf_counter() - start
+
+    report = {
+        "links": len(urls),
+        "seconds": round(elapsed, 3),
+        "links_per_second": round(len(urls) / elapsed),
+        "cached_seconds": round(cached, 4),
+        "peak_per_host": max(s.peak for s, _ in servers),
+        "connections": sum(s.connections for s, _ in servers),
+        "requests": sum(s.requests for s, _ in servers),
+        "statuses": dict(Counter(status for status, _ in results.values())),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:<18}{value}")
+    if report["peak_per_host"] > args.per_host:
+        print(f"per-host limit exceeded: {report['peak_per_host']} > {args.per_host}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Browser bookmark import from local Chrome/Edge and Firefox profiles.
+
+Sources are read as streams: Chromium's Bookmarks JSON through ijson when
+it is installed (json otherwise), Firefox's places.sqlite through a
+read-only connection, falling back to a private copy when the browser holds
+the database locked. Each bookmark's innermost named folder becomes its
+link category. Firefox tag entries are not bookmarks and are left out.
+
+Re-imports are incremental: for every source the normalized URLs and the
+(name, category) last imported from it are kept in bookmarks_state.json,
+and a source whose file has not changed since is skipped. Otherwise only
+bookmarks added, renamed/moved or deleted in the browser since the last run
+are reported back.
+"""
+import os
+import sys
+import glob
+import json
+import shutil
+import sqlite3
+import logging
+import tempfile
+from pathlib import Path
+
+from importer import normalize_url
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+BOOKMARKS_STATE_FILE = "bookmarks_state.json"
+SKIPPED_SCHEMES = ("javascript:", "place:", "chrome:", "edge:", "about:", "data:")
+FIREFOX_ROOTS = {"menu": "Bookmarks Menu", "toolbar": "Bookmarks Toolbar", "unfiled": "Other Bookmarks", "mobile": "Mobile Bookmarks"}
+FIREFOX_TAGS_GUID = "tags________"
+# Tagging a URL adds a type-1 row under a folder named after the tag in the tags root; those are not bookmarks.
+FIREFOX_QUERY = f"""
+    SELECT b.title, p.url, parent.title
+    FROM moz_bookmarks b
+    JOIN moz_places p ON p.id = b.fk
+    LEFT JOIN moz_bookmarks parent ON parent.id = b.parent
+    LEFT JOIN moz_bookmarks grandparent ON grandparent.id = parent.parent
+    WHERE b.type = 1 AND (grandparent.guid IS NULL OR grandparent.guid != '{FIREFOX_TAGS_GUID}')
+"""
+
+
+def browser_profiles():
+    """Return (label, path) for every Chromium Bookmarks file and Firefox places.sqlite found locally."""
+    home = Path.home()
+    if sys.platform == "win32":
+        local = Path(os.environ.get("LOCALAPPDATA", ""))
+        chromium = {"Chrome": local / "Google/Chrome/User Data", "Edge": local / "Microsoft/Edge/User Data",
+                    "Brave": local / "BraveSoftware/Brave-Browser/User Data"}
+        firefox = Path(os.environ.get("APPDATA", "")) / "Mozilla/Firefox/Profiles"
+    elif sys.platform == "darwin":
+        support = home / "Library/Application Support"
+        chromium = {"Chrome": support / "Google/Chrome", "Edge": support / "Microsoft Edge",
+                    "Brave": support / "BraveSoftware/Brave-Browser"}
+        firefox = support / "Firefox/Profiles"
+    else:
+        config = Path(os.environ.get("XDG_CONFIG_HOME") or home / ".config")
+        chromium = {"Chrome": config / "google-chrome", "Chromium": config / "chromium",
+                    "Edge": config / "microsoft-edge", "Brave": config / "BraveSoftware/Brave-Browser"}
+        firefox = home / ".mozilla/firefox"
+    profiles = []
+    for browser, root in chromium.items():
+        for path in sorted(glob.glob(str(root / "*" / "Bookmarks"))):
+            profiles.append((f"{browser} ({Path(path).parent.name})", path))
+    for path in sorted(glob.glob(str(firefox / "*" / "places.sqlite"))):
+        profiles.append((f"Firefox ({Path(path).parent.name})", path))
+    return profiles
+
+
+def _is_node(prefix):
+    # Bookmark nodes sit at roots.<root> and at any depth of <folder>.children.item.
+    return prefix.startswith("roots.") and (prefix.count(".") == 1 or prefix.endswith(".children.item"))
+
+
+def _iter_chromium_stream(f):
+    # Chromium writes a folder's "name" after its "children", and an unnamed
+    # folder takes its parent's category, so a folder's bookmarks (nested ones
+    # included, in document order) are held until the folder closes and handed
+    # to its parent. Each root is yielded when it closes, as _iter_chromium_tree would.
+    stack = []
+    for prefix, event, value in ijson.parse(f):
+        if event == "start_map" and _is_node(prefix):
+            stack.append((prefix, {"items": []}))
+        elif event == "end_map" and stack and stack[-1][0] == prefix:
+            _, node = stack.pop()
+            if node.get("type") == "url":
+                if stack:
+                    stack[-1][1]["items"].append([node.get("name", ""), node.get("url", ""), None])
+                continue
+            items = node["items"]
+            if node.get("name"):
+                for item in items:
+                    if item[2] is None:
+                        item[2] = node["name"]
+            if stack:
+                stack[-1][1]["items"].extend(items)
+            else:
+                for name, url, category in items:
+                    yield name, url, category or "Bookmarks"
+        elif event == "string" and stack:
+            parent, _, key = prefix.rpartition(".")
+            if parent == stack[-1][0] and key in ("name", "type", "url"):
+                stack[-1][1][key] = value
+
+
+def _iter_chromium_tree(node, category):
+    for child in node.get("children", []):
+        if child.get("type") == "url":
+            yield child.get("name", ""), child.get("url", ""), category
+        else:
+            yield from _iter_chromium_tree(child, child.get("name") or category)
+
+
+def iter_chromium(path):
+    """Yield (name, url, folder) for every bookmark in a Chromium Bookmarks file."""
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            yield from _iter_chromium_stream(f)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        roots = json.load(f).get("roots", {})
+    for root in roots.values():
+        if isinstance(root, dict):
+            yield from _iter_chromium_tree(root, root.get("name") or "Bookmarks")
+
+
+def iter_firefox(path):
+    """Yield (name, url, folder) for every bookmark in a Firefox places.sqlite."""
+    copy_dir = None
+    try:
+        try:
+            connection = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+            cursor = connection.execute(FIREFOX_QUERY)
+        except sqlite3.OperationalError as e:
+            # A running Firefox keeps an exclusive lock; read a snapshot of the database (and its WAL) instead.
+            logging.info("places.sqlite is locked (%s); reading a copy", e)
+            copy_dir = tempfile.mkdtemp(prefix="ql_places_")
+            for suffix in ("", "-wal"):
+                if os.path.exists(path + suffix):
+                    shutil.copy2(path + suffix, os.path.join(copy_dir, "places.sqlite" + suffix))
+            connection = sqlite3.connect(os.path.join(copy_dir, "places.sqlite"))
+            cursor = connection.execute(FIREFOX_QUERY)
+        try:
+            for title, url, folder in cursor:
+                yield title or "", url or "", FIREFOX_ROOTS.get(folder, folder) or "Bookmarks"
+        finally:
+            connection.close()
+    finally:
+        if copy_dir:
+            shutil.rmtree(copy_dir, ignore_errors=True)
+
+
+def iter_bookmarks(path):
+    return iter_firefox(path) if path.endswith(".sqlite") else iter_chromium(path)
+
+
+def source_stamp(path):
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    # Firefox commits to the WAL first, so its changes show up there before places.sqlite itself.
+    if os.path.exists(path + "-wal"):
+        wal = os.stat(path + "-wal")
+        stamp += [wal.st_mtime_ns, wal.st_size]
+    return stamp
+
+
+def load_state(path=BOOKMARKS_STATE_FILE):
+    try:
+        with open(path, "r") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state, path=BOOKMARKS_STATE_FILE):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+class BookmarkChanges:
+    """What changed in the browsers since the last import, keyed by normalized URL."""
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.removed = []
+        self.sources = 0
+        self.unchanged_sources = 0
+        self.failed = []
+        self.state = {}
+
+    def summary(self, added, updated, removed):
+        """Describe the outcome given how many changes the launcher actually applied."""
+        text = f"Bookmarks: {added} added, {updated} updated, {removed} removed" if added or updated or removed else "Bookmarks are up to date"
+        if self.failed:
+            text += f"; {len(self.failed)} profile{'s' if len(self.failed) != 1 else ''} unreadable"
+        return text + "."
+
+    def record(self, key, name, category):
+        """Keep the name and category the launcher gave key's link, so the next import compares against those."""
+        for source in self.state.values():
+            if key in source["links"]:
+                source["links"][key] = [name, category]
+                return
+
+
+def diff_bookmarks(sources, state, progress=None):
+    """Compare every (label, path) source against its entry in state.
+
+    Returns BookmarkChanges whose .state is the state to save once the
+    changes have been applied. added holds (key, url, name, category),
+    updated (key, old, new) and removed (key, old), with old and new
+    [name, category] pairs. progress(count) is called every 5000 bookmarks.
+    """
+    changes = BookmarkChanges()
+    seen = set()
+    read = 0
+    for label, path in sources:
+        changes.sources += 1
+        previous = state.get(path)
+        try:
+            stamp = source_stamp(path)
+            if previous and previous.get("stamp") == stamp:
+                changes.unchanged_sources += 1
+                changes.state[path] = previous
+                seen.update(previous["links"])
+                continue
+            links = {}
+            for name, url, category in iter_bookmarks(path):
+                read += 1
+                if progress and read % 5000 == 0:
+                    progress(read)
+                if not isinstance(url, str) or not url or url.startswith(SKIPPED_SCHEMES):
+                    continue
+                try:
+                    key = normalize_url(url)
+                except ValueError as e:
+                    # One bad URL costs that bookmark, not the whole profile.
+                    logging.debug("Skipping bookmark %r in %s: %s", url, path, e)
+                    continue
+                if not isinstance(name, str):
+                    name = ""
+                # The first occurrence wins, across folders and across profiles.
+                if key in links or key in seen:
+                    continue
+                links[key] = [name.strip() or url, category]
+                old = previous["links"].get(key) if previous else None
+                if old is None:
+                    changes.added.append((key, url, links[key][0], category))
+                elif old != links[key]:
+                    changes.updated.append((key, old, links[key]))
+            if previous:
+                changes.removed.extend((key, old) for key, old in previous["links"].items() if key not in links)
+            seen.update(links)
+            changes.state[path] = {"label": label, "stamp": stamp, "links": links}
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logging.warning("Cannot read bookmarks from %s: %s", path, e)
+            changes.failed.append((label, str(e)))
+            if previous:
+                changes.state[path] = previous
+                seen.update(previous["links"])
+    # A bookmark deleted from one profile but still present in another stays.
+    changes.removed = [(key, old) for key, old in changes.removed if key not in seen]
+    if progress:
+        progress(read)
+    return changes
@@ -0,0 +1,204 @@
+"""Persisted catalog and matching shared by the GUI and the headless CLI.
+
+Nothing here imports PyQt5: the GUI writes catalog.json after each Start Menu
+scan, and cli.py reads it together with links/recent/pinned JSON to answer
+queries without constructing any widgets.
+"""
+import os
+import sys
+import glob
+import json
+import time
+from pathlib import Path
+
+CATALOG_FILE = "catalog.json"
+LINKS_FILE = "links.json"
+RECENT_FILE = "recent.json"
+PINNED_FILE = "pinned.json"
+TABS = ("apps", "links", "recent", "pinned")
+SHORTCUT_PATTERNS = ("**/*.lnk", "**/*.desktop")
+FILTER_THRESHOLD = 90
+FUZZY_THRESHOLD = 80
+
+
+def application_dirs():
+    """Default roots scanned for app shortcuts: the Start Menu on Windows, XDG application dirs elsewhere."""
+    if sys.platform == "win32":
+        return [
+            Path(os.environ.get("APPDATA", "")) / "Microsoft/Windows/Start Menu/Programs",
+            Path("C:/ProgramData/Microsoft/Windows/Start Menu/Programs")
+        ]
+    data_home = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local/share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    return [data_home / "applications"] + [Path(d) / "applications" for d in data_dirs.split(":") if d]
+
+
+def read_desktop_name(path):
+    """Return (name, category) for a launchable .desktop file, or None if it should be hidden."""
+    name, category, app_type = None, None, "Application"
+    in_entry = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                if in_entry:
+                    break
+                in_entry = line == "[Desktop Entry]"
+            elif not in_entry:
+                continue
+            elif line.startswith("Name=") and name is None:
+                name = line[5:]
+            elif line.startswith("Categories="):
+                category = next((c for c in line[11:].split(";") if c), None)
+            elif line.startswith("Type="):
+                app_type = line[5:]
+            elif line in ("NoDisplay=true", "Hidden=true"):
+                return None
+    if app_type != "Application":
+        return None
+    return name or Path(path).stem, category
+
+
+def scan_applications(paths=None, progress=None):
+    """Scan paths for .lnk/.desktop shortcuts into {category: {name: path}}.
+
+    Categories follow the folder structure below each root; top-level
+    .desktop files use their first Categories= entry instead. progress, if
+    given, is called with a 0-100 percentage.
+    """
+    roots = [Path(p) for p in (paths if paths is not None else application_dirs())]
+    shortcuts = [(root, file) for root in roots if root.exists() for pattern in SHORTCUT_PATTERNS
+                 for file in glob.glob(str(root / pattern), recursive=True)]
+    apps = {}
+    for processed, (root, shortcut) in enumerate(shortcuts, 1):
+        app_path = Path(shortcut)
+        name, category = app_path.stem, None
+        if app_path.suffix == ".desktop":
+            try:
+                entry = read_desktop_name(shortcut)
+            except OSError:
+                entry = None
+            if entry is None:
+                continue
+            name, category = entry
+        if app_path.parent != root:
+            category = app_path.parent.relative_to(root).as_posix()
+        apps.setdefault(category or "General", {})[name] = shortcut
+        if progress and (processed % 200 == 0 or processed == len(shortcuts)):
+            progress(int(processed * 100 / len(shortcuts)))
+    if progress and not shortcuts:
+        progress(100)
+    return apps
+
+
+def load_catalog(path=CATALOG_FILE):
+    """Return the persisted {category: {name: path}} app catalog, or {} if there is none."""
+    try:
+        with open(path, "r") as f:
+            catalog = json.load(f)
+        apps = catalog.get("apps", {}) if isinstance(catalog, dict) else {}
+        return {category: dict(items) for category, items in apps.items() if isinstance(items, dict)}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_catalog(apps, path=CATALOG_FILE):
+    with open(path, "w") as f:
+        json.dump({"generated": time.time(), "apps": apps}, f)
+
+
+def load_items(path, required=("name", "path", "type"), limit=None):
+    try:
+        with open(path, "r") as f:
+            items = json.load(f)
+        items = items[:limit] if limit else items
+        return [item for item in items if isinstance(item, dict) and all(key in item for key in required)]
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return []
+
+
+def catalog_entries(apps, links, recent, pinned, tabs=TABS):
+    """Flatten the launcher's collections into {"name", "path", "category", "type", "tab"} entries."""
+    entries = []
+    if "apps" in tabs:
+        for category in sorted(apps):
+            for name, path in apps[category].items():
+                entries.append({"name": name, "path": path, "category": category, "type": "app", "tab": "apps"})
+    if "links" in tabs:
+        for link in links:
+            entries.append({"name": link["name"], "path": link["url"], "category": link.get("category", "General"), "type": "link", "tab": "links"})
+    for tab, items in (("pinned", pinned), ("recent", recent)):
+        if tab in tabs:
+            for item in items:
+                entries.append({"name": item["name"], "path": item["path"], "category": item.get("category", "General"), "type": item["type"], "tab": tab})
+    return entries
+
+
+def load_entries(tabs=TABS):
+    """Read every persisted collection and return catalog_entries() for them."""
+    return catalog_entries(
+        load_catalog() if "apps" in tabs else {},
+        load_items(LINKS_FILE, ("name", "url")) if "links" in tabs else [],
+        load_items(RECENT_FILE, limit=50) if "recent" in tabs else [],
+        load_items(PINNED_FILE) if "pinned" in tabs else [],
+        tabs
+    )
+
+
+def matches(query, name):
+    """The search-bar filter: fuzzy partial match of an already lower-cased query."""
+    from fuzzywuzzy import fuzz
+    return fuzz.partial_ratio(query, name.lower()) > FILTER_THRESHOLD
+
+
+def match_rank(query, name):
+    """Cheap rank of name for query: 3 exact, 2 prefix, 1 substring, 0 no literal match."""
+    name = name.lower()
+    if name == query:
+        return 3
+    if name.startswith(query):
+        return 2
+    if query in name:
+        return 1
+    return 0
+
+
+def search(query, entries):
+    """Return entries passing the search-bar filter, best matches first."""
+    query = query.strip().lower()
+    if not query:
+        return list(entries)
+    ranked = []
+    for entry in entries:
+        rank = match_rank(query, entry["name"])
+        if rank or matches(query, entry["name"]):
+            ranked.append((-rank, len(entry["name"]), entry["name"].lower(), entry))
+    ranked.sort(key=lambda x: x[:3])
+    return [entry for *_, entry in ranked]
+
+
+def best_match(query, entries, fuzzy=True):
+    """Return the single entry a launch query most likely means, or None.
+
+    Literal matches (exact, then prefix, then substring, shorter names first)
+    win without touching fuzzywuzzy, which keeps the common case fast; only
+    when nothing matches literally (and fuzzy is set) is the best fuzzy score
+    above FUZZY_THRESHOLD accepted.
+    """
+    query = query.strip().lower()
+    if not query:
+        return None
+    best, best_key = None, None
+    for entry in entries:
+        rank = match_rank(query, entry["name"])
+        if rank == 3:
+            return entry
+        if rank:
+            key = (rank, -len(entry["name"]))
+            if best_key is None or key > best_key:
+                best, best_key = entry, key
+    if best or not fuzzy:
+        return best
+    from fuzzywuzzy import fuzz
+    scored = max(((fuzz.WRatio(query, e["name"].lower()), e) for e in entries), key=lambda x: x[0], default=(0, None))
+    return scored[1] if scored[0] >= FUZZY_THRESHOLD else None
@@ -0,0 +1,139 @@
+"""Headless command-line entry point for Quantum Launcher.
+
+Answers queries from the persisted catalog (catalog.json, written by the GUI
+after each app scan) and the links/recent/pinned JSON files, without
+importing PyQt5. Launches are forwarded to a resident launcher when one is
+running, so it records them in Recent; otherwise they are spawned directly
+with the same supervisor logic the GUI uses.
+
+Usage:
+    python cli.py launch <query>
+    python cli.py search <query> [--tab apps] [--json]
+    python cli.py list [--tab links] [--json]
+    python cli.py profile <name>
+"""
+import sys
+import json
+import argparse
+import logging
+from catalog import TABS, best_match, load_entries, load_items, search
+from profiles import PROFILES_FILE, WaveRunner, validate_profile
+from supervisor import ProcessSupervisor, open_document
+from instance import send_command
+
+
+def launch_entry(supervisor, entry):
+    if entry["type"] == "app":
+        try:
+            supervisor.spawn(entry["name"], entry["path"])
+        except OSError:
+            open_document(entry["path"])
+    else:
+        open_document(entry["path"])
+
+
+def print_entries(entries, as_json):
+    if as_json:
+        json.dump([{k: e[k] for k in ("name", "path", "category", "type", "tab")} for e in entries], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    for entry in entries:
+        print(f"{entry['name']}\t{entry['type']}\t{entry['category']}\t{entry['path']}")
+
+
+def cmd_launch(args):
+    query = " ".join(args.query)
+    if not args.no_forward:
+        message = {"command": "launch", "arg": query}
+        if args.tab:
+            # The resident instance must resolve the query against the same tabs as the local fallback below.
+            message["tabs"] = args.tab
+        reply = send_command(message)
+        if reply == "ok":
+            return 0
+        if reply is not None:
+            print(reply, file=sys.stderr)
+            return 1
+    entry = best_match(query, load_entries(args.tab or TABS))
+    if not entry:
+        print(f"No item matches '{query}'", file=sys.stderr)
+        return 1
+    try:
+        launch_entry(ProcessSupervisor(), entry)
+    except Exception as e:
+        print(f"Failed to launch {entry['name']}: {str(e)}", file=sys.stderr)
+        return 1
+    if args.verbose:
+        print(f"Launched {entry['name']} ({entry['path']})")
+    return 0
+
+
+def cmd_search(args):
+    print_entries(search(" ".join(args.query), load_entries(args.tab or TABS)), args.json)
+    return 0
+
+
+def cmd_list(args):
+    print_entries(load_entries(args.tab or TABS), args.json)
+    return 0
+
+
+def cmd_profile(args):
+    name = " ".join(args.name)
+    if not args.no_forward:
+        reply = send_command({"command": "profile", "arg": name})
+        if reply == "ok":
+            return 0
+        if reply is not None:
+            print(reply, file=sys.stderr)
+            return 1
+    profiles = [p for p in load_items(PROFILES_FILE, ("name", "items")) if validate_profile(p)]
+    profile = next((p for p in profiles if p["name"] == name), None)
+    if not profile:
+        print(f"No profile named '{name}'", file=sys.stderr)
+        return 1
+    supervisor = ProcessSupervisor()
+    results = WaveRunner(lambda item: launch_entry(supervisor, item)).run(profile["items"])
+    failed = [(item, error) for item, error in results if error]
+    for item, error in failed:
+        print(f"Failed to launch {item['name']}: {error}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Quantum Launcher headless command line")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    launch = subparsers.add_parser("launch", help="launch the best match for a query")
+    launch.add_argument("query", nargs="+")
+    launch.add_argument("--tab", action="append", choices=TABS, help="restrict to a tab (repeatable)")
+    launch.add_argument("--no-forward", action="store_true", help="never hand the launch to a running launcher")
+    launch.set_defaults(func=cmd_launch)
+
+    search_cmd = subparsers.add_parser("search", help="list items matching a query")
+    search_cmd.add_argument("query", nargs="+")
+    search_cmd.add_argument("--tab", action="append", choices=TABS)
+    search_cmd.add_argument("--json", action="store_true")
+    search_cmd.set_defaults(func=cmd_search)
+
+    list_cmd = subparsers.add_parser("list", help="list catalog items")
+    list_cmd.add_argument("--tab", action="append", choices=TABS)
+    list_cmd.add_argument("--json", action="store_true")
+    list_cmd.set_defaults(func=cmd_list)
+
+    profile = subparsers.add_parser("profile", help="run a launch profile")
+    profile.add_argument("name", nargs="+")
+    profile.add_argument("--no-forward", action="store_true", help="never hand the profile to a running launcher")
+    profile.set_defaults(func=cmd_profile)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(levelname)s - %(message)s')
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
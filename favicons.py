@@ -0,0 +1,162 @@
+"""Favicons for links, resolved once per origin.
+
+FaviconService runs an asyncio loop on a daemon thread and fetches
+/favicon.ico for every origin it is asked about, through linkcheck's
+per-host connection pools and so through the same proxy. An origin that
+is already queued or in flight is never asked for twice. Icons are written into the launcher's icon cache
+directory under the same md5 naming as extracted app icons, so the cache
+size limit prunes both. Origins without a usable icon are remembered in
+favicon_misses.json there and retried after retry_after seconds.
+
+Nothing here imports PyQt5; the launcher passes a decode callback that
+converts what was fetched to PNG.
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from linkcheck import LinkChecker
+
+FAVICON_MISSES_FILE = "favicon_misses.json"
+# ICO, PNG, GIF, JPEG, BMP and WebP; a 200 with anything else is usually an HTML error page.
+IMAGE_SIGNATURES = (b"\x00\x00\x01\x00", b"\x89PNG", b"GIF8", b"\xff\xd8\xff", b"BM", b"RIFF")
+
+
+def origin_of(url):
+    """scheme://host[:port] of an http(s) URL, with the default port dropped; None for anything else."""
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return None
+    default = 80 if scheme == "http" else 443
+    return f"{scheme}://{parts.hostname}" + (f":{port}" if port and port != default else "")
+
+
+def favicon_path(cache_dir, origin):
+    return Path(cache_dir) / f"{hashlib.md5(origin.encode()).hexdigest()}.png"
+
+
+class FaviconService:
+    """Background favicon fetches; on_icon(origin, path) is called on the service thread, path "" on failure."""
+    def __init__(self, cache_dir, on_icon, decode=None, per_host=2, limit=16, timeout=6.0, retry_after=24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.on_icon = on_icon
+        self.decode = decode
+        self.per_host = per_host
+        self.limit = limit
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.misses_file = self.cache_dir / FAVICON_MISSES_FILE
+        self.misses = self.load_misses()
+        self.pending = set()
+        self.fetched = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        self.checker = None
+
+    def load_misses(self):
+        try:
+            with open(self.misses_file, "r") as f:
+                misses = json.load(f)
+            return misses if isinstance(misses, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_misses(self):
+        try:
+            with self.lock:
+                misses = dict(self.misses)
+            tmp = f"{self.misses_file}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(misses, f, separators=(",", ":"))
+            os.replace(tmp, self.misses_file)
+        except Exception as e:
+            logging.error(f"Failed to save favicon misses: {str(e)}")
+
+    def request(self, origin):
+        """Queue origin unless it is pending or failed recently; returns True if a fetch was queued."""
+        with self.lock:
+            if origin in self.pending:
+                return False
+            missed = self.misses.get(origin)
+            if missed and time.time() - missed < self.retry_after:
+                return False
+            self.pending.add(origin)
+        self.start()
+        self.loop.call_soon_threadsafe(self.spawn, origin)
+        return True
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            # Created here so request() can schedule onto it before the thread is running.
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.run, name="Favicons", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.loop is not None and self.thread is not None and self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(2)
+        # Lookups still in flight die with the loop; let a restarted service request those origins again.
+        with self.lock:
+            self.pending.clear()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.checker = LinkChecker(self.per_host, self.limit, self.timeout)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.checker.close()
+            self.loop.close()
+
+    def spawn(self, origin):
+        self.loop.create_task(self.resolve(origin))
+
+    async def resolve(self, origin):
+        path = None
+        try:
+            status, body = await self.checker.fetch(f"{origin}/favicon.ico")
+            if status == 200 and body and body.startswith(IMAGE_SIGNATURES):
+                data = self.decode(body) if self.decode else body
+                if data:
+                    target = favicon_path(self.cache_dir, origin)
+                    tmp = f"{target}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, target)
+                    path = target
+            else:
+                logging.debug("No favicon for %s: HTTP %s", origin, status)
+        except (asyncio.TimeoutError, OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            logging.debug("No favicon for %s: %s", origin, e)
+        except Exception as e:
+            # Anything unexpected still has to reach the bookkeeping below, or origin stays pending for good.
+            logging.warning("Favicon lookup for %s failed: %s", origin, e)
+        with self.lock:
+            self.pending.discard(origin)
+            if path is None:
+                self.misses[origin] = round(time.time())
+                self.failed += 1
+            else:
+                self.misses.pop(origin, None)
+                self.fetched += 1
+            drained = not self.pending
+        # Written once per burst of lookups rather than per origin.
+        if drained:
+            self.save_misses()
+        self.on_icon(origin, str(path) if path else "")
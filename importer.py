@@ -0,0 +1,157 @@
+"""Bulk import of dropped .url, .lnk and .desktop files.
+
+Nothing here touches widgets: import_paths() runs on a worker thread,
+walking dropped directories lazily and parsing each file once, and returns
+an ImportResult that the GUI commits with a single save per collection.
+Duplicates are detected by normalized URL for links and by resolved target
+for shortcuts, both against what the launcher already has and within the
+batch itself.
+"""
+import os
+import logging
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from catalog import read_desktop_name
+from supervisor import HAS_WIN32, SHORTCUT_ERRORS, read_desktop_entry, read_shortcut
+
+IMPORT_SUFFIXES = (".url", ".lnk", ".desktop")
+
+
+def normalize_url(url):
+    """Comparison key for a URL: scheme and host lower-cased, default port, fragment and trailing slash dropped."""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        # A non-numeric or out-of-range port ("http://intranet:port/") only raises when read.
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url.rstrip("/")
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    port = port if port not in (None, 80 if scheme == "http" else 443 if scheme == "https" else None) else None
+    netloc = f"{host}:{port}" if port else host
+    return urlunsplit((scheme, netloc, parts.path.rstrip("/"), parts.query, ""))
+
+
+def shortcut_target(path, strict=False):
+    """Comparison key for a shortcut: what it launches, or the file itself when that cannot be read.
+
+    With strict, a .lnk that pywin32 fails to read raises instead, so a
+    dropped file that is corrupt is reported rather than imported.
+    """
+    lower = path.lower()
+    try:
+        if lower.endswith(".lnk"):
+            target, arguments, _ = read_shortcut(path)
+            return os.path.normcase(f"{target} {arguments}".strip())
+        if lower.endswith(".desktop"):
+            return " ".join(read_desktop_entry(path)[0])
+    except SHORTCUT_ERRORS:
+        if strict and HAS_WIN32 and lower.endswith(".lnk"):
+            raise
+    return os.path.normcase(os.path.abspath(path))
+
+
+def unique_name(name, taken):
+    """Return name, or name with the lowest free " (n)" suffix if it is already in taken."""
+    if name not in taken:
+        return name
+    n = 2
+    while f"{name} ({n})" in taken:
+        n += 1
+    return f"{name} ({n})"
+
+
+def read_url_file(path):
+    """Return the URL= value of an Internet Shortcut file, or None."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("URL="):
+                return line[4:].strip() or None
+    return None
+
+
+def iter_import_files(paths):
+    """Yield importable files from paths, descending into directories as they are reached."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(IMPORT_SUFFIXES):
+                        yield os.path.join(root, name)
+        elif path.lower().endswith(IMPORT_SUFFIXES):
+            yield path
+
+
+class ImportResult:
+    def __init__(self):
+        self.links = []
+        self.apps = []
+        self.scanned = 0
+        self.duplicates = 0
+        self.failed = []
+
+    def summary(self):
+        parts = []
+        if self.links:
+            parts.append(f"{len(self.links)} link{'s' if len(self.links) != 1 else ''}")
+        if self.apps:
+            parts.append(f"{len(self.apps)} shortcut{'s' if len(self.apps) != 1 else ''}")
+        text = f"Imported {' and '.join(parts)}" if parts else "Nothing new to import"
+        if self.duplicates:
+            text += f", {self.duplicates} already present"
+        if self.failed:
+            text += f", {len(self.failed)} unreadable"
+        return text + "."
+
+
+def import_paths(paths, known_urls, known_app_paths, category="Dropped", progress=None, cancelled=None):
+    """Parse everything importable under paths into an ImportResult.
+
+    known_urls are existing link URLs and known_app_paths existing shortcut
+    paths; both are normalized here, off the GUI thread. progress(scanned)
+    is called every 50 files; cancelled() is polled between files.
+    """
+    result = ImportResult()
+    seen_urls = {normalize_url(url) for url in known_urls}
+    seen_targets = {shortcut_target(path) for path in known_app_paths}
+    for path in iter_import_files(paths):
+        if cancelled and cancelled():
+            break
+        result.scanned += 1
+        if progress and result.scanned % 50 == 0:
+            progress(result.scanned)
+        try:
+            if path.lower().endswith(".url"):
+                url = read_url_file(path)
+                if not url:
+                    raise ValueError("no URL= entry")
+                key = normalize_url(url)
+                if key in seen_urls:
+                    result.duplicates += 1
+                    continue
+                seen_urls.add(key)
+                result.links.append({"name": Path(path).stem, "url": url, "category": category, "is_favorite": False})
+            else:
+                name = Path(path).stem
+                if path.lower().endswith(".desktop"):
+                    entry = read_desktop_name(path)
+                    if entry is None:
+                        raise ValueError("not a launchable application entry")
+                    name = entry[0]
+                key = shortcut_target(path, strict=True)
+                if key in seen_targets:
+                    result.duplicates += 1
+                    continue
+                seen_targets.add(key)
+                result.apps.append({"name": name, "path": path, "category": category, "type": "app", "is_favorite": False})
+        except SHORTCUT_ERRORS as e:
+            logging.warning("Skipping %s: %s", path, e)
+            result.failed.append((path, str(e)))
+    if progress:
+        progress(result.scanned)
+    return result
@@ -0,0 +1,161 @@
+"""Single-instance support: forwards a command line to a running launcher.
+
+This module is imported before PyQt5 so that a second invocation can hand its
+command to the resident instance and exit without paying for Qt start-up. The
+resident side listens with QLocalServer on server_name(), which is a Unix domain
+socket path on POSIX and a named pipe on Windows; both speak one JSON object
+per line and answer with a single "ok" or "error: ..." line. On POSIX the
+socket lives in $XDG_RUNTIME_DIR or a 0700 directory of the user's own, and a
+socket some other user created is never connected to.
+"""
+import os
+import sys
+import stat
+import json
+import socket
+import getpass
+import tempfile
+import threading
+
+COMMANDS = ("show", "search", "launch", "profile")
+TIMEOUT = 0.5
+
+
+def is_private_dir(path):
+    """True if path is a real directory owned by the current user that nobody else can enter."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def owns_socket(path):
+    """True if path is a socket created by the current user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def socket_dir():
+    """$XDG_RUNTIME_DIR, or a 0700 directory of ours in the temp dir; raises PermissionError if that was taken."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and is_private_dir(runtime):
+        return runtime
+    path = os.path.join(tempfile.gettempdir(), f"quantum-launcher-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    if not is_private_dir(path):
+        # Someone else created it first, or it is open to others: any socket in it could be theirs.
+        raise PermissionError(f"{path} is not a private directory of this user")
+    return path
+
+
+def server_name():
+    override = os.environ.get("QUANTUM_LAUNCHER_INSTANCE")
+    if override:
+        return override
+    if sys.platform == "win32":
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = "user"
+        return f"quantum-launcher-{user}"
+    return os.path.join(socket_dir(), "quantum-launcher.sock")
+
+
+def parse_command(args):
+    """Return the {"command", "arg"} message for launcher arguments, or None if there is none."""
+    args = [a for a in args if not a.startswith("--")]
+    if not args:
+        return {"command": "show", "arg": ""}
+    command = args[0].lower()
+    if command not in COMMANDS:
+        return None
+    return {"command": command, "arg": " ".join(args[1:])}
+
+
+def exchange_pipe(payload, timeout):
+    # Pipe handles opened with open() cannot time out, so a resident that never answers
+    # would hang the caller; the exchange runs on a daemon thread that is abandoned instead.
+    reply = []
+
+    def run():
+        try:
+            with open(rf"\\.\pipe\{server_name()}", "r+b", buffering=0) as pipe:
+                pipe.write(payload)
+                reply.append(pipe.readline().decode("utf-8", errors="replace").strip())
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=run, name="InstancePipe", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return reply[0] if reply else None
+
+
+def send_command(message, timeout=TIMEOUT):
+    """Send message to the resident instance; returns its reply or None if none answered within timeout."""
+    payload = (json.dumps(message) + "\n").encode("utf-8")
+    if sys.platform == "win32":
+        return exchange_pipe(payload, timeout)
+    try:
+        name = server_name()
+        if not owns_socket(name):
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(name)
+            sock.sendall(payload)
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+            return reply.decode("utf-8", errors="replace").strip()
+    except (OSError, socket.timeout):
+        return None
+
+
+def instance_running(timeout=TIMEOUT):
+    """True if a live instance owns server_name(), even one too busy to answer a command in time."""
+    if sys.platform == "win32":
+        # A pipe name disappears with the process that created it, so it is never stale.
+        return True
+    try:
+        name = server_name()
+    except OSError:
+        return False
+    if not owns_socket(name):
+        # Missing, or not ours to talk to or to keep.
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(name)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # The socket file outlived a crashed instance.
+            return False
+        except OSError:
+            return True
+    return True
+
+
+def forward_invocation(args):
+    """Forward args to a running instance; returns True if the caller can exit."""
+    if "--new-instance" in args or "--profile-startup" in args:
+        return False
+    message = parse_command(args)
+    if message is None:
+        return False
+    reply = send_command(message)
+    if reply is None:
+        return False
+    if reply != "ok":
+        print(reply, file=sys.stderr)
+    return True
@@ -0,0 +1,341 @@
+"""Background link health checks over asyncio.
+
+Each (scheme, host, port) gets a HostPool of keep-alive HTTP/1.1
+connections with its own concurrency limit, so thousands of links are
+checked in parallel without ever opening more than per_host connections to
+one server; a global limit caps the total. Links are probed with HEAD and
+re-tried with GET when a server answers HEAD with a status that commonly
+means "HEAD not supported". Redirects are followed a few hops to find out
+whether they end somewhere healthy. Results are cached per normalized URL
+in link_health.json with a TTL. An HTTP proxy from the environment
+(HTTP_PROXY/HTTPS_PROXY, minus NO_PROXY hosts, as urllib.request sees it)
+is honoured: plain http is sent to it in absolute form and https goes
+through a CONNECT tunnel; links behind a proxy of any other kind (SOCKS,
+TLS to the proxy) are skipped.
+
+Plain stdlib, so the checker runs anywhere the launcher does; nothing here
+imports PyQt5.
+"""
+import os
+import ssl
+import json
+import time
+import base64
+import socket
+import asyncio
+import logging
+import urllib.request
+from urllib.parse import quote, unquote, urljoin, urlsplit
+
+from importer import normalize_url
+
+LINK_HEALTH_FILE = "link_health.json"
+HEALTHY, REDIRECTED, BROKEN, SKIPPED = "healthy", "redirected", "broken", "skipped"
+# Statuses some servers return for HEAD while GET works fine.
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 500, 501}
+MAX_REDIRECTS = 5
+# Bodies up to this size are read so the connection can be reused; larger ones cost a reconnect instead.
+MAX_DRAIN_BYTES = 64 * 1024
+USER_AGENT = "QuantumLauncher-LinkCheck/1.0"
+MAX_PROXY_HEAD_BYTES = 64 * 1024
+
+
+class LinkHealthCache:
+    """{normalized url: [status, detail, checked_at]} persisted as JSON."""
+    def __init__(self, path=LINK_HEALTH_FILE, ttl=6 * 3600):
+        self.path = path
+        self.ttl = ttl
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+            self.entries = entries if isinstance(entries, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    def peek(self, url):
+        """Last known (status, detail) for url however old, or None."""
+        entry = self.entries.get(normalize_url(url))
+        return (entry[0], entry[1]) if entry else None
+
+    def get(self, url):
+        """(status, detail) if url was checked within the TTL, else None."""
+        entry = self.entries.get(normalize_url(url))
+        if entry and time.time() - entry[2] < self.ttl:
+            return entry[0], entry[1]
+        return None
+
+    def put(self, url, status, detail):
+        self.entries[normalize_url(url)] = [status, detail, round(time.time())]
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+
+def request_target(parts):
+    """Path and query of a split URL as sent on the request line."""
+    return quote(parts.path or "/", safe="/%:@!$&'()*+,;=-._~") + (f"?{parts.query}" if parts.query else "")
+
+
+async def read_chunked(reader, limit):
+    """Read a chunked body; None once it grows past limit bytes."""
+    body = bytearray()
+    while True:
+        size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            while (await reader.readline()).strip():
+                pass
+            return bytes(body)
+        if len(body) + size > limit:
+            return None
+        body += await reader.readexactly(size)
+        await reader.readexactly(2)
+
+
+def proxy_auth_header(proxy):
+    """Proxy-Authorization header line for credentials in a split proxy URL, or ""."""
+    if not proxy.username:
+        return ""
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}".encode()
+    return f"Proxy-Authorization: Basic {base64.b64encode(credentials).decode()}\r\n"
+
+
+class HostPool:
+    """Keep-alive connections to one origin, at most limit of them in use at once.
+
+    proxy is the split URL of an HTTP proxy to go through, or None to connect directly.
+    """
+    def __init__(self, scheme, host, port, limit, timeout, proxy=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.proxy = proxy
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle = []
+        self.opened = 0
+        self.host_header = host if port in (80, 443) else f"{host}:{port}"
+        self.proxy_auth = proxy_auth_header(proxy) if proxy else ""
+        # Only requests the proxy reads itself carry its credentials, never those inside a tunnel.
+        self.proxy_header = self.proxy_auth if scheme == "http" else ""
+
+    async def open(self):
+        context = ssl.create_default_context() if self.scheme == "https" else None
+        self.opened += 1
+        if self.proxy is None:
+            return await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=context, server_hostname=self.host if context else None), self.timeout)
+        if context is None:
+            return await asyncio.wait_for(asyncio.open_connection(self.proxy.hostname, self.proxy.port or 80), self.timeout)
+        return await asyncio.wait_for(self.tunnel(context), self.timeout)
+
+    async def tunnel(self, context):
+        """Open a CONNECT tunnel through the proxy and start TLS to the origin inside it."""
+        loop = asyncio.get_running_loop()
+        family, kind, proto, _, address = (await loop.getaddrinfo(self.proxy.hostname, self.proxy.port or 80, type=socket.SOCK_STREAM))[0]
+        sock = socket.socket(family, kind, proto)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, address)
+            await loop.sock_sendall(sock, (f"CONNECT {self.host}:{self.port} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                                           f"{self.proxy_auth}User-Agent: {USER_AGENT}\r\n\r\n").encode("latin-1"))
+            # The proxy sends nothing past its reply until the TLS handshake starts, so reading whole chunks is safe.
+            head = b""
+            while b"\r\n\r\n" not in head:
+                chunk = await loop.sock_recv(sock, 4096)
+                if not chunk or len(head) > MAX_PROXY_HEAD_BYTES:
+                    raise ConnectionError("proxy closed the connection during CONNECT")
+                head += chunk
+            status = int(head.split(b" ", 2)[1])
+            if status != 200:
+                raise ConnectionError(f"proxy answered CONNECT with HTTP {status}")
+        except BaseException:
+            sock.close()
+            raise
+        return await asyncio.open_connection(sock=sock, ssl=context, server_hostname=self.host)
+
+    async def request(self, method, target, limit):
+        """Send one request; returns (status, headers, body). A stale reused connection is retried once on a fresh one.
+
+        body is None when it was too large to buffer.
+        """
+        if self.proxy is not None and self.scheme == "http":
+            target = f"http://{self.host_header}{target}"
+        async with self.semaphore, limit:
+            while True:
+                reused = bool(self.idle)
+                reader, writer = self.idle.pop() if reused else await self.open()
+                try:
+                    status, headers, body, reusable = await asyncio.wait_for(self.exchange(reader, writer, method, target), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+                    if reused:
+                        continue
+                    raise e
+                except BaseException:
+                    writer.close()
+                    raise
+                if reusable:
+                    self.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, headers, body
+
+    async def exchange(self, reader, writer, method, target):
+        writer.write((f"{method} {target} HTTP/1.1\r\nHost: {self.host_header}\r\n{self.proxy_header}User-Agent: {USER_AGENT}\r\n"
+                      f"Accept: */*\r\nConnection: keep-alive\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ", 2)[1])
+        headers = {}
+        for line in head[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        reusable = headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or status < 200:
+            return status, headers, b"", reusable
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            body = await read_chunked(reader, MAX_DRAIN_BYTES)
+            return status, headers, body, reusable and body is not None
+        length = headers.get("content-length", "")
+        if length.isdigit() and int(length) <= MAX_DRAIN_BYTES:
+            return status, headers, await reader.readexactly(int(length)), reusable
+        return status, headers, None, False
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+class LinkChecker:
+    def __init__(self, per_host=4, limit=64, timeout=8.0):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.limit = asyncio.Semaphore(limit)
+        self.pools = {}
+        self.proxies = urllib.request.getproxies()
+
+    def proxy(self, parts):
+        """Split URL of the proxy that serves parts, or None to connect directly."""
+        proxy = self.proxies.get(parts.scheme.lower())
+        if not proxy or urllib.request.proxy_bypass(parts.hostname):
+            return None
+        return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+    def pool(self, parts):
+        """HostPool for the origin of parts; None if it sits behind a proxy other than plain HTTP."""
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        if key not in self.pools:
+            proxy = self.proxy(parts)
+            if proxy is not None and (proxy.scheme.lower() != "http" or not proxy.hostname):
+                self.pools[key] = None
+            else:
+                self.pools[key] = HostPool(scheme, parts.hostname, port, self.per_host, self.timeout, proxy)
+        return self.pools[key]
+
+    async def check(self, url):
+        """Return (status, detail) for an http(s) URL."""
+        current = url
+        for hop in range(MAX_REDIRECTS + 1):
+            try:
+                parts = urlsplit(current)
+                if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+                    return BROKEN, f"unsupported URL {current}"
+                pool = self.pool(parts)
+                if pool is None:
+                    return SKIPPED, "behind a proxy that is not plain HTTP"
+                status, headers, _ = await pool.request("HEAD", request_target(parts), self.limit)
+                if status in HEAD_FALLBACK_STATUSES:
+                    status, headers, _ = await pool.request("GET", request_target(parts), self.limit)
+            except asyncio.TimeoutError:
+                return BROKEN, f"timed out after {self.timeout:.0f}s"
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+                return BROKEN, f"{type(e).__name__}: {e}"
+            if 300 <= status < 400 and headers.get("location"):
+                current = urljoin(current, headers["location"])
+                continue
+            if status < 400:
+                return (REDIRECTED, f"{status} via {hop} redirect{'s' if hop != 1 else ''} to {current}") if hop else (HEALTHY, str(status))
+            return BROKEN, f"HTTP {status}" + (f" after redirect to {current}" if hop else "")
+        return BROKEN, f"more than {MAX_REDIRECTS} redirects"
+
+    async def fetch(self, url):
+        """GET url, following redirects; returns (status, body) with body None when too large to buffer."""
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(current)
+            if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+                raise ValueError(f"unsupported URL {current}")
+            pool = self.pool(parts)
+            if pool is None:
+                raise ValueError(f"{current} is behind a proxy that is not plain HTTP")
+            status, headers, body = await pool.request("GET", request_target(parts), self.limit)
+            if 300 <= status < 400 and headers.get("location"):
+                current = urljoin(current, headers["location"])
+                continue
+            return status, body
+        raise ValueError(f"more than {MAX_REDIRECTS} redirects")
+
+    def close(self):
+        for pool in self.pools.values():
+            if pool is not None:
+                pool.close()
+
+
+def check_local(path):
+    """Links may point at files and folders, which only need to exist; other schemes (mailto:, ssh:) are not checked."""
+    scheme = urlsplit(path).scheme.lower()
+    if scheme == "file":
+        path = urlsplit(path).path
+    elif len(scheme) > 1:
+        return SKIPPED, f"{scheme}: links are not checked"
+    return (HEALTHY, "exists") if os.path.exists(path) else (BROKEN, "missing file")
+
+
+def check_links(urls, cache=None, on_result=None, per_host=4, limit=64, timeout=8.0):
+    """Check urls and return {url: (status, detail)}.
+
+    Fresh cache entries are used as-is and new results are stored in cache.
+    URLs that normalize to the same key are fetched once. on_result(url,
+    status, detail) is called on the calling thread as each result lands.
+    """
+    results = {}
+    groups = {}
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url) if cache else None
+        if cached is None and not url.lower().startswith(("http://", "https://")):
+            cached = check_local(url)
+        if cached is not None:
+            results[url] = cached
+            if on_result:
+                on_result(url, *cached)
+        else:
+            groups.setdefault(normalize_url(url), []).append(url)
+
+    async def run():
+        checker = LinkChecker(per_host, limit, timeout)
+
+        async def one(members):
+            status, detail = await checker.check(members[0])
+            for url in members:
+                results[url] = (status, detail)
+                if cache:
+                    cache.put(url, status, detail)
+                if on_result:
+                    on_result(url, status, detail)
+
+        try:
+            await asyncio.gather(*(one(members) for members in groups.values()))
+        finally:
+            checker.close()
+            logging.info("Link check: %d origins, %d connections opened", len(checker.pools), sum(p.opened for p in checker.pools.values() if p))
+
+    if groups:
+        asyncio.run(run())
+    return results
@@ -0,0 +1,67 @@
+"""Queue-backed logging for the GUI.
+
+Records are handed to a SimpleQueue as-is, so a logging call on the UI thread
+costs a level check and an enqueue; message formatting and file I/O happen on
+the QueueListener's thread. The log file rotates by size, and the file format
+can be switched to one JSON object per line for log shipping.
+"""
+import json
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE = "quantum_launcher.log"
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One compact JSON object per record."""
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "thread": record.threadName,
+            "module": record.module,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"))
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueue the record untouched; the listener thread does all formatting."""
+    def prepare(self, record):
+        return record
+
+
+class LogPipeline:
+    def __init__(self, path=LOG_FILE, level="INFO", json_format=False, max_bytes=5 * 1024 * 1024, backups=3):
+        self.file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        self.stream_handler = logging.StreamHandler()
+        self.stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self.set_json(json_format)
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, self.file_handler, self.stream_handler)
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(DeferredQueueHandler(self.queue))
+        self.set_level(level)
+        self.listener.start()
+        self.running = True
+        atexit.register(self.stop)
+
+    def set_level(self, level):
+        logging.getLogger().setLevel(level if level in LOG_LEVELS else "INFO")
+
+    def set_json(self, enabled):
+        self.file_handler.setFormatter(JsonLineFormatter() if enabled else logging.Formatter(TEXT_FORMAT))
+
+    def stop(self):
+        """Flush queued records; safe to call more than once."""
+        if self.running:
+            self.running = False
+            self.listener.stop()
@@ -0,0 +1,182 @@
+"""Lightweight latency metrics with Prometheus text export.
+
+Hot paths call registry.observe(name, seconds, **labels) or wrap work in
+registry.time(name); both return immediately when the registry is disabled,
+so instrumentation can stay in place permanently. Observations are not
+locked: a rare lost increment between threads is an acceptable price for
+keeping them at a few microseconds. Only adding a new series takes the lock,
+so readers can snapshot the series under it.
+"""
+import os
+import time
+import bisect
+import threading
+import logging
+
+# Seconds; spans sub-millisecond cache hits up to multi-second catalog scans.
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_FILE = "metrics.prom"
+
+HELP = {
+    "search_seconds": "Search filtering time per query",
+    "top_hit_seconds": "Top-hit resolution time per keystroke",
+    "update_content_seconds": "Time to rebuild the list model up to the first visible rows",
+    "render_chunk_seconds": "Time to append one idle-time batch of result rows",
+    "icon_resolve_seconds": "Icon resolution time by source",
+    "persist_write_seconds": "JSON persistence write time by file",
+    "catalog_scan_seconds": "Start Menu / application catalog scan time",
+    "link_check_seconds": "Time to check the health of every saved link",
+    "launch_spawn_seconds": "Time to resolve and spawn a launched app",
+    "keystroke_to_spawn_seconds": "Time from Enter in the search bar to the spawn returning",
+    "summon_seconds": "Time from hotkey press to the window being painted",
+    "stall_seconds": "Event-loop stalls longer than the watchdog threshold",
+}
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class _Timer:
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.export_thread = None
+        self.export_stop = threading.Event()
+
+    def observe(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items()))) if labels else (name, ())
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def time(self, name, **labels):
+        """Context manager timing its block into name; free when disabled."""
+        return _Timer(self, name, labels) if self.enabled else NULL_TIMER
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+
+    def snapshot(self):
+        """Sorted (key, histogram) pairs, safe to iterate while other threads observe."""
+        with self.lock:
+            return sorted(self.histograms.items())
+
+    def summary(self):
+        """Return (name, labels, count, mean, p50, p95) rows for display."""
+        rows = []
+        for (name, labels), h in self.snapshot():
+            rows.append((name, dict(labels), h.count, h.sum / h.count if h.count else 0.0, h.quantile(0.5), h.quantile(0.95)))
+        return rows
+
+    def render_prometheus(self):
+        lines = []
+        by_name = {}
+        for (name, labels), histogram in self.snapshot():
+            by_name.setdefault(name, []).append((labels, histogram))
+        for name, series in by_name.items():
+            metric = f"quantum_launcher_{name}"
+            lines.append(f"# HELP {metric} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, histogram in series:
+                base = ",".join(f'{k}="{v}"' for k, v in labels)
+                cumulative = 0
+                # Copied so _count matches the +Inf bucket even if an observation lands meanwhile.
+                counts = list(histogram.counts)
+                for bound, count in zip(histogram.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{metric}_bucket{{{base + "," if base else ""}le="{le}"}} {cumulative}')
+                suffix = f"{{{base}}}" if base else ""
+                lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+                lines.append(f"{metric}_count{suffix} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=METRICS_FILE):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+    def start_export(self, path=METRICS_FILE, interval=30.0):
+        """Periodically dump to path from a background thread while enabled."""
+        self.stop_export()
+        self.export_stop = threading.Event()
+        stop = self.export_stop
+
+        def run():
+            while not stop.wait(interval):
+                if self.enabled:
+                    try:
+                        self.dump(path)
+                    except Exception as e:
+                        logging.error(f"Failed to export metrics: {str(e)}")
+
+        self.export_thread = threading.Thread(target=run, name="MetricsExport", daemon=True)
+        self.export_thread.start()
+
+    def stop_export(self):
+        self.export_stop.set()
+
+
+registry = MetricsRegistry()
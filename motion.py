@@ -0,0 +1,45 @@
+"""Frame-time driven animation budget.
+
+The content view reports how long each paint took. When recent paints run
+over the display's frame budget, animations are shortened in proportion, and
+past skip_ratio times the budget they are skipped outright, since an
+animation that drops most of its frames only delays the final state.
+"""
+from collections import deque
+
+# Below this an animation is indistinguishable from a jump, so it is skipped.
+MIN_DURATION_MS = 40
+
+
+class FrameGovernor:
+    def __init__(self, budget=1 / 60, window=30, skip_ratio=2.0):
+        self.budget = budget
+        self.skip_ratio = skip_ratio
+        self.frames = deque(maxlen=window)
+
+    def record(self, seconds):
+        self.frames.append(seconds)
+
+    def frame_time(self):
+        """90th percentile of the recent paints, 0.0 before any were recorded."""
+        if not self.frames:
+            return 0.0
+        ordered = sorted(self.frames)
+        return ordered[int(len(ordered) * 0.9) if len(ordered) > 1 else 0]
+
+    def load(self):
+        return self.frame_time() / self.budget if self.budget else 0.0
+
+    def duration(self, base_ms):
+        """Return the duration to animate for instead of base_ms; 0 means skip the animation."""
+        load = self.load()
+        if load >= self.skip_ratio:
+            return 0
+        if load > 1.0:
+            base_ms = int(base_ms / load)
+        return base_ms if base_ms >= MIN_DURATION_MS else 0
+
+    def describe(self):
+        load = self.load()
+        state = "skipped" if load >= self.skip_ratio else "shortened" if load > 1.0 else "full"
+        return f"paint p90 {self.frame_time() * 1000:.1f}ms over {len(self.frames)} frames (budget {self.budget * 1000:.1f}ms), animations {state}"
@@ -0,0 +1,61 @@
+"""Coalescing notification bus.
+
+Messages posted within a short window are merged into one summary, and
+summaries are shown at most once per min_interval, so a bulk operation
+costs the popup a single update instead of one per item. Every individual
+message is kept in a bounded history for the details view.
+"""
+import time
+from collections import deque
+from datetime import datetime
+
+# Summary verbs for categories that report per-item outcomes.
+VERBS = {"launch": "Launched", "import": "Imported"}
+
+
+class NotificationBus:
+    def __init__(self, window=0.15, min_interval=0.5, history=200, clock=time.monotonic):
+        self.window = window
+        self.min_interval = min_interval
+        self.clock = clock
+        self.pending = []
+        self.history = deque(maxlen=history)
+        self.last_shown = None
+
+    def post(self, message, duration=3000, category=None, ok=True):
+        self.pending.append((message, duration, category, ok))
+        self.history.append((datetime.now().strftime("%H:%M:%S"), "info" if ok else "error", message))
+
+    def delay(self):
+        """Seconds to wait before flushing: the coalescing window, stretched to honour the rate limit."""
+        if self.last_shown is None:
+            return self.window
+        return max(self.window, self.last_shown + self.min_interval - self.clock())
+
+    def flush(self):
+        """Return (text, duration) summarising everything pending, or None when nothing is."""
+        pending, self.pending = self.pending, []
+        if not pending:
+            return None
+        self.last_shown = self.clock()
+        duration = max(d for _, d, _, _ in pending)
+        if len(pending) == 1:
+            return pending[0][0], duration
+        parts = []
+        counts = {}
+        for _, _, category, ok in pending:
+            if category in VERBS:
+                done, failed = counts.get(category, (0, 0))
+                counts[category] = (done + 1, failed) if ok else (done, failed + 1)
+        for category, (done, failed) in counts.items():
+            if done:
+                parts.append(f"{VERBS[category]} {done} item{'s' if done != 1 else ''}" + (f", {failed} failed" if failed else ""))
+            else:
+                parts.append(f"{failed} item{'s' if failed != 1 else ''} failed to {category}")
+        others = [message for message, _, category, _ in pending if category not in VERBS]
+        if others:
+            parts.append(others[-1] + (f" (+{len(others) - 1} more)" if len(others) > 1 else ""))
+        return "; ".join(parts) + " — click for details", duration
+
+    def details(self):
+        return [f"{stamp} {'!' if level == 'error' else ' '} {message}" for stamp, level, message in self.history]
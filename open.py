@@ -1,1649 +1,3139 @@
-import sys
-import os
-import json
-import glob
-import webbrowser
-from datetime import datetime
-from pathlib import Path
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QFrame, QListView, QAbstractItemView, QLineEdit, QLabel, QComboBox,
-    QSpinBox, QSlider, QCheckBox, QDialog, QMenu, QAction, QColorDialog,
-    QTabWidget, QCompleter, QSystemTrayIcon, QToolButton, QStyledItemDelegate,
-    QProgressBar
-)
-from PyQt5.QtCore import (
-    Qt, QSize, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer,
-    QStringListModel, QPoint, QRectF, QSortFilterProxyModel
-)
-from PyQt5.QtGui import (
-    QIcon, QPixmap, QFont, QFontDatabase, QPainter, QBrush, QColor,
-    QStandardItem, QStandardItemModel, QPen, QLinearGradient
-)
-try:
-    from win32com.shell import shell, shellcon
-    import pythoncom
-    import win32gui
-    import win32con
-    HAS_WIN32 = True
-except ImportError:
-    HAS_WIN32 = False
-from PIL import Image
-import subprocess
-import logging
-import keyboard
-from fuzzywuzzy import fuzz, process
-import hashlib
-
-# Setup logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', handlers=[
-    logging.FileHandler('quantum_launcher.log'),
-    logging.StreamHandler()
-])
-
-class AppItem(QStandardItem):
-    """Custom item for apps/links/recent/pinned with icon and metadata."""
-    def __init__(self, name, path, category, item_type, icon=None, font=None, is_favorite=False):
-        super().__init__(name)
-        self.setData({"name": name, "path": path, "category": category, "type": item_type, "is_favorite": is_favorite}, Qt.UserRole)
-        self.setIcon(icon or QIcon())
-        self.setFont(font or QFont("Inter", 12))
-        self.setEditable(False)
-
-class CustomItemDelegate(QStyledItemDelegate):
-    """Custom delegate for rendering list/grid/compact items with modern effects."""
-    def __init__(self, view_mode="list", icon_size=32, border_radius=8, parent=None):
-        super().__init__(parent)
-        self.view_mode = view_mode
-        self.icon_size = icon_size
-        self.border_radius = border_radius
-
-    def paint(self, painter, option, index):
-        painter.save()
-        painter.setRenderHint(QPainter.Antialiasing)
-        rect = option.rect
-        data = index.data(Qt.UserRole)
-        if not data:
-            painter.restore()
-            return super().paint(painter, option, index)
-
-        # Card-like background with hover/selection effects
-        if option.state & option.widget.style().State_Selected:
-            painter.setBrush(QBrush(QColor(30, 144, 255)))
-            painter.setPen(QPen(QColor(100, 149, 237), 1))
-        elif option.state & option.widget.style().State_MouseOver:
-            painter.setBrush(QBrush(QColor(50, 50, 50)))
-            painter.setPen(QPen(QColor(100, 100, 100), 1))
-        else:
-            painter.setBrush(QBrush(QColor(30, 30, 30)))
-            painter.setPen(Qt.NoPen)
-
-        if self.view_mode == "grid":
-            painter.drawRoundedRect(rect.adjusted(6, 6, -6, -6), self.border_radius, self.border_radius)
-            icon = index.data(Qt.DecorationRole)
-            if icon:
-                painter.drawPixmap(rect.left() + (rect.width() - self.icon_size) // 2, rect.top() + 10, icon.pixmap(QSize(self.icon_size, self.icon_size)))
-            painter.setPen(QColor(220, 220, 220))
-            painter.setFont(QFont("Inter", 11, QFont.Bold))
-            painter.drawText(rect.adjusted(8, self.icon_size + 20, -8, -8), Qt.AlignTop | Qt.AlignHCenter | Qt.TextWordWrap, data["name"])
-            if data["is_favorite"]:
-                painter.setPen(QColor(255, 215, 0))
-                painter.drawText(rect.adjusted(8, 10, -8, -8), Qt.AlignTop | Qt.AlignLeft, "★")
-            if data["type"] != "app":
-                badge_rect = QRect(rect.right() - 34, rect.top() + 10, 24, 16)
-                painter.setBrush(QBrush(QColor(30, 144, 255)))
-                painter.drawRoundedRect(badge_rect, 6, 6)
-                painter.setPen(QColor(255, 255, 255))
-                painter.setFont(QFont("Inter", 8))
-                painter.drawText(badge_rect, Qt.AlignCenter, data["type"].upper())
-        elif self.view_mode == "list":
-            painter.drawRoundedRect(rect.adjusted(4, 4, -4, -4), self.border_radius, self.border_radius)
-            icon = index.data(Qt.DecorationRole)
-            if icon:
-                painter.drawPixmap(rect.left() + 10, rect.top() + (rect.height() - self.icon_size) // 2, icon.pixmap(QSize(self.icon_size, self.icon_size)))
-            painter.setPen(QColor(220, 220, 220))
-            painter.setFont(QFont("Inter", 12))
-            painter.drawText(rect.adjusted(self.icon_size + 15, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, data["name"])
-            if data["is_favorite"]:
-                painter.setPen(QColor(255, 215, 0))
-                painter.drawText(rect.adjusted(10, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, "★")
-            if data["type"] != "app":
-                painter.setFont(QFont("Inter", 9))
-                painter.drawText(rect.adjusted(self.icon_size + 15, 0, -8, 0), Qt.AlignVCenter | Qt.AlignRight, data["type"].upper())
-        else:  # compact
-            painter.drawRoundedRect(rect.adjusted(4, 4, -4, -4), self.border_radius, self.border_radius)
-            icon = index.data(Qt.DecorationRole)
-            if icon:
-                painter.drawPixmap(rect.left() + 8, rect.top() + (rect.height() - self.icon_size) // 2, icon.pixmap(QSize(self.icon_size, self.icon_size)))
-            painter.setPen(QColor(220, 220, 220))
-            painter.setFont(QFont("Inter", 11))
-            painter.drawText(rect.adjusted(self.icon_size + 10, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, data["name"])
-            if data["is_favorite"]:
-                painter.setPen(QColor(255, 215, 0))
-                painter.drawText(rect.adjusted(8, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, "★")
-
-        painter.restore()
-
-    def sizeHint(self, option, index):
-        if self.view_mode == "grid":
-            return QSize(160, 160)
-        elif self.view_mode == "list":
-            return QSize(100, 56)
-        else:  # compact
-            return QSize(100, 40)
-
-class AppLoaderThread(QThread):
-    appsLoaded = pyqtSignal(dict)
-    statusUpdate = pyqtSignal(str)
-    progressUpdate = pyqtSignal(int)
-    errorSignal = pyqtSignal(str)
-
-    def run(self):
-        try:
-            apps = {}
-            start_menu_paths = [
-                Path(os.environ.get("APPDATA", "")) / "Microsoft/Windows/Start Menu/Programs",
-                Path("C:/ProgramData/Microsoft/Windows/Start Menu/Programs")
-            ]
-            total = sum(len(glob.glob(str(path / "**/*.lnk"), recursive=True)) for path in start_menu_paths if path.exists())
-            processed = 0
-            for path in start_menu_paths:
-                if path.exists():
-                    for shortcut in glob.glob(str(path / "**/*.lnk"), recursive=True):
-                        app_path = Path(shortcut)
-                        app_name = app_path.stem
-                        category = app_path.parent.relative_to(path).as_posix() if app_path.parent != path else "General"
-                        apps.setdefault(category, {})[app_name] = shortcut
-                        processed += 1
-                        self.progressUpdate.emit(int((processed / total) * 100) if total else 100)
-            self.appsLoaded.emit(apps)
-            self.statusUpdate.emit("Ready")
-        except Exception as e:
-            self.errorSignal.emit(f"Failed to load apps: {str(e)}")
-
-class NotificationWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.setStyleSheet("background: #2a2a2a; color: #ffffff; border: 1px solid #4682b4; border-radius: 8px; padding: 10px; font: 12px Inter;")
-        self.layout = QVBoxLayout(self)
-        self.label = QLabel("")
-        self.label.setStyleSheet("color: #ffffff; font: 12px Inter;")
-        self.layout.addWidget(self.label)
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.hide)
-
-    def show_message(self, message, duration=3000):
-        self.label.setText(message)
-        self.adjustSize()
-        screen = QApplication.primaryScreen().geometry()
-        pos = screen.bottomRight() - QPoint(self.width() + 20, self.height() + 20)
-        self.move(pos)
-        anim = QPropertyAnimation(self, b"opacity")
-        anim.setDuration(200)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QEasingCurve.InOutQuad)
-        anim.start()
-        self.show()
-        self.timer.start(duration)
-
-class SettingsDialog(QDialog):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.parent = parent
-        self.setWindowTitle("Settings")
-        self.setFixedSize(400, 550)
-        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
-        self.setStyleSheet("""
-            QDialog { background: #1e1e1e; border: 1px solid #4682b4; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }
-            QLabel { color: #dcdcdc; font: bold 13px Inter; }
-            QComboBox, QSpinBox, QSlider, QLineEdit { background: #2a2a2a; color: #dcdcdc; border: 1px solid #4682b4; border-radius: 8px; padding: 6px; font: 12px Inter; }
-            QPushButton { background: #4682b4; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 12px Inter; }
-            QPushButton:hover { background: #5a9bd4; }
-            QCheckBox { color: #dcdcdc; font: 12px Inter; }
-            QTabWidget::pane { border: 1px solid #4682b4; background: #252525; }
-            QTabWidget::tab-bar { alignment: center; }
-            QTabBar::tab { background: #2a2a2a; color: #dcdcdc; padding: 8px 16px; border: none; font: bold 12px Inter; }
-            QTabBar::tab:selected { background: #4682b4; color: #ffffff; }
-        """)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(10)
-
-        title_label = QLabel("Settings")
-        title_label.setStyleSheet("font: bold 16px Inter; color: #4682b4;")
-        layout.addWidget(title_label)
-
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
-
-        # Appearance Tab
-        appearance_widget = QWidget()
-        appearance_layout = QVBoxLayout(appearance_widget)
-        appearance_layout.setSpacing(8)
-
-        appearance_layout.addWidget(QLabel("Theme:"))
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Dark", "Light", "High Contrast", "Custom"])
-        self.theme_combo.setCurrentText(self.parent.theme_mode.capitalize())
-        self.theme_combo.currentTextChanged.connect(self.on_theme_change)
-        appearance_layout.addWidget(self.theme_combo)
-
-        appearance_layout.addWidget(QLabel("Background Color:"))
-        self.bg_color_btn = QPushButton("Pick Color")
-        self.bg_color_btn.clicked.connect(self.pick_bg_color)
-        appearance_layout.addWidget(self.bg_color_btn)
-
-        appearance_layout.addWidget(QLabel("Accent Color:"))
-        self.accent_color_btn = QPushButton("Pick Color")
-        self.accent_color_btn.clicked.connect(self.pick_accent_color)
-        appearance_layout.addWidget(self.accent_color_btn)
-
-        appearance_layout.addWidget(QLabel("Font Size:"))
-        self.font_size = QSpinBox()
-        self.font_size.setRange(8, 18)
-        self.font_size.setValue(self.parent.font_settings['size'])
-        self.font_size.valueChanged.connect(self.on_font_size_change)
-        appearance_layout.addWidget(self.font_size)
-
-        appearance_layout.addWidget(QLabel("Icon Size:"))
-        self.icon_size = QSpinBox()
-        self.icon_size.setRange(16, 128)
-        self.icon_size.setValue(self.parent.icon_size)
-        self.icon_size.valueChanged.connect(self.on_icon_size_change)
-        appearance_layout.addWidget(self.icon_size)
-
-        appearance_layout.addWidget(QLabel("Border Radius:"))
-        self.border_radius = QSpinBox()
-        self.border_radius.setRange(4, 16)
-        self.border_radius.setValue(self.parent.border_radius)
-        self.border_radius.valueChanged.connect(self.on_border_radius_change)
-        appearance_layout.addWidget(self.border_radius)
-
-        tabs.addTab(appearance_widget, "Appearance")
-
-        # Behavior Tab
-        behavior_widget = QWidget()
-        behavior_layout = QVBoxLayout(behavior_widget)
-        behavior_layout.setSpacing(8)
-
-        behavior_layout.addWidget(QLabel("Animation Speed (ms):"))
-        self.anim_speed = QSlider(Qt.Horizontal)
-        self.anim_speed.setRange(0, 500)
-        self.anim_speed.setValue(self.parent.anim_speed)
-        self.anim_speed.valueChanged.connect(self.on_anim_speed_change)
-        behavior_layout.addWidget(self.anim_speed)
-
-        behavior_layout.addWidget(QLabel("Animation Curve:"))
-        self.anim_curve = QComboBox()
-        self.anim_curve.addItems(["InOutQuad", "InOutCubic", "Linear", "OutBounce"])
-        self.anim_curve.setCurrentText(self.parent.anim_curve)
-        self.anim_curve.currentTextChanged.connect(self.on_anim_curve_change)
-        behavior_layout.addWidget(self.anim_curve)
-
-        behavior_layout.addWidget(QLabel("Grid Columns:"))
-        self.grid_columns = QSpinBox()
-        self.grid_columns.setRange(2, 8)
-        self.grid_columns.setValue(self.parent.grid_columns)
-        self.grid_columns.valueChanged.connect(self.on_grid_columns_change)
-        behavior_layout.addWidget(self.grid_columns)
-
-        self.minimize_to_tray = QCheckBox("Minimize to System Tray")
-        self.minimize_to_tray.setChecked(self.parent.minimize_to_tray)
-        self.minimize_to_tray.stateChanged.connect(self.on_minimize_to_tray_change)
-        behavior_layout.addWidget(self.minimize_to_tray)
-
-        self.show_tray_icon = QCheckBox("Show System Tray Icon")
-        self.show_tray_icon.setChecked(self.parent.show_tray_icon)
-        self.show_tray_icon.stateChanged.connect(self.on_show_tray_icon_change)
-        behavior_layout.addWidget(self.show_tray_icon)
-
-        self.enable_animations = QCheckBox("Enable Animations")
-        self.enable_animations.setChecked(self.parent.enable_animations)
-        self.enable_animations.stateChanged.connect(self.on_enable_animations_change)
-        behavior_layout.addWidget(self.enable_animations)
-
-        tabs.addTab(behavior_widget, "Behavior")
-
-        # Advanced Tab
-        advanced_widget = QWidget()
-        advanced_layout = QVBoxLayout(advanced_widget)
-        advanced_layout.setSpacing(8)
-
-        advanced_layout.addWidget(QLabel("Global Hotkey:"))
-        self.hotkey_input = QLineEdit()
-        self.hotkey_input.setPlaceholderText("e.g., ctrl+alt+q")
-        self.hotkey_input.setText(self.parent.hotkey)
-        self.hotkey_input.textChanged.connect(self.on_hotkey_change)
-        advanced_layout.addWidget(self.hotkey_input)
-
-        advanced_layout.addWidget(QLabel("Cache Size Limit (MB):"))
-        self.cache_limit = QSpinBox()
-        self.cache_limit.setRange(10, 1000)
-        self.cache_limit.setValue(self.parent.cache_limit)
-        self.cache_limit.valueChanged.connect(self.on_cache_limit_change)
-        advanced_layout.addWidget(self.cache_limit)
-
-        reset_btn = QPushButton("Reset to Defaults")
-        reset_btn.clicked.connect(self.reset_settings)
-        advanced_layout.addWidget(reset_btn)
-
-        tabs.addTab(advanced_widget, "Advanced")
-
-        close_btn = QPushButton("Close")
-        close_btn.setToolTip("Close settings")
-        close_btn.clicked.connect(self.accept)
-        layout.addWidget(close_btn)
-
-    def pick_bg_color(self):
-        color = QColorDialog.getColor(QColor(self.parent.custom_colors['bg']), self)
-        if color.isValid():
-            self.parent.custom_colors['bg'] = color.name()
-            self.parent.theme_mode = "custom"
-            self.theme_combo.setCurrentText("Custom")
-            self.parent.apply_styles()
-            self.parent.save_settings()
-            self.parent.show_notification("Background color updated.", 2000)
-
-    def pick_accent_color(self):
-        color = QColorDialog.getColor(QColor(self.parent.custom_colors['accent']), self)
-        if color.isValid():
-            self.parent.custom_colors['accent'] = color.name()
-            self.parent.theme_mode = "custom"
-            self.theme_combo.setCurrentText("Custom")
-            self.parent.apply_styles()
-            self.parent.save_settings()
-            self.parent.show_notification("Accent color updated.", 2000)
-
-    def on_theme_change(self, theme):
-        try:
-            self.parent.change_theme(theme)
-            self.parent.show_notification(f"Theme changed to {theme}.", 2000)
-        except Exception as e:
-            logging.error(f"Theme change failed: {str(e)}")
-            self.parent.show_notification("Error changing theme.", 3000)
-
-    def on_font_size_change(self, size):
-        try:
-            self.parent.change_font_size(size)
-            self.parent.show_notification(f"Font size changed to {size}.", 2000)
-        except Exception as e:
-            logging.error(f"Font size change failed: {str(e)}")
-            self.parent.show_notification("Error changing font size.", 3000)
-
-    def on_icon_size_change(self, size):
-        try:
-            self.parent.change_icon_size(size)
-            self.parent.show_notification(f"Icon size changed to {size}.", 2000)
-        except Exception as e:
-            logging.error(f"Icon size change failed: {str(e)}")
-            self.parent.show_notification("Error changing icon size.", 3000)
-
-    def on_border_radius_change(self, radius):
-        try:
-            self.parent.change_border_radius(radius)
-            self.parent.show_notification(f"Border radius changed to {radius}.", 2000)
-        except Exception as e:
-            logging.error(f"Border radius change failed: {str(e)}")
-            self.parent.show_notification("Error changing border radius.", 3000)
-
-    def on_anim_speed_change(self, speed):
-        try:
-            self.parent.change_anim_speed(speed)
-            self.parent.show_notification(f"Animation speed set to {speed}ms.", 2000)
-        except Exception as e:
-            logging.error(f"Animation speed change failed: {str(e)}")
-            self.parent.show_notification("Error changing animation speed.", 3000)
-
-    def on_anim_curve_change(self, curve):
-        try:
-            self.parent.change_anim_curve(curve)
-            self.parent.show_notification(f"Animation curve set to {curve}.", 2000)
-        except Exception as e:
-            logging.error(f"Animation curve change failed: {str(e)}")
-            self.parent.show_notification("Error changing animation curve.", 3000)
-
-    def on_grid_columns_change(self, columns):
-        try:
-            self.parent.change_grid_columns(columns)
-            self.parent.show_notification(f"Grid columns set to {columns}.", 2000)
-        except Exception as e:
-            logging.error(f"Grid columns change failed: {str(e)}")
-            self.parent.show_notification("Error changing grid columns.", 3000)
-
-    def on_hotkey_change(self, hotkey):
-        try:
-            self.parent.set_hotkey(hotkey.strip())
-            self.parent.show_notification(f"Hotkey set to {hotkey}.", 2000)
-        except Exception as e:
-            logging.error(f"Hotkey change failed: {str(e)}")
-            self.parent.show_notification("Error changing hotkey.", 3000)
-
-    def on_minimize_to_tray_change(self, state):
-        try:
-            self.parent.minimize_to_tray = bool(state)
-            self.parent.save_settings()
-            self.parent.show_notification(f"Minimize to tray {'enabled' if state else 'disabled'}.", 2000)
-        except Exception as e:
-            logging.error(f"Minimize to tray toggle failed: {str(e)}")
-            self.parent.show_notification("Error toggling minimize to tray.", 3000)
-
-    def on_show_tray_icon_change(self, state):
-        try:
-            self.parent.show_tray_icon = bool(state)
-            self.parent.setup_system_tray()
-            self.parent.save_settings()
-            self.parent.show_notification(f"System tray icon {'shown' if state else 'hidden'}.", 2000)
-        except Exception as e:
-            logging.error(f"Show tray icon toggle failed: {str(e)}")
-            self.parent.show_notification("Error toggling tray icon.", 3000)
-
-    def on_enable_animations_change(self, state):
-        try:
-            self.parent.enable_animations = bool(state)
-            self.parent.save_settings()
-            self.parent.show_notification(f"Animations {'enabled' if state else 'disabled'}.", 2000)
-        except Exception as e:
-            logging.error(f"Enable animations toggle failed: {str(e)}")
-            self.parent.show_notification("Error toggling animations.", 3000)
-
-    def on_cache_limit_change(self, limit):
-        try:
-            self.parent.change_cache_limit(limit)
-            self.parent.show_notification(f"Cache limit set to {limit}MB.", 2000)
-        except Exception as e:
-            logging.error(f"Cache limit change failed: {str(e)}")
-            self.parent.show_notification("Error changing cache limit.", 3000)
-
-    def reset_settings(self):
-        try:
-            self.parent.reset_settings()
-            self.theme_combo.setCurrentText(self.parent.theme_mode.capitalize())
-            self.font_size.setValue(self.parent.font_settings['size'])
-            self.icon_size.setValue(self.parent.icon_size)
-            self.border_radius.setValue(self.parent.border_radius)
-            self.anim_speed.setValue(self.parent.anim_speed)
-            self.anim_curve.setCurrentText(self.parent.anim_curve)
-            self.grid_columns.setValue(self.parent.grid_columns)
-            self.minimize_to_tray.setChecked(self.parent.minimize_to_tray)
-            self.show_tray_icon.setChecked(self.parent.show_tray_icon)
-            self.enable_animations.setChecked(self.parent.enable_animations)
-            self.hotkey_input.setText(self.parent.hotkey)
-            self.cache_limit.setValue(self.parent.cache_limit)
-            self.parent.show_notification("Settings reset to defaults.", 2000)
-        except Exception as e:
-            logging.error(f"Reset settings failed: {str(e)}")
-            self.parent.show_notification("Error resetting settings.", 3000)
-
-class AppLauncher(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Quantum Launcher")
-        self.setMinimumSize(750, 550)
-        self.setWindowFlags(Qt.FramelessWindowHint)
-        self.setAcceptDrops(True)
-
-        # Initialize variables
-        self.apps = {}
-        self.links = self.load_links()
-        self.recent_items = self.load_recent()
-        self.pinned_items = self.load_pinned()
-        self.selected_apps = set()
-        self.selected_links = set()
-        self.selected_recent = set()
-        self.selected_pinned = set()
-        self.settings = self.load_settings()
-        self.theme_mode = self.settings.get('theme', 'dark')
-        self.custom_colors = self.settings.get('colors', {
-            'bg': '#1e1e1e', 'fg': '#dcdcdc', 'accent': '#4682b4',
-            'pane': '#252525', 'list_text': '#dcdcdc', 'list_bg': '#252525'
-        })
-        self.font_settings = self.settings.get('font', {'family': 'Inter', 'size': 12})
-        self.anim_speed = self.settings.get('anim_speed', 250)
-        self.anim_curve = self.settings.get('anim_curve', 'InOutQuad')
-        self.icon_size = self.settings.get('icon_size', 32)
-        self.border_radius = self.settings.get('border_radius', 8)
-        self.grid_columns = self.settings.get('grid_columns', 4)
-        self.minimize_to_tray = self.settings.get('minimize_to_tray', True)
-        self.show_tray_icon = self.settings.get('show_tray_icon', True)
-        self.enable_animations = self.settings.get('enable_animations', True)
-        self.hotkey = self.settings.get('hotkey', 'ctrl+alt+q')
-        self.cache_limit = self.settings.get('cache_limit', 100)
-        self.icon_cache = {}
-        self.icon_cache_dir = Path("icon_cache")
-        self.icon_cache_dir.mkdir(exist_ok=True)
-        self.drag_pos = None
-        self.is_maximized = False
-        self.view_mode = "list"
-        self.sort_mode = "name"
-        self.current_tab = 0
-        self.notification_widget = NotificationWidget(self)
-        self.stats_label = QLabel("Initializing...")
-        self.stats_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setTextVisible(False)
-        self.search_timer = QTimer()
-        self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.filter_all)
-        self.search_cache = {}
-
-        # Initialize UI components
-        self.setup_fonts()
-        self.setup_system_tray()
-        self.setup_hotkey()
-        self.setup_ui()
-        self.load_apps_async()
-        self.center_on_screen()
-
-    def setup_fonts(self):
-        font_db = QFontDatabase()
-        available_fonts = font_db.families()
-        if "Inter" in available_fonts:
-            self.font_settings['family'] = "Inter"
-        else:
-            self.font_settings['family'] = "Arial"
-
-    def setup_system_tray(self):
-        if not self.show_tray_icon:
-            if hasattr(self, 'tray_icon'):
-                self.tray_icon.hide()
-            return
-        tray_icon = QIcon.fromTheme("system-software-install")
-        if tray_icon.isNull():
-            tray_icon = QIcon.fromTheme("application")
-            logging.warning("System tray icon 'system-software-install' not found, using 'application'.")
-        self.tray_icon = QSystemTrayIcon(tray_icon, self)
-        tray_menu = QMenu()
-        tray_menu.addAction("Show", self.show)
-        tray_menu.addAction("Quit", QApplication.quit)
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.activated.connect(self.tray_activated)
-        self.tray_icon.show()
-
-    def tray_activated(self, reason):
-        if reason == QSystemTrayIcon.DoubleClick:
-            self.show()
-            self.raise_()
-            self.activateWindow()
-
-    def setup_hotkey(self):
-        try:
-            keyboard.remove_hotkey(self.hotkey)
-        except:
-            pass
-        try:
-            keyboard.add_hotkey(self.hotkey, self.toggle_visibility)
-        except Exception as e:
-            logging.warning(f"Failed to set hotkey {self.hotkey}: {str(e)}")
-            self.show_notification("Failed to set hotkey.", 3000)
-
-    def set_hotkey(self, hotkey):
-        try:
-            keyboard.remove_hotkey(self.hotkey)
-            keyboard.add_hotkey(hotkey, self.toggle_visibility)
-            self.hotkey = hotkey
-            self.save_settings()
-        except Exception as e:
-            logging.error(f"Failed to set hotkey {hotkey}: {str(e)}")
-            self.show_notification(f"Failed to set hotkey: {str(e)}.", 3000)
-
-    def toggle_visibility(self):
-        if self.isVisible():
-            self.hide()
-        else:
-            self.show()
-            self.raise_()
-            self.activateWindow()
-
-    def setup_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Title Bar
-        self.title_bar = QWidget()
-        self.title_bar.setFixedHeight(48)
-        title_layout = QHBoxLayout(self.title_bar)
-        title_layout.setContentsMargins(16, 0, 16, 0)
-        title_layout.setSpacing(8)
-
-        # App Icon and Title
-        app_icon = QLabel()
-        app_icon.setPixmap(QIcon.fromTheme("system-software-install").pixmap(28, 28))
-        title_layout.addWidget(app_icon)
-        title_label = QLabel("Quantum Launcher")
-        title_label.setStyleSheet("font: bold 16px Inter; color: #dcdcdc;")
-        title_layout.addWidget(title_label)
-        title_layout.addSpacing(20)
-
-        # Tab Buttons
-        self.tab_buttons = []
-        for text, slot in [
-            ("Apps", lambda: self.show_content(0)),
-            ("Links", lambda: self.show_content(1)),
-            ("Recent", lambda: self.show_content(2)),
-            ("Pinned", lambda: self.show_content(3)),
-            ("Settings", self.show_settings)
-        ]:
-            btn = QToolButton()
-            btn.setText(text)
-            btn.setToolTip(f"Switch to {text} view")
-            btn.setFixedSize(100, 36)
-            btn.setCheckable(True)
-            btn.clicked.connect(slot)
-            title_layout.addWidget(btn)
-            self.tab_buttons.append(btn)
-        self.tab_buttons[0].setChecked(True)
-        title_layout.addStretch()
-
-        # Window Controls
-        minimize_btn = QToolButton()
-        minimize_btn.setText("−")
-        minimize_btn.setToolTip("Minimize")
-        minimize_btn.setFixedSize(36, 36)
-
-        maximize_btn = QToolButton()
-        maximize_btn.setText("↔")
-        maximize_btn.setToolTip("Maximize/Restore")
-        maximize_btn.setFixedSize(36, 36)
-
-        close_btn = QToolButton()
-        close_btn.setText("✕")
-        close_btn.setToolTip("Close")
-        close_btn.setFixedSize(36, 36)
-
-        for btn in [minimize_btn, maximize_btn, close_btn]:
-            btn.setStyleSheet("""
-                QToolButton { background: #2a2a2a; color: #dcdcdc; border: none; border-radius: 18px; font: bold 14px; }
-                QToolButton:hover { background: #4682b4; color: #ffffff; }
-            """)
-        minimize_btn.clicked.connect(self.showMinimized)
-        maximize_btn.clicked.connect(self.toggle_maximize)
-        close_btn.clicked.connect(self.close_window)
-        title_layout.addWidget(minimize_btn)
-        title_layout.addWidget(maximize_btn)
-        title_layout.addWidget(close_btn)
-        main_layout.addWidget(self.title_bar)
-
-        # Main Content
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(16, 16, 16, 16)
-        content_layout.setSpacing(12)
-        main_layout.addWidget(content_widget)
-
-        # Search Bar
-        search_layout = QHBoxLayout()
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search apps, links, or pinned items...")
-        self.search_bar.setFixedHeight(40)
-        self.search_bar.setStyleSheet("""
-            QLineEdit { background: #2a2a2a; color: #dcdcdc; border: 1px solid #4682b4; border-radius: 20px; padding: 8px 32px 8px 32px; font: 13px Inter; }
-            QLineEdit:focus { border: 2px solid #4682b4; background: #2a2a2a; }
-        """)
-        self.search_bar.setTextMargins(20, 0, 20, 0)
-        self.search_bar.textChanged.connect(self.debounce_search)
-        self.setup_completer()
-        search_layout.addWidget(self.search_bar)
-
-        # Search Icon
-        search_icon = QLabel()
-        search_icon.setPixmap(QIcon.fromTheme("edit-find").pixmap(20, 20))
-        search_icon.setStyleSheet("background: none; padding: 0px;")
-        search_icon.setFixedSize(20, 20)
-        search_layout.addWidget(search_icon, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-        search_layout.setAlignment(search_icon, Qt.AlignLeft | Qt.AlignVCenter)
-        search_icon.setGeometry(20, 10, 20, 20)  # Position inside search bar
-
-        # Clear Button
-        clear_btn = QToolButton()
-        clear_btn.setText("×")
-        clear_btn.setToolTip("Clear search")
-        clear_btn.setFixedSize(20, 20)
-        clear_btn.setStyleSheet("background: none; color: #dcdcdc; font: bold 14px;")
-        clear_btn.clicked.connect(self.search_bar.clear)
-        search_layout.addWidget(clear_btn, alignment=Qt.AlignRight | Qt.AlignVCenter)
-
-        # Sort Combo
-        self.sort_combo = QComboBox()
-        self.sort_combo.addItems(["Name", "Category"])
-        self.sort_combo.setFixedWidth(130)
-        self.sort_combo.setToolTip("Sort items")
-        self.sort_combo.currentTextChanged.connect(lambda text: self.set_sort_mode(text.lower()))
-        search_layout.addWidget(self.sort_combo)
-        content_layout.addLayout(search_layout)
-
-        # Action Bar
-        self.action_bar = QWidget()
-        action_layout = QHBoxLayout(self.action_bar)
-        action_layout.setContentsMargins(0, 0, 0, 0)
-        action_layout.setSpacing(8)
-        run_btn = QPushButton("Run")
-        run_btn.setToolTip("Run selected items (Ctrl+R)")
-        run_btn.setFixedSize(90, 36)
-        run_btn.clicked.connect(self.run_selected)
-        action_layout.addWidget(run_btn)
-        add_link_btn = QPushButton("Add Link")
-        add_link_btn.setToolTip("Add a new link (Ctrl+L)")
-        add_link_btn.setFixedSize(90, 36)
-        add_link_btn.clicked.connect(self.add_link_popup)
-        action_layout.addWidget(add_link_btn)
-        view_btn = QPushButton("View")
-        view_btn.setToolTip("Cycle view mode")
-        view_btn.setFixedSize(90, 36)
-        view_btn.clicked.connect(self.toggle_view_mode)
-        action_layout.addWidget(view_btn)
-        action_layout.addStretch()
-        content_layout.addWidget(self.action_bar)
-
-        # Content List
-        self.content_list = QListView()
-        self.content_list.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.content_list.setViewMode(QListView.ListMode)
-        self.content_list.setIconSize(QSize(self.icon_size, self.icon_size))
-        self.content_model = QStandardItemModel()
-        self.content_list.setModel(self.content_model)
-        self.content_list.setItemDelegate(CustomItemDelegate(self.view_mode, self.icon_size, self.border_radius))
-        self.content_list.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.content_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.content_list.selectionModel().selectionChanged.connect(self.update_selection)
-        self.content_list.setMouseTracking(True)
-        content_layout.addWidget(self.content_list)
-
-        # Status Bar
-        status_bar = QWidget()
-        status_layout = QHBoxLayout(status_bar)
-        status_layout.setContentsMargins(8, 4, 8, 4)
-        status_layout.addWidget(self.stats_label)
-        status_layout.addWidget(self.progress_bar)
-        status_layout.addStretch()
-        content_layout.addWidget(status_bar)
-
-        # Shortcuts
-        self.add_shortcut('Ctrl+1', lambda: self.show_content(0))
-        self.add_shortcut('Ctrl+2', lambda: self.show_content(1))
-        self.add_shortcut('Ctrl+3', lambda: self.show_content(2))
-        self.add_shortcut('Ctrl+4', lambda: self.show_content(3))
-        self.add_shortcut('Ctrl+5', self.show_settings)
-        self.add_shortcut('Ctrl+R', self.run_selected)
-        self.add_shortcut('Ctrl+L', self.add_link_popup)
-        self.add_shortcut('Ctrl+T', self.toggle_view_mode)
-
-        self.apply_styles()
-
-    def setup_completer(self):
-        completer = QCompleter()
-        self.completer_model = QStringListModel()
-        completer.setModel(self.completer_model)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchContains)
-        self.search_bar.setCompleter(completer)
-        self.update_completer()
-
-    def update_completer(self):
-        completer_list = []
-        for category in self.apps:
-            completer_list.extend(self.apps[category].keys())
-        completer_list.extend(link["name"] for link in self.links)
-        completer_list.extend(item["name"] for item in self.recent_items)
-        completer_list.extend(item["name"] for item in self.pinned_items)
-        self.completer_model.setStringList(completer_list)
-
-    def debounce_search(self, text):
-        self.search_timer.start(100)
-
-    def apply_styles(self):
-        bg = self.custom_colors['bg']
-        fg = self.custom_colors['fg']
-        accent = self.custom_colors['accent']
-        pane = self.custom_colors['pane']
-        list_text = self.custom_colors['list_text']
-        list_bg = self.custom_colors['list_bg']
-        font = f"{self.font_settings['family']} {self.font_settings['size']}pt"
-
-        if self.theme_mode == "light":
-            self.custom_colors.update({
-                'bg': '#f5f5f5', 'fg': '#1a1a1a', 'accent': '#0077b6',
-                'pane': '#e0e0e0', 'list_text': '#1a1a1a', 'list_bg': '#e0e0e0'
-            })
-        elif self.theme_mode == "highcontrast":
-            self.custom_colors.update({
-                'bg': '#000000', 'fg': '#00ff00', 'accent': '#00ff00',
-                'pane': '#111111', 'list_text': '#00ff00', 'list_bg': '#111111'
-            })
-        bg, fg, accent, pane, list_text, list_bg = (
-            self.custom_colors['bg'], self.custom_colors['fg'], self.custom_colors['accent'],
-            self.custom_colors['pane'], self.custom_colors['list_text'], self.custom_colors['list_bg']
-        )
-
-        self.setStyleSheet(f"""
-            QMainWindow {{ background: {bg}; border: 1px solid {accent}; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }}
-            QLineEdit {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 20px; padding: 8px 32px; font: {font}; }}
-            QLineEdit:focus {{ border: 2px solid {accent}; background: {pane}; }}
-            QListView {{ background: {list_bg}; color: {list_text}; border: none; padding: 12px; font: {font}; }}
-            QToolButton {{ background: {pane}; color: {fg}; border: none; border-radius: 8px; font: bold 13px Inter; }}
-            QToolButton:checked, QToolButton:hover {{ background: {accent}; color: #ffffff; }}
-            QPushButton {{ background: {accent}; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 13px Inter; }}
-            QPushButton:hover {{ background: #5a9bd4; }}
-            QComboBox {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 8px; padding: 6px; font: 12px Inter; }}
-            QComboBox::drop-down {{ border: none; }}
-            QComboBox::down-arrow {{ image: none; }}
-            QLabel {{ color: {fg}; font: 12px Inter; padding: 4px; }}
-            QProgressBar {{ background: {pane}; border: 1px solid {accent}; border-radius: 2px; }}
-            QProgressBar::chunk {{ background: {accent}; }}
-        """)
-        gradient = QLinearGradient(0, 0, 0, 48)
-        gradient.setColorAt(0, QColor(pane))
-        gradient.setColorAt(1, QColor(self.adjust_color(pane, -20)))
-        self.title_bar.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {pane}, stop:1 {self.adjust_color(pane, -20)});
-            border-bottom: 1px solid {accent};
-        """)
-        self.stats_label.setStyleSheet(f"color: {fg}; font: 11px Inter;")
-        self.action_bar.setStyleSheet(f"background: {pane}; border-radius: 8px; padding: 6px;")
-
-    def adjust_color(self, color, delta):
-        c = QColor(color)
-        return QColor(max(0, c.red() + delta), max(0, c.green() + delta), max(0, c.blue() + delta)).name()
-
-    def show_content(self, index):
-        for btn in self.tab_buttons:
-            btn.setChecked(False)
-        self.tab_buttons[index].setChecked(True)
-        self.current_tab = index
-        self.update_content()
-        if self.enable_animations:
-            self.animate_pane()
-            self.fade_in_content()
-
-    def update_content(self):
-        self.content_model.clear()
-        font = QFont(self.font_settings['family'], self.font_settings['size'])
-        filter_text = self.search_bar.text().lower()
-
-        items = []
-        cache_key = f"{self.current_tab}_{filter_text}"
-        if cache_key in self.search_cache:
-            items = self.search_cache[cache_key]
-        else:
-            if self.current_tab == 0:  # Apps
-                for category in sorted(self.apps.keys()):
-                    app_list = [(app_name, self.apps[category][app_name], category) for app_name in self.apps[category]]
-                    if filter_text:
-                        app_list = [(name, path, cat) for name, path, cat in app_list if fuzz.partial_ratio(filter_text, name.lower()) > 90]
-                    items.extend([(name, path, cat, "app", False) for name, path, cat in app_list])
-            elif self.current_tab == 1:  # Links
-                for link in self.links:
-                    if filter_text and fuzz.partial_ratio(filter_text, link["name"].lower()) <= 90:
-                        continue
-                    items.append((link["name"], link["url"], link.get("category", "General"), "link", link.get("is_favorite", False)))
-            elif self.current_tab == 2:  # Recent
-                for item in self.recent_items:
-                    if filter_text and fuzz.partial_ratio(filter_text, item["name"].lower()) <= 90:
-                        continue
-                    items.append((f"{item['name']} ({item['type']})", item["path"], item.get("category", "General"), item["type"], item.get("is_favorite", False)))
-            elif self.current_tab == 3:  # Pinned
-                for item in self.pinned_items:
-                    if filter_text and fuzz.partial_ratio(filter_text, item["name"].lower()) <= 90:
-                        continue
-                    items.append((f"{item['name']} ({item['type']})", item["path"], item.get("category", "General"), item["type"], item.get("is_favorite", False)))
-            self.search_cache[cache_key] = items
-            if len(self.search_cache) > 100:
-                self.search_cache.pop(next(iter(self.search_cache)))
-
-        if self.sort_mode == "category":
-            items.sort(key=lambda x: (x[2], x[0]))
-        elif self.sort_mode == "lastused" and self.current_tab in (2, 3):
-            items.sort(key=lambda x: next((i.get("timestamp", "") for i in self.recent_items if i["name"] == x[0].split(" (")[0] and i["type"] == x[3]), ""), reverse=True)
-        else:  # name
-            items.sort(key=lambda x: x[0])
-
-        for name, path, category, item_type, is_favorite in items:
-            icon = self.get_app_icon(path) if item_type == "app" else (QIcon.fromTheme("link") if item_type == "link" else QIcon.fromTheme("pinned"))
-            item = AppItem(name, path, category, item_type, icon, font, is_favorite)
-            self.content_model.appendRow(item)
-
-        self.content_list.setItemDelegate(CustomItemDelegate(self.view_mode, self.icon_size, self.border_radius))
-        self.content_list.setIconSize(QSize(self.icon_size, self.icon_size))
-        self.update_stats()
-        self.update_completer()
-
-    def animate_pane(self):
-        if not self.enable_animations:
-            return
-        animation = QPropertyAnimation(self.content_list, b"pos")
-        animation.setDuration(self.anim_speed)
-        animation.setStartValue(QPoint(-20, self.content_list.pos().y()))
-        animation.setEndValue(QPoint(0, self.content_list.pos().y()))
-        animation.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
-        animation.start()
-
-    def fade_in_content(self):
-        if not self.enable_animations:
-            return
-        self.content_list.setProperty("opacity", 0.0)
-        anim = QPropertyAnimation(self.content_list, b"opacity")
-        anim.setDuration(self.anim_speed)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
-        anim.start()
-
-    def show_context_menu(self, point):
-        menu = QMenu()
-        menu.setStyleSheet("""
-            QMenu { background: #2a2a2a; color: #dcdcdc; border: 1px solid #4682b4; border-radius: 8px; }
-            QMenu::item:selected { background: #4682b4; color: #ffffff; }
-        """)
-        if self.current_tab == 0:
-            menu.addAction("Refresh Apps", self.refresh_apps)
-            menu.addAction("Open File Location", self.open_app_location)
-            menu.addAction("Pin", self.pin_selected)
-        elif self.current_tab == 1:
-            menu.addAction("Delete Link", self.delete_selected)
-            menu.addAction("Edit Category", self.edit_link_category)
-            menu.addAction("Copy URL", self.copy_link_url)
-            menu.addAction("Pin", self.pin_selected)
-            menu.addAction("Toggle Favorite", self.toggle_favorite)
-        elif self.current_tab == 2:
-            menu.addAction("Clear Recent", self.clear_recent)
-            menu.addAction("Pin", self.pin_selected)
-            menu.addAction("Toggle Favorite", self.toggle_favorite)
-        elif self.current_tab == 3:
-            menu.addAction("Unpin", self.unpin_selected)
-            menu.addAction("Toggle Favorite", self.toggle_favorite)
-
-        sort_menu = menu.addMenu("Sort By")
-        sort_menu.addAction("Name", lambda: self.set_sort_mode("name")).setCheckable(True)
-        sort_menu.addAction("Category", lambda: self.set_sort_mode("category")).setCheckable(True)
-        if self.current_tab in (2, 3):
-            sort_menu.addAction("Last Used", lambda: self.set_sort_mode("lastused")).setCheckable(True)
-        for action in sort_menu.actions():
-            action.setChecked(action.text().lower() == self.sort_mode)
-
-        menu.exec_(self.content_list.mapToGlobal(point))
-
-    def set_sort_mode(self, mode):
-        self.sort_mode = mode.lower()
-        self.update_content()
-        self.show_notification(f"Sorted by {mode}.", 2000)
-
-    def toggle_favorite(self):
-        for name in self.selected_links:
-            for link in self.links:
-                if link["name"] == name:
-                    link["is_favorite"] = not link.get("is_favorite", False)
-        for name in self.selected_recent:
-            for item in self.recent_items:
-                if item["name"] == name.split(" (")[0]:
-                    item["is_favorite"] = not item.get("is_favorite", False)
-        for name in self.selected_pinned:
-            for item in self.pinned_items:
-                if item["name"] == name.split(" (")[0]:
-                    item["is_favorite"] = not item.get("is_favorite", False)
-        self.save_links()
-        self.save_recent()
-        self.save_pinned()
-        self.update_content()
-        self.show_notification("Favorite status toggled.", 2000)
-
-    def update_stats(self):
-        self.stats_label.setText(
-            f"Apps: {sum(len(apps) for apps in self.apps.values())} | "
-            f"Links: {len(self.links)} | "
-            f"Recent: {len(self.recent_items)} | "
-            f"Pinned: {len(self.pinned_items)} | "
-            f"Selected: {len(self.selected_apps) + len(self.selected_links) + len(self.selected_recent) + len(self.selected_pinned)}"
-        )
-
-    def update_selection(self, selected, deselected):
-        self.selected_apps.clear()
-        self.selected_links.clear()
-        self.selected_recent.clear()
-        self.selected_pinned.clear()
-        for index in self.content_list.selectedIndexes():
-            data = self.content_model.itemFromIndex(index).data(Qt.UserRole)
-            name = data["name"].split(" (")[0] if self.current_tab in (2, 3) else data["name"]
-            if self.current_tab == 0:
-                self.selected_apps.add(name)
-            elif self.current_tab == 1:
-                self.selected_links.add(name)
-            elif self.current_tab == 2:
-                self.selected_recent.add(name)
-            elif self.current_tab == 3:
-                self.selected_pinned.add(name)
-        self.update_stats()
-
-    def add_shortcut(self, key, slot):
-        from PyQt5.QtGui import QKeySequence
-        from PyQt5.QtWidgets import QShortcut
-        shortcut = QShortcut(QKeySequence(key), self)
-        shortcut.activated.connect(slot)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        width = self.content_list.width()
-        if self.view_mode == "grid":
-            columns = self.grid_columns
-            self.content_list.setGridSize(QSize(width // columns, 160))
-        else:
-            self.content_list.setGridSize(QSize())
-        self.center_on_screen()
-
-    def center_on_screen(self):
-        screen = QApplication.primaryScreen().geometry()
-        size = self.geometry()
-        self.move((screen.width() - size.width()) // 2, (screen.height() - size.height()) // 2)
-
-    def toggle_view_mode(self):
-        modes = ["grid", "list", "compact"]
-        current_idx = modes.index(self.view_mode)
-        self.view_mode = modes[(current_idx + 1) % len(modes)]
-        self.content_list.setViewMode(QListView.IconMode if self.view_mode == "grid" else QListView.ListMode)
-        self.update_content()
-        self.show_notification(f"View mode: {self.view_mode.title()}.", 2000)
-
-    def change_theme(self, theme):
-        self.theme_mode = theme.lower().replace(" ", "")
-        self.apply_styles()
-        self.save_settings()
-
-    def change_font_size(self, size):
-        self.font_settings['size'] = size
-        self.apply_styles()
-        self.update_content()
-        self.save_settings()
-
-    def change_icon_size(self, size):
-        self.icon_size = size
-        self.update_content()
-        self.save_settings()
-
-    def change_border_radius(self, radius):
-        self.border_radius = radius
-        self.update_content()
-        self.save_settings()
-
-    def change_anim_speed(self, speed):
-        self.anim_speed = speed
-        self.save_settings()
-
-    def change_anim_curve(self, curve):
-        self.anim_curve = curve
-        self.save_settings()
-
-    def change_grid_columns(self, columns):
-        self.grid_columns = columns
-        self.resizeEvent(None)
-        self.save_settings()
-
-    def change_cache_limit(self, limit):
-        self.cache_limit = limit
-        self.cleanup_icon_cache()
-        self.save_settings()
-
-    def reset_settings(self):
-        self.settings = {
-            'theme': 'dark',
-            'colors': {
-                'bg': '#1e1e1e', 'fg': '#dcdcdc', 'accent': '#4682b4',
-                'pane': '#252525', 'list_text': '#dcdcdc', 'list_bg': '#252525'
-            },
-            'font': {'family': 'Inter', 'size': 12},
-            'anim_speed': 250,
-            'anim_curve': 'InOutQuad',
-            'icon_size': 32,
-            'border_radius': 8,
-            'grid_columns': 4,
-            'minimize_to_tray': True,
-            'show_tray_icon': True,
-            'enable_animations': True,
-            'hotkey': 'ctrl+alt+q',
-            'cache_limit': 100
-        }
-        self.theme_mode = self.settings['theme']
-        self.custom_colors = self.settings['colors']
-        self.font_settings = self.settings['font']
-        self.anim_speed = self.settings['anim_speed']
-        self.anim_curve = self.settings['anim_curve']
-        self.icon_size = self.settings['icon_size']
-        self.border_radius = self.settings['border_radius']
-        self.grid_columns = self.settings['grid_columns']
-        self.minimize_to_tray = self.settings['minimize_to_tray']
-        self.show_tray_icon = self.settings['show_tray_icon']
-        self.enable_animations = self.settings['enable_animations']
-        self.hotkey = self.settings['hotkey']
-        self.cache_limit = self.settings['cache_limit']
-        self.apply_styles()
-        self.update_content()
-        self.setup_system_tray()
-        self.setup_hotkey()
-        self.save_settings()
-
-    def load_apps_async(self):
-        self.progress_bar.setValue(0)
-        self.loader_thread = AppLoaderThread()
-        self.loader_thread.appsLoaded.connect(self.update_apps)
-        self.loader_thread.statusUpdate.connect(self.stats_label.setText)
-        self.loader_thread.progressUpdate.connect(self.progress_bar.setValue)
-        self.loader_thread.errorSignal.connect(self.show_notification)
-        self.loader_thread.start()
-
-    def update_apps(self, apps):
-        self.apps = apps
-        self.update_content()
-        self.update_stats()
-        self.progress_bar.setValue(100)
-
-    def load_links(self):
-        try:
-            with open("links.json", "r") as f:
-                links = json.load(f)
-            return [item for item in links if isinstance(item, dict) and "name" in item and "url" in item]
-        except (FileNotFoundError, json.JSONDecodeError):
-            return [{"name": "Example", "url": "https://example.com", "category": "General", "is_favorite": False}]
-
-    def save_links(self):
-        try:
-            with open("links.json", "w") as f:
-                json.dump(self.links, f, indent=4)
-        except Exception as e:
-            logging.error(f"Failed to save links: {str(e)}")
-            self.show_notification(f"Failed to save links: {str(e)}.", 3000)
-
-    def load_recent(self):
-        try:
-            with open("recent.json", "r") as f:
-                recent = json.load(f)
-            return [item for item in recent[:50] if isinstance(item, dict) and "name" in item and "path" in item and "type" in item]
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-    def save_recent(self):
-        try:
-            with open("recent.json", "w") as f:
-                json.dump(self.recent_items, f, indent=4)
-        except Exception as e:
-            logging.error(f"Failed to save recent items: {str(e)}")
-            self.show_notification(f"Failed to save recent items: {str(e)}.", 3000)
-
-    def load_pinned(self):
-        try:
-            with open("pinned.json", "r") as f:
-                pinned = json.load(f)
-            return [item for item in pinned if isinstance(item, dict) and "name" in item and "path" in item and "type" in item]
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-    def save_pinned(self):
-        try:
-            with open("pinned.json", "w") as f:
-                json.dump(self.pinned_items, f, indent=4)
-        except Exception as e:
-            logging.error(f"Failed to save pinned items: {str(e)}")
-            self.show_notification(f"Failed to save pinned items: {str(e)}.", 3000)
-
-    def load_settings(self):
-        default_settings = {
-            'theme': 'dark',
-            'colors': {
-                'bg': '#1e1e1e', 'fg': '#dcdcdc', 'accent': '#4682b4',
-                'pane': '#252525', 'list_text': '#dcdcdc', 'list_bg': '#252525'
-            },
-            'font': {'family': 'Inter', 'size': 12},
-            'anim_speed': 250,
-            'anim_curve': 'InOutQuad',
-            'icon_size': 32,
-            'border_radius': 8,
-            'grid_columns': 4,
-            'minimize_to_tray': True,
-            'show_tray_icon': True,
-            'enable_animations': True,
-            'hotkey': 'ctrl+alt+q',
-            'cache_limit': 100
-        }
-        try:
-            with open("settings.json", "r") as f:
-                loaded_settings = json.load(f)
-                if 'colors' in loaded_settings:
-                    loaded_settings['colors'] = {**default_settings['colors'], **loaded_settings['colors']}
-                return {**default_settings, **loaded_settings}
-        except (FileNotFoundError, json.JSONDecodeError):
-            return default_settings
-
-    def save_settings(self):
-        settings = {
-            'theme': self.theme_mode,
-            'colors': self.custom_colors,
-            'font': self.font_settings,
-            'anim_speed': self.anim_speed,
-            'anim_curve': self.anim_curve,
-            'icon_size': self.icon_size,
-            'border_radius': self.border_radius,
-            'grid_columns': self.grid_columns,
-            'minimize_to_tray': self.minimize_to_tray,
-            'show_tray_icon': self.show_tray_icon,
-            'enable_animations': self.enable_animations,
-            'hotkey': self.hotkey,
-            'cache_limit': self.cache_limit
-        }
-        try:
-            with open("settings.json", "w") as f:
-                json.dump(settings, f, indent=4)
-        except Exception as e:
-            logging.error(f"Failed to save settings: {str(e)}")
-            self.show_notification(f"Failed to save settings: {str(e)}.", 3000)
-
-    def cleanup_icon_cache(self):
-        cache_size = sum(f.stat().st_size for f in self.icon_cache_dir.glob("*.png")) / (1024 * 1024)
-        if cache_size > self.cache_limit:
-            files = sorted(self.icon_cache_dir.glob("*.png"), key=lambda x: x.stat().st_mtime)
-            while cache_size > self.cache_limit and files:
-                files.pop(0).unlink()
-                cache_size = sum(f.stat().st_size for f in self.icon_cache_dir.glob("*.png")) / (1024 * 1024)
-            self.icon_cache.clear()
-
-    def get_app_icon(self, shortcut_path):
-        if shortcut_path in self.icon_cache:
-            return self.icon_cache[shortcut_path]
-        if not HAS_WIN32 or not os.path.exists(str(shortcut_path)):
-            return QIcon.fromTheme("application-x-executable")
-
-        cache_file = self.icon_cache_dir / f"{hashlib.md5(str(shortcut_path).encode()).hexdigest()}.png"
-        if cache_file.exists():
-            icon = QIcon(str(cache_file))
-            if not icon.isNull():
-                self.icon_cache[shortcut_path] = icon
-                return icon
-
-        try:
-            pythoncom.CoInitialize()
-            shortcut = pythoncom.CoCreateInstance(shell.CLSID_ShellLink, None, pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink)
-            shortcut.QueryInterface(pythoncom.IID_IPersistFile).Load(str(shortcut_path))
-            icon_path, icon_index = shortcut.GetIconLocation()
-            if not icon_path:
-                target_path = shortcut.GetPath(shell.SLGP_RAWPATH)[0]
-                if os.path.exists(target_path):
-                    icon_path = target_path
-                else:
-                    return QIcon.fromTheme("application-x-executable")
-
-            icon = QIcon(icon_path)
-            if not icon.isNull():
-                pixmap = icon.pixmap(max(self.icon_size, 64))
-                img = Image.fromqpixmap(pixmap)
-                img.save(str(cache_file))
-                self.icon_cache[shortcut_path] = icon
-                self.cleanup_icon_cache()
-                return icon
-        except Exception as e:
-            logging.debug(f"Failed to extract icon for {shortcut_path}: {str(e)}")
-        finally:
-            pythoncom.CoUninitialize()
-
-        return QIcon.fromTheme("application-x-executable")
-
-    def filter_all(self):
-        self.update_content()
-
-    def show_settings(self):
-        try:
-            dialog = SettingsDialog(self)
-            if self.enable_animations:
-                dialog.setProperty("opacity", 0.0)
-                dialog.show()
-                anim = QPropertyAnimation(dialog, b"opacity")
-                anim.setDuration(self.anim_speed)
-                anim.setStartValue(0.0)
-                anim.setEndValue(1.0)
-                anim.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
-                anim.start()
-            else:
-                dialog.exec_()
-            self.tab_buttons[4].setChecked(False)
-        except Exception as e:
-            logging.error(f"Settings dialog failed: {e}")
-            self.show_notification("Unable to open settings.", 3000)
-
-    def run_selected(self):
-        errors = []
-        timestamp = datetime.now().isoformat()
-        for name in self.selected_apps.copy():
-            for category in self.apps:
-                if name in self.apps[category]:
-                    path = self.apps[category][name]
-                    try:
-                        self.launch_item(path, "app")
-                        self.add_recent_item(name, path, category, "app", timestamp)
-                    except Exception as e:
-                        errors.append(f"Failed to open {name}: {str(e)}")
-        for name in self.selected_links.copy():
-            link = next((l for l in self.links if l["name"] == name), None)
-            if link:
-                try:
-                    self.launch_item(link["url"], "link")
-                    self.add_recent_item(name, link["url"], link.get("category", "General"), "link", timestamp)
-                except Exception as e:
-                    errors.append(f"Failed to open {name}: {str(e)}")
-        for name in self.selected_recent.copy():
-            item = next((i for i in self.recent_items if i["name"] == name.split(" (")[0]), None)
-            if item:
-                try:
-                    self.launch_item(item["path"], item["type"])
-                    self.add_recent_item(name.split(" (")[0], item["path"], item.get("category", "General"), item["type"], timestamp)
-                except Exception as e:
-                    errors.append(f"Failed to open {name}: {str(e)}")
-        for name in self.selected_pinned.copy():
-            item = next((i for i in self.pinned_items if i["name"] == name.split(" (")[0]), None)
-            if item:
-                try:
-                    self.launch_item(item["path"], item["type"])
-                    self.add_recent_item(name.split(" (")[0], item["path"], item.get("category", "General"), item["type"], timestamp)
-                except Exception as e:
-                    errors.append(f"Failed to open {name}: {str(e)}")
-        if errors:
-            self.show_notification("\n".join(errors), 5000)
-        self.clear_selection()
-        self.update_content()
-
-    def launch_item(self, path, item_type):
-        try:
-            if item_type == "app":
-                subprocess.Popen(path, shell=True)
-            else:
-                if path.startswith(("http://", "https://")):
-                    webbrowser.open(path)
-                else:
-                    os.startfile(path)
-            logging.info(f"Launched {item_type}: {path}")
-            self.show_notification(f"Launched {item_type}: {Path(path).name}", 2000)
-        except Exception as e:
-            logging.error(f"Failed to launch {path}: {str(e)}")
-            self.show_notification(f"Failed to launch {item_type}: {str(e)}.", 4000)
-
-    def add_recent_item(self, name, path, category, item_type, timestamp):
-        self.recent_items = [i for i in self.recent_items if not (i["name"] == name and i["type"] == item_type)]
-        self.recent_items.insert(0, {
-            "name": name,
-            "path": path,
-            "category": category,
-            "type": item_type,
-            "timestamp": timestamp,
-            "is_favorite": any(i["name"] == name and i["type"] == item_type and i.get("is_favorite", False) for i in self.pinned_items + self.links)
-        })
-        self.recent_items = self.recent_items[:50]
-        self.save_recent()
-        self.update_stats()
-
-    def pin_selected(self):
-        for name in self.selected_apps:
-            for category in self.apps:
-                if name in self.apps[category]:
-                    if not any(i["name"] == name and i["type"] == "app" for i in self.pinned_items):
-                        self.pinned_items.append({"name": name, "path": self.apps[category][name], "category": category, "type": "app", "is_favorite": False})
-        for name in self.selected_links:
-            link = next((l for l in self.links if l["name"] == name), None)
-            if link and not any(i["name"] == name and i["type"] == "link" for i in self.pinned_items):
-                self.pinned_items.append({"name": name, "path": link["url"], "category": link.get("category", "General"), "type": "link", "is_favorite": link.get("is_favorite", False)})
-        for name in self.selected_recent:
-            item = next((i for i in self.recent_items if i["name"] == name.split(" (")[0]), None)
-            if item and not any(i["name"] == name.split(" (")[0] and i["type"] == item["type"] for i in self.pinned_items):
-                self.pinned_items.append({"name": name.split(" (")[0], "path": item["path"], "category": item.get("category", "General"), "type": item["type"], "is_favorite": item.get("is_favorite", False)})
-        self.save_pinned()
-        self.update_content()
-        self.show_notification("Items pinned.", 2000)
-
-    def unpin_selected(self):
-        self.pinned_items = [item for item in self.pinned_items if item["name"] not in [n.split(" (")[0] for n in self.selected_pinned]]
-        self.save_pinned()
-        self.update_content()
-        self.show_notification("Items unpinned.", 2000)
-
-    def clear_selection(self):
-        self.content_list.clearSelection()
-        self.selected_apps.clear()
-        self.selected_links.clear()
-        self.selected_recent.clear()
-        self.selected_pinned.clear()
-        self.update_stats()
-
-    def add_link_popup(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Add Link")
-        dialog.setFixedSize(350, 240)
-        dialog.setStyleSheet(f"""
-            QDialog {{ background: {self.custom_colors['bg']}; border: 1px solid {self.custom_colors['accent']}; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }}
-            QLabel {{ color: {self.custom_colors['fg']}; font: bold 13px Inter; }}
-            QLineEdit {{ background: {self.custom_colors['pane']}; color: {self.custom_colors['fg']}; border: 1px solid {self.custom_colors['accent']}; border-radius: 8px; padding: 6px; font: 12px Inter; }}
-            QPushButton {{ background: {self.custom_colors['accent']}; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 12px Inter; }}
-            QPushButton:hover {{ background: #5a9bd4; }}
-        """)
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(12)
-        layout.addWidget(QLabel("Link Name:"))
-        name_entry = QLineEdit()
-        name_entry.setToolTip("Enter the name for the link")
-        layout.addWidget(name_entry)
-        layout.addWidget(QLabel("URL or Path:"))
-        url_entry = QLineEdit()
-        url_entry.setToolTip("Enter the URL or file path")
-        layout.addWidget(url_entry)
-        save_btn = QPushButton("Save")
-        save_btn.setToolTip("Save link")
-        save_btn.clicked.connect(lambda: self.save_link(dialog, name_entry.text(), url_entry.text(), "General"))
-        layout.addWidget(save_btn)
-        if self.enable_animations:
-            dialog.setProperty("opacity", 0.0)
-            dialog.show()
-            anim = QPropertyAnimation(dialog, b"opacity")
-            anim.setDuration(self.anim_speed)
-            anim.setStartValue(0.0)
-            anim.setEndValue(1.0)
-            anim.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
-            anim.start()
-        else:
-            dialog.exec_()
-
-    def save_link(self, dialog, name, url, category):
-        if not name.strip() or not url.strip():
-            self.show_notification("Please enter name and URL.", 3000)
-            return
-        if any(link["name"] == name.strip() for link in self.links):
-            self.show_notification("Link name already exists.", 3000)
-            return
-        self.links.append({"name": name.strip(), "url": url.strip(), "category": category, "is_favorite": False})
-        self.save_links()
-        self.update_content()
-        self.show_notification("Link added.", 2000)
-        dialog.accept()
-
-    def delete_selected(self):
-        if self.selected_links:
-            for link_name in self.selected_links.copy():
-                self.links = [link for link in self.links if link["name"] != link_name]
-                self.recent_items = [item for item in self.recent_items if item["name"] != link_name or item["type"] != "link"]
-                self.pinned_items = [item for item in self.pinned_items if item["name"] != link_name or item["type"] != "link"]
-            self.save_links()
-            self.save_recent()
-            self.save_pinned()
-            self.update_content()
-            self.show_notification("Links deleted.", 2000)
-
-    def edit_link_category(self):
-        if self.selected_links:
-            link_name = next(iter(self.selected_links))
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Edit Category")
-            dialog.setFixedSize(350, 200)
-            dialog.setStyleSheet(f"""
-                QDialog {{ background: {self.custom_colors['bg']}; border: 1px solid {self.custom_colors['accent']}; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }}
-                QLabel {{ color: {self.custom_colors['fg']}; font: bold 13px Inter; }}
-                QComboBox {{ background: {self.custom_colors['pane']}; color: {self.custom_colors['fg']}; border: 1px solid {self.custom_colors['accent']}; border-radius: 8px; padding: 6px; font: 12px Inter; }}
-                QPushButton {{ background: {self.custom_colors['accent']}; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 12px Inter; }}
-                QPushButton:hover {{ background: #5a9bd4; }}
-            """)
-            layout = QVBoxLayout(dialog)
-            layout.setSpacing(12)
-            layout.addWidget(QLabel("Category:"))
-            category_combo = QComboBox()
-            category_combo.addItems(["General"] + sorted({l.get("category", "General") for l in self.links}))
-            category_combo.setEditable(True)
-            category_combo.setToolTip("Select or enter a category")
-            layout.addWidget(category_combo)
-            save_btn = QPushButton("Save")
-            save_btn.setToolTip("Save category changes")
-            save_btn.clicked.connect(lambda: self.save_link_category(dialog, link_name, category_combo.currentText()))
-            layout.addWidget(save_btn)
-            if self.enable_animations:
-                dialog.setProperty("opacity", 0.0)
-                dialog.show()
-                anim = QPropertyAnimation(dialog, b"opacity")
-                anim.setDuration(self.anim_speed)
-                anim.setStartValue(0.0)
-                anim.setEndValue(1.0)
-                anim.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
-                anim.start()
-            else:
-                dialog.exec_()
-
-    def save_link_category(self, dialog, link_name, category):
-        try:
-            for link in self.links:
-                if link["name"] == link_name:
-                    link["category"] = category.strip() or "General"
-            for item in self.recent_items + self.pinned_items:
-                if item["name"] == link_name and item["type"] == "link":
-                    item["category"] = category.strip() or "General"
-            self.save_links()
-            self.save_recent()
-            self.save_pinned()
-            self.update_content()
-            self.show_notification(f"Category updated to {category}.", 2000)
-            dialog.accept()
-        except Exception as e:
-            logging.error(f"Failed to update category: {str(e)}")
-            self.show_notification(f"Error updating category: {str(e)}.", 3000)
-
-    def copy_link_url(self):
-        try:
-            if self.selected_links:
-                link = next((l for l in self.links if l["name"] in self.selected_links), None)
-                if link:
-                    QApplication.clipboard().setText(link["url"])
-                    self.show_notification("URL copied to clipboard.", 2000)
-        except Exception as e:
-            logging.error(f"Failed to copy URL: {str(e)}")
-            self.show_notification(f"Error copying URL: {str(e)}.", 3000)
-
-    def open_app_location(self):
-        try:
-            for name in self.selected_apps:
-                for category in self.apps:
-                    if name in self.apps[category]:
-                        path = self.apps[category][name]
-                        folder = str(Path(path).parent)
-                        subprocess.Popen(f'explorer.exe /select,"{path}"', shell=True)
-                        self.show_notification(f"Opened location for {name}.", 2000)
-                        break
-        except Exception as e:
-            logging.error(f"Failed to open app location: {str(e)}")
-            self.show_notification(f"Error opening location: {str(e)}.", 3000)
-
-    def clear_recent(self):
-        try:
-            self.recent_items = []
-            self.save_recent()
-            self.update_content()
-            self.show_notification("Recent items cleared.", 2000)
-        except Exception as e:
-            logging.error(f"Failed to clear recent items: {str(e)}")
-            self.show_notification(f"Error clearing recent items: {str(e)}.", 3000)
-
-    def refresh_apps(self):
-        try:
-            self.load_apps_async()
-            self.show_notification("Apps refreshed.", 2000)
-        except Exception as e:
-            logging.error(f"Failed to refresh apps: {str(e)}")
-            self.show_notification(f"Error refreshing apps: {str(e)}.", 3000)
-
-    def show_notification(self, message, duration=3000):
-        try:
-            self.notification_widget.show_message(message, duration)
-        except Exception as e:
-            logging.error(f"Failed to show notification: {str(e)}")
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton and self.title_bar.geometry().contains(event.pos()):
-            self.drag_pos = event.globalPos() - self.pos()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton and self.drag_pos is not None:
-            self.move(event.globalPos() - self.drag_pos)
-            event.accept()
-
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.drag_pos = None
-            event.accept()
-
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        try:
-            for url in event.mimeData().urls():
-                path = url.toLocalFile()
-                if path.lower().endswith(('.lnk', '.url')):
-                    name = Path(path).stem
-                    category = "Dropped"
-                    if path.lower().endswith('.url'):
-                        with open(path, 'r') as f:
-                            content = f.read()
-                            import re
-                            url_match = re.search(r'URL=(.+)', content)
-                            if url_match:
-                                self.links.append({"name": name, "url": url_match.group(1), "category": category, "is_favorite": False})
-                                self.save_links()
-                    else:
-                        self.add_recent_item(name, path, category, "app", datetime.now().isoformat())
-                    self.show_notification(f"Added {name}.", 2000)
-            self.update_content()
-        except Exception as e:
-            logging.error(f"Failed to process dropped item: {str(e)}")
-            self.show_notification(f"Error adding item: {str(e)}.", 3000)
-
-    def toggle_maximize(self):
-        if self.is_maximized:
-            self.showNormal()
-            self.is_maximized = False
-        else:
-            self.showMaximized()
-            self.is_maximized = True
-
-    def close_window(self):
-        if self.minimize_to_tray:
-            self.hide()
-        else:
-            QApplication.quit()
-
-    def closeEvent(self, event):
-        if self.minimize_to_tray:
-            event.ignore()
-            self.hide()
-        else:
-            event.accept()
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    launcher = AppLauncher()
-    launcher.show()
-    sys.exit(app.exec_())
+import sys
+import os
+from startup import profiler
+
+if __name__ == "__main__":
+    # Hand the command to a resident instance before paying for the Qt imports below.
+    from instance import forward_invocation
+    if forward_invocation(sys.argv[1:]):
+        sys.exit(0)
+
+import copy
+import json
+import subprocess
+import logging
+import hashlib
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+profiler.mark_import("stdlib")
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QFrame, QListView, QAbstractItemView, QLineEdit, QLabel, QComboBox,
+    QSpinBox, QSlider, QCheckBox, QDialog, QMenu, QAction, QColorDialog,
+    QTabWidget, QCompleter, QSystemTrayIcon, QToolButton, QStyledItemDelegate,
+    QProgressBar, QPlainTextEdit, QGraphicsOpacityEffect
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer,
+    QStringListModel, QPoint, QPointF, QRect, QRectF, QSortFilterProxyModel, QBuffer, QIODevice
+)
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QImage, QFont, QFontDatabase, QPainter, QBrush, QColor,
+    QStandardItem, QStandardItemModel, QPen, QPolygonF, QTextCursor
+)
+profiler.mark_import("PyQt5")
+from profiles import PROFILES_FILE, LoadThrottle, plan_waves, validate_profile
+from supervisor import ProcessSupervisor, open_document
+from procmon import ResourceMonitor
+from prewarm import PrewarmService, predict_launches
+from instance import instance_running, parse_command, server_name
+from catalog import TABS, best_match, catalog_entries, load_catalog, matches, save_catalog, scan_applications
+from metrics import METRICS_FILE, registry as metrics
+from sampler import CAPTURE_DIR, StackSampler
+from stalls import StallWatchdog
+from logconfig import LOG_LEVELS, LogPipeline
+from themes import ThemeEngine
+from motion import FrameGovernor
+from notices import NotificationBus
+from importer import import_paths, normalize_url, unique_name
+from bookmarks import BOOKMARKS_STATE_FILE, browser_profiles, diff_bookmarks, load_state, save_state
+from linkcheck import BROKEN, HEALTHY, REDIRECTED, LinkHealthCache, check_links
+from favicons import FaviconService, favicon_path, origin_of
+profiler.mark_import("launcher modules")
+
+# PIL, keyboard, pywin32, QtNetwork and the process table are imported on first use,
+# after the window is already on screen.
+
+
+@lru_cache(maxsize=None)
+def win32_shell():
+    """Return (shell, pythoncom) from pywin32, or None when it is not installed."""
+    try:
+        from win32com.shell import shell
+        import pythoncom
+    except ImportError:
+        return None
+    return shell, pythoncom
+
+def favicon_png(data, size=64):
+    """Re-encode a fetched favicon as PNG. Runs on the favicon thread, hence QImage rather than QPixmap."""
+    image = QImage()
+    if not image.loadFromData(data):
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+# Setup logging: records are queued here and written by a background listener; the level comes from settings.
+log_pipeline = LogPipeline()
+
+DEFAULT_SETTINGS = {
+    'theme': 'dark',
+    'colors': {
+        'bg': '#1e1e1e', 'fg': '#dcdcdc', 'accent': '#4682b4',
+        'pane': '#252525', 'list_text': '#dcdcdc', 'list_bg': '#252525'
+    },
+    'font': {'family': 'Inter', 'size': 12},
+    'anim_speed': 250,
+    'anim_curve': 'InOutQuad',
+    'icon_size': 32,
+    'border_radius': 8,
+    'grid_columns': 4,
+    'minimize_to_tray': True,
+    'show_tray_icon': True,
+    'enable_animations': True,
+    'reduce_motion': False,
+    'hotkey': 'ctrl+alt+q',
+    'cache_limit': 100,
+    'monitor_interval': 1000,
+    'focus_existing': True,
+    'prewarm': False,
+    'prewarm_budget': 256,
+    'favicons': False,
+    'instant_summon': True,
+    'metrics': False,
+    'metrics_interval': 30,
+    'profile_seconds': 10,
+    'stall_threshold': 50,
+    'log_level': 'INFO',
+    'log_json': False
+}
+# Subsystems to refresh when a setting changes; settings not listed here only need saving.
+SETTING_EFFECTS = {
+    'theme': ('styles',), 'colors': ('styles',), 'font': ('styles', 'item_fonts'),
+    'icon_size': ('delegate',), 'border_radius': ('delegate',), 'grid_columns': ('grid',),
+    'show_tray_icon': ('tray',), 'hotkey': ('hotkey',), 'cache_limit': ('icon_cache',),
+    'monitor_interval': ('monitor',), 'focus_existing': ('process_table',),
+    'prewarm': ('prewarm',), 'prewarm_budget': ('prewarm',), 'favicons': ('favicons',),
+    'metrics': ('metrics',), 'metrics_interval': ('metrics',), 'stall_threshold': ('watchdog',),
+    'log_level': ('logging',), 'log_json': ('logging',)
+}
+# Settings stored on AppLauncher under a different attribute name.
+SETTING_ATTRS = {'theme': 'theme_mode', 'colors': 'custom_colors', 'font': 'font_settings', 'prewarm': 'prewarm_enabled', 'metrics': 'metrics_enabled',
+                 'favicons': 'favicons_enabled'}
+
+# Rows built synchronously by update_content; enough to fill the view at any supported size.
+FIRST_CHUNK_ROWS = 100
+# Rows appended per idle-time batch after that.
+RENDER_CHUNK_ROWS = 500
+# Time an idle-time batch may spend before handing the event loop back.
+IDLE_SLICE_SECONDS = 0.008
+# How often a budgeted batch checks the clock, in rows.
+BUDGET_CHECK_ROWS = 32
+
+# Plain-string role holding the name selections are tracked by, cheaper to read than the UserRole dict.
+ITEM_ID_ROLE = Qt.UserRole + 1
+# Last link check result for link rows: "healthy", "redirected", "broken" or "skipped".
+HEALTH_ROLE = Qt.UserRole + 2
+HEALTH_COLORS = {HEALTHY: QColor(80, 200, 120), REDIRECTED: QColor(255, 179, 0), BROKEN: QColor(229, 57, 53)}
+
+class AppItem(QStandardItem):
+    """Custom item for apps/links/recent/pinned with icon and metadata."""
+    def __init__(self, name, path, category, item_type, icon=None, font=None, is_favorite=False, item_id=None):
+        super().__init__(name)
+        self.setData({"name": name, "path": path, "category": category, "type": item_type, "is_favorite": is_favorite}, Qt.UserRole)
+        self.setData(item_id or name, ITEM_ID_ROLE)
+        self.setIcon(icon or QIcon())
+        self.setFont(font or QFont("Inter", 12))
+        self.setEditable(False)
+
+class CustomItemDelegate(QStyledItemDelegate):
+    """Custom delegate for rendering list/grid/compact items with modern effects."""
+    def __init__(self, view_mode="list", icon_size=32, border_radius=8, parent=None, monitor=None):
+        super().__init__(parent)
+        self.view_mode = view_mode
+        self.icon_size = icon_size
+        self.border_radius = border_radius
+        self.monitor = monitor
+
+    def paint_sparkline(self, painter, rect, path):
+        series = self.monitor.series(path) if self.monitor else None
+        if not series or not series[0].count:
+            return
+        cpu, rss = series
+        values = cpu.values()
+        spark = QRectF(rect.right() - 150, rect.top() + 12, 60, rect.height() - 24)
+        peak = max(max(values), 100.0)
+        step = spark.width() / max(cpu.capacity - 1, 1)
+        offset = spark.width() - step * (len(values) - 1)
+        points = [QPointF(spark.left() + offset + i * step, spark.bottom() - v / peak * spark.height()) for i, v in enumerate(values)]
+        painter.setPen(QPen(QColor(0, 229, 255), 1.5))
+        painter.drawPolyline(QPolygonF(points))
+        painter.setPen(QColor(160, 160, 160))
+        painter.setFont(QFont("Inter", 8))
+        painter.drawText(QRectF(spark.right() + 4, rect.top(), 80, rect.height()), Qt.AlignVCenter | Qt.AlignLeft,
+                         f"{cpu.latest():.0f}% {rss.latest():.0f}MB")
+
+    def paint_health(self, painter, x, y, index):
+        """Dot at (x, y), the icon's bottom-right corner, colored by the link's last check."""
+        color = HEALTH_COLORS.get(index.data(HEALTH_ROLE))
+        if color is None:
+            return
+        painter.setBrush(QBrush(color))
+        painter.setPen(QPen(QColor(30, 30, 30), 1.5))
+        painter.drawEllipse(QPointF(x - 4, y - 4), 4.5, 4.5)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect
+        data = index.data(Qt.UserRole)
+        if not data:
+            painter.restore()
+            return super().paint(painter, option, index)
+
+        # Card-like background with hover/selection effects
+        if option.state & option.widget.style().State_Selected:
+            painter.setBrush(QBrush(QColor(30, 144, 255)))
+            painter.setPen(QPen(QColor(100, 149, 237), 1))
+        elif option.state & option.widget.style().State_MouseOver:
+            painter.setBrush(QBrush(QColor(50, 50, 50)))
+            painter.setPen(QPen(QColor(100, 100, 100), 1))
+        else:
+            painter.setBrush(QBrush(QColor(30, 30, 30)))
+            painter.setPen(Qt.NoPen)
+
+        if self.view_mode == "grid":
+            painter.drawRoundedRect(rect.adjusted(6, 6, -6, -6), self.border_radius, self.border_radius)
+            icon = index.data(Qt.DecorationRole)
+            if icon:
+                painter.drawPixmap(rect.left() + (rect.width() - self.icon_size) // 2, rect.top() + 10, icon.pixmap(QSize(self.icon_size, self.icon_size)))
+            self.paint_health(painter, rect.left() + (rect.width() + self.icon_size) // 2, rect.top() + 10 + self.icon_size, index)
+            painter.setPen(QColor(220, 220, 220))
+            painter.setFont(QFont("Inter", 11, QFont.Bold))
+            painter.drawText(rect.adjusted(8, self.icon_size + 20, -8, -8), Qt.AlignTop | Qt.AlignHCenter | Qt.TextWordWrap, data["name"])
+            if data["is_favorite"]:
+                painter.setPen(QColor(255, 215, 0))
+                painter.drawText(rect.adjusted(8, 10, -8, -8), Qt.AlignTop | Qt.AlignLeft, "★")
+            if data["type"] != "app":
+                badge_rect = QRect(rect.right() - 34, rect.top() + 10, 24, 16)
+                painter.setBrush(QBrush(QColor(30, 144, 255)))
+                painter.drawRoundedRect(badge_rect, 6, 6)
+                painter.setPen(QColor(255, 255, 255))
+                painter.setFont(QFont("Inter", 8))
+                painter.drawText(badge_rect, Qt.AlignCenter, data["type"].upper())
+        elif self.view_mode == "list":
+            painter.drawRoundedRect(rect.adjusted(4, 4, -4, -4), self.border_radius, self.border_radius)
+            icon = index.data(Qt.DecorationRole)
+            if icon:
+                painter.drawPixmap(rect.left() + 10, rect.top() + (rect.height() - self.icon_size) // 2, icon.pixmap(QSize(self.icon_size, self.icon_size)))
+            self.paint_health(painter, rect.left() + 10 + self.icon_size, rect.top() + (rect.height() + self.icon_size) // 2, index)
+            painter.setPen(QColor(220, 220, 220))
+            painter.setFont(QFont("Inter", 12))
+            painter.drawText(rect.adjusted(self.icon_size + 15, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, data["name"])
+            self.paint_sparkline(painter, rect, data["path"])
+            if data["is_favorite"]:
+                painter.setPen(QColor(255, 215, 0))
+                painter.drawText(rect.adjusted(10, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, "★")
+            if data["type"] != "app":
+                painter.setFont(QFont("Inter", 9))
+                painter.drawText(rect.adjusted(self.icon_size + 15, 0, -8, 0), Qt.AlignVCenter | Qt.AlignRight, data["type"].upper())
+        else:  # compact
+            painter.drawRoundedRect(rect.adjusted(4, 4, -4, -4), self.border_radius, self.border_radius)
+            icon = index.data(Qt.DecorationRole)
+            if icon:
+                painter.drawPixmap(rect.left() + 8, rect.top() + (rect.height() - self.icon_size) // 2, icon.pixmap(QSize(self.icon_size, self.icon_size)))
+            self.paint_health(painter, rect.left() + 8 + self.icon_size, rect.top() + (rect.height() + self.icon_size) // 2, index)
+            painter.setPen(QColor(220, 220, 220))
+            painter.setFont(QFont("Inter", 11))
+            painter.drawText(rect.adjusted(self.icon_size + 10, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, data["name"])
+            self.paint_sparkline(painter, rect, data["path"])
+            if data["is_favorite"]:
+                painter.setPen(QColor(255, 215, 0))
+                painter.drawText(rect.adjusted(8, 0, -8, 0), Qt.AlignVCenter | Qt.AlignLeft, "★")
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        if self.view_mode == "grid":
+            return QSize(160, 160)
+        elif self.view_mode == "list":
+            return QSize(100, 56)
+        else:  # compact
+            return QSize(100, 40)
+
+class AppLoaderThread(QThread):
+    appsLoaded = pyqtSignal(dict)
+    statusUpdate = pyqtSignal(str)
+    progressUpdate = pyqtSignal(int)
+    errorSignal = pyqtSignal(str)
+
+    def __init__(self, paths=None, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+
+    def run(self):
+        try:
+            started = time.perf_counter()
+            apps = scan_applications(self.paths, self.progressUpdate.emit)
+            metrics.observe("catalog_scan_seconds", time.perf_counter() - started)
+            self.appsLoaded.emit(apps)
+            self.statusUpdate.emit("Ready")
+        except Exception as e:
+            self.errorSignal.emit(f"Failed to load apps: {str(e)}")
+
+class ImportThread(QThread):
+    """Parses dropped files and folders off the GUI thread; the launcher commits the result."""
+    progressUpdate = pyqtSignal(int)
+    importFinished = pyqtSignal(object)
+    errorSignal = pyqtSignal(str)
+
+    def __init__(self, paths, known_urls, known_app_paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+        self.known_urls = known_urls
+        self.known_app_paths = known_app_paths
+
+    def run(self):
+        try:
+            result = import_paths(self.paths, self.known_urls, self.known_app_paths,
+                                  progress=self.progressUpdate.emit, cancelled=self.isInterruptionRequested)
+            self.importFinished.emit(result)
+        except Exception as e:
+            self.errorSignal.emit(f"Import failed: {str(e)}")
+
+class BookmarkImportThread(QThread):
+    """Reads browser bookmark files and diffs them against the last import off the GUI thread."""
+    progressUpdate = pyqtSignal(int)
+    importFinished = pyqtSignal(object)
+    errorSignal = pyqtSignal(str)
+
+    def __init__(self, sources=None, parent=None):
+        super().__init__(parent)
+        self.sources = sources
+
+    def run(self):
+        try:
+            sources = self.sources if self.sources is not None else browser_profiles()
+            self.importFinished.emit(diff_bookmarks(sources, load_state(), self.progressUpdate.emit))
+        except Exception as e:
+            self.errorSignal.emit(f"Bookmark import failed: {str(e)}")
+
+class LinkCheckThread(QThread):
+    """Checks link health on an asyncio loop of its own, reporting results in batches."""
+    linksChecked = pyqtSignal(dict)
+    checkFinished = pyqtSignal(dict)
+    errorSignal = pyqtSignal(str)
+
+    def __init__(self, urls, cache, parent=None):
+        super().__init__(parent)
+        self.urls = urls
+        self.cache = cache
+
+    def run(self):
+        batch = {}
+        last_emit = time.monotonic()
+
+        def on_result(url, status, detail):
+            nonlocal last_emit
+            batch[url] = (status, detail)
+            # Batched so thousands of results cost the GUI a few model passes, not one each.
+            if len(batch) >= 200 or time.monotonic() - last_emit > 0.25:
+                self.linksChecked.emit(dict(batch))
+                batch.clear()
+                last_emit = time.monotonic()
+
+        try:
+            started = time.perf_counter()
+            results = check_links(self.urls, self.cache, on_result)
+            metrics.observe("link_check_seconds", time.perf_counter() - started)
+            if batch:
+                self.linksChecked.emit(dict(batch))
+            with metrics.time("persist_write_seconds", file=self.cache.path):
+                self.cache.save()
+            self.checkFinished.emit(results)
+        except Exception as e:
+            self.errorSignal.emit(f"Link check failed: {str(e)}")
+
+class ContentListView(QListView):
+    """QListView that reports how long each paint takes to a FrameGovernor."""
+    # Emitted before Select All, so rows still queued for rendering can be added first.
+    rowsNeeded = pyqtSignal()
+
+    def __init__(self, governor, parent=None):
+        super().__init__(parent)
+        self.governor = governor
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        super().paintEvent(event)
+        self.governor.record(time.perf_counter() - started)
+
+    def selectAll(self):
+        self.rowsNeeded.emit()
+        super().selectAll()
+
+class NotificationWidget(QWidget):
+    clicked = pyqtSignal()
+
+    def __init__(self, parent=None, animation_duration=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
+        self.animation_duration = animation_duration
+        self.layout = QVBoxLayout(self)
+        self.label = QLabel("")
+        self.layout.addWidget(self.label)
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.hide)
+        self.fade = QPropertyAnimation(self, b"windowOpacity", self)
+        self.fade.setStartValue(0.0)
+        self.fade.setEndValue(1.0)
+        self.fade.setEasingCurve(QEasingCurve.InOutQuad)
+
+    def show_message(self, message, duration=3000):
+        self.label.setText(message)
+        self.adjustSize()
+        screen = QApplication.primaryScreen().geometry()
+        pos = screen.bottomRight() - QPoint(self.width() + 20, self.height() + 20)
+        self.move(pos)
+        fade_ms = self.animation_duration(200) if self.animation_duration else 200
+        self.fade.stop()
+        self.setWindowOpacity(0.0 if fade_ms else 1.0)
+        self.show()
+        if fade_ms:
+            self.fade.setDuration(fade_ms)
+            self.fade.start()
+        self.timer.start(duration)
+
+    def mousePressEvent(self, event):
+        self.hide()
+        self.clicked.emit()
+
+class SettingsDialog(QDialog):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.setWindowTitle("Settings")
+        self.setFixedSize(400, 550)
+        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        self.setStyleSheet(parent.theme.dialog)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(10)
+
+        title_label = QLabel("Settings")
+        title_label.setStyleSheet(parent.theme.title)
+        layout.addWidget(title_label)
+
+        tabs = QTabWidget()
+        layout.addWidget(tabs)
+
+        # Appearance Tab
+        appearance_widget = QWidget()
+        appearance_layout = QVBoxLayout(appearance_widget)
+        appearance_layout.setSpacing(8)
+
+        appearance_layout.addWidget(QLabel("Theme:"))
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(["Dark", "Light", "High Contrast", "Custom"])
+        self.theme_combo.setCurrentText(self.parent.theme_mode.capitalize())
+        self.theme_combo.currentTextChanged.connect(self.on_theme_change)
+        appearance_layout.addWidget(self.theme_combo)
+
+        appearance_layout.addWidget(QLabel("Background Color:"))
+        self.bg_color_btn = QPushButton("Pick Color")
+        self.bg_color_btn.clicked.connect(self.pick_bg_color)
+        appearance_layout.addWidget(self.bg_color_btn)
+
+        appearance_layout.addWidget(QLabel("Accent Color:"))
+        self.accent_color_btn = QPushButton("Pick Color")
+        self.accent_color_btn.clicked.connect(self.pick_accent_color)
+        appearance_layout.addWidget(self.accent_color_btn)
+
+        appearance_layout.addWidget(QLabel("Font Size:"))
+        self.font_size = QSpinBox()
+        self.font_size.setRange(8, 18)
+        self.font_size.setValue(self.parent.font_settings['size'])
+        self.font_size.valueChanged.connect(self.on_font_size_change)
+        appearance_layout.addWidget(self.font_size)
+
+        appearance_layout.addWidget(QLabel("Icon Size:"))
+        self.icon_size = QSpinBox()
+        self.icon_size.setRange(16, 128)
+        self.icon_size.setValue(self.parent.icon_size)
+        self.icon_size.valueChanged.connect(self.on_icon_size_change)
+        appearance_layout.addWidget(self.icon_size)
+
+        appearance_layout.addWidget(QLabel("Border Radius:"))
+        self.border_radius = QSpinBox()
+        self.border_radius.setRange(4, 16)
+        self.border_radius.setValue(self.parent.border_radius)
+        self.border_radius.valueChanged.connect(self.on_border_radius_change)
+        appearance_layout.addWidget(self.border_radius)
+
+        tabs.addTab(appearance_widget, "Appearance")
+
+        # Behavior Tab
+        behavior_widget = QWidget()
+        behavior_layout = QVBoxLayout(behavior_widget)
+        behavior_layout.setSpacing(8)
+
+        behavior_layout.addWidget(QLabel("Animation Speed (ms):"))
+        self.anim_speed = QSlider(Qt.Horizontal)
+        self.anim_speed.setRange(0, 500)
+        self.anim_speed.setValue(self.parent.anim_speed)
+        self.anim_speed.valueChanged.connect(self.on_anim_speed_change)
+        behavior_layout.addWidget(self.anim_speed)
+
+        behavior_layout.addWidget(QLabel("Animation Curve:"))
+        self.anim_curve = QComboBox()
+        self.anim_curve.addItems(["InOutQuad", "InOutCubic", "Linear", "OutBounce"])
+        self.anim_curve.setCurrentText(self.parent.anim_curve)
+        self.anim_curve.currentTextChanged.connect(self.on_anim_curve_change)
+        behavior_layout.addWidget(self.anim_curve)
+
+        behavior_layout.addWidget(QLabel("Grid Columns:"))
+        self.grid_columns = QSpinBox()
+        self.grid_columns.setRange(2, 8)
+        self.grid_columns.setValue(self.parent.grid_columns)
+        self.grid_columns.valueChanged.connect(self.on_grid_columns_change)
+        behavior_layout.addWidget(self.grid_columns)
+
+        self.minimize_to_tray = QCheckBox("Minimize to System Tray")
+        self.minimize_to_tray.setChecked(self.parent.minimize_to_tray)
+        self.minimize_to_tray.stateChanged.connect(self.on_minimize_to_tray_change)
+        behavior_layout.addWidget(self.minimize_to_tray)
+
+        self.show_tray_icon = QCheckBox("Show System Tray Icon")
+        self.show_tray_icon.setChecked(self.parent.show_tray_icon)
+        self.show_tray_icon.stateChanged.connect(self.on_show_tray_icon_change)
+        behavior_layout.addWidget(self.show_tray_icon)
+
+        self.enable_animations = QCheckBox("Enable Animations")
+        self.enable_animations.setChecked(self.parent.enable_animations)
+        self.enable_animations.stateChanged.connect(self.on_enable_animations_change)
+        behavior_layout.addWidget(self.enable_animations)
+
+        self.reduce_motion = QCheckBox("Reduce Motion")
+        self.reduce_motion.setToolTip("Skip tab and dialog animations")
+        self.reduce_motion.setChecked(self.parent.reduce_motion)
+        self.reduce_motion.stateChanged.connect(self.on_reduce_motion_change)
+        behavior_layout.addWidget(self.reduce_motion)
+
+        self.focus_existing = QCheckBox("Focus Running Instance Instead of Relaunching")
+        self.focus_existing.setChecked(self.parent.focus_existing)
+        self.focus_existing.stateChanged.connect(self.on_focus_existing_change)
+        behavior_layout.addWidget(self.focus_existing)
+
+        self.instant_summon = QCheckBox("Instant Summon (keep hidden window ready)")
+        self.instant_summon.setChecked(self.parent.instant_summon)
+        self.instant_summon.setToolTip("Keep the list built and laid out while hidden so the hotkey shows it immediately")
+        self.instant_summon.stateChanged.connect(self.on_instant_summon_change)
+        behavior_layout.addWidget(self.instant_summon)
+
+        self.prewarm = QCheckBox("Prewarm Frequently Launched Apps")
+        self.prewarm.setChecked(self.parent.prewarm_enabled)
+        self.prewarm.setToolTip("Preload likely next launches into the disk cache in the background")
+        self.prewarm.stateChanged.connect(self.on_prewarm_change)
+        behavior_layout.addWidget(self.prewarm)
+
+        self.favicons = QCheckBox("Show Website Icons for Links")
+        self.favicons.setChecked(self.parent.favicons_enabled)
+        self.favicons.setToolTip("Fetch each site's favicon once in the background and keep it in the icon cache")
+        self.favicons.stateChanged.connect(self.on_favicons_change)
+        behavior_layout.addWidget(self.favicons)
+
+        tabs.addTab(behavior_widget, "Behavior")
+
+        # Advanced Tab
+        advanced_widget = QWidget()
+        advanced_layout = QVBoxLayout(advanced_widget)
+        advanced_layout.setSpacing(8)
+
+        advanced_layout.addWidget(QLabel("Global Hotkey:"))
+        self.hotkey_input = QLineEdit()
+        self.hotkey_input.setPlaceholderText("e.g., ctrl+alt+q")
+        self.hotkey_input.setText(self.parent.hotkey)
+        # Registered when editing finishes, not per keystroke, so partial combos are never bound.
+        self.hotkey_input.editingFinished.connect(lambda: self.on_hotkey_change(self.hotkey_input.text()))
+        self.parent.hotkeyReverted.connect(self.hotkey_input.setText)
+        advanced_layout.addWidget(self.hotkey_input)
+
+        advanced_layout.addWidget(QLabel("Cache Size Limit (MB):"))
+        self.cache_limit = QSpinBox()
+        self.cache_limit.setRange(10, 1000)
+        self.cache_limit.setValue(self.parent.cache_limit)
+        self.cache_limit.valueChanged.connect(self.on_cache_limit_change)
+        advanced_layout.addWidget(self.cache_limit)
+
+        advanced_layout.addWidget(QLabel("Resource Sample Interval (ms):"))
+        self.monitor_interval = QSpinBox()
+        self.monitor_interval.setRange(250, 10000)
+        self.monitor_interval.setSingleStep(250)
+        self.monitor_interval.setValue(self.parent.monitor_interval)
+        self.monitor_interval.valueChanged.connect(self.on_monitor_interval_change)
+        advanced_layout.addWidget(self.monitor_interval)
+
+        advanced_layout.addWidget(QLabel("Prewarm Memory Budget (MB):"))
+        self.prewarm_budget = QSpinBox()
+        self.prewarm_budget.setRange(32, 2048)
+        self.prewarm_budget.setSingleStep(32)
+        self.prewarm_budget.setValue(self.parent.prewarm_budget)
+        self.prewarm_budget.valueChanged.connect(self.on_prewarm_budget_change)
+        advanced_layout.addWidget(self.prewarm_budget)
+
+        reset_btn = QPushButton("Reset to Defaults")
+        reset_btn.clicked.connect(self.reset_settings)
+        advanced_layout.addWidget(reset_btn)
+
+        tabs.addTab(advanced_widget, "Advanced")
+
+        # Debug Tab
+        debug_widget = QWidget()
+        debug_layout = QVBoxLayout(debug_widget)
+        debug_layout.setSpacing(8)
+
+        self.metrics_enabled = QCheckBox("Record Latency Metrics")
+        self.metrics_enabled.setChecked(self.parent.metrics_enabled)
+        self.metrics_enabled.setToolTip(f"Time search, rendering, icons, saves, scans and launches; exported to {METRICS_FILE}")
+        self.metrics_enabled.stateChanged.connect(self.on_metrics_change)
+        debug_layout.addWidget(self.metrics_enabled)
+
+        debug_layout.addWidget(QLabel("Metrics Export Interval (s):"))
+        self.metrics_interval = QSpinBox()
+        self.metrics_interval.setRange(5, 3600)
+        self.metrics_interval.setValue(self.parent.metrics_interval)
+        self.metrics_interval.valueChanged.connect(self.on_metrics_interval_change)
+        debug_layout.addWidget(self.metrics_interval)
+
+        self.metrics_view = QPlainTextEdit()
+        self.metrics_view.setReadOnly(True)
+        self.metrics_view.setStyleSheet("font: 11px monospace;")
+        debug_layout.addWidget(self.metrics_view)
+
+        metrics_buttons = QHBoxLayout()
+        refresh_metrics_btn = QPushButton("Refresh")
+        refresh_metrics_btn.clicked.connect(self.refresh_metrics_view)
+        metrics_buttons.addWidget(refresh_metrics_btn)
+        export_metrics_btn = QPushButton("Export Now")
+        export_metrics_btn.clicked.connect(self.export_metrics)
+        metrics_buttons.addWidget(export_metrics_btn)
+        reset_metrics_btn = QPushButton("Clear")
+        reset_metrics_btn.clicked.connect(self.clear_metrics)
+        metrics_buttons.addWidget(reset_metrics_btn)
+        debug_layout.addLayout(metrics_buttons)
+        self.refresh_metrics_view()
+
+        debug_layout.addWidget(QLabel("Profile Capture Duration (s):"))
+        self.profile_seconds = QSpinBox()
+        self.profile_seconds.setRange(1, 120)
+        self.profile_seconds.setValue(self.parent.profile_seconds)
+        self.profile_seconds.valueChanged.connect(self.on_profile_seconds_change)
+        debug_layout.addWidget(self.profile_seconds)
+
+        self.profile_btn = QPushButton("Stop Profile Capture" if self.parent.profile_capturing() else "Capture Profile")
+        self.profile_btn.setToolTip(f"Sample all thread stacks into {CAPTURE_DIR}/ for flame graphs (Ctrl+Shift+P)")
+        self.profile_btn.clicked.connect(self.on_profile_capture)
+        debug_layout.addWidget(self.profile_btn)
+
+        debug_layout.addWidget(QLabel("Event Loop Stall Threshold (ms):"))
+        self.stall_threshold = QSpinBox()
+        self.stall_threshold.setRange(20, 2000)
+        self.stall_threshold.setSingleStep(10)
+        self.stall_threshold.setValue(self.parent.stall_threshold)
+        self.stall_threshold.valueChanged.connect(self.on_stall_threshold_change)
+        debug_layout.addWidget(self.stall_threshold)
+
+        debug_layout.addWidget(QLabel("Log Level:"))
+        self.log_level = QComboBox()
+        self.log_level.addItems(LOG_LEVELS)
+        self.log_level.setCurrentText(self.parent.log_level)
+        self.log_level.currentTextChanged.connect(self.on_log_level_change)
+        debug_layout.addWidget(self.log_level)
+
+        self.log_json = QCheckBox("Write Log as JSON Lines")
+        self.log_json.setChecked(self.parent.log_json)
+        self.log_json.stateChanged.connect(self.on_log_json_change)
+        debug_layout.addWidget(self.log_json)
+
+        tabs.addTab(debug_widget, "Debug")
+
+        close_btn = QPushButton("Close")
+        close_btn.setToolTip("Close settings")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+
+    def pick_bg_color(self):
+        color = QColorDialog.getColor(QColor(self.parent.theme.colors['bg']), self)
+        if color.isValid():
+            self.parent.apply_settings({'colors': {**self.parent.theme.colors, 'bg': color.name()}, 'theme': "custom"})
+            self.theme_combo.setCurrentText("Custom")
+            self.parent.show_notification("Background color updated.", 2000)
+
+    def pick_accent_color(self):
+        color = QColorDialog.getColor(QColor(self.parent.theme.colors['accent']), self)
+        if color.isValid():
+            self.parent.apply_settings({'colors': {**self.parent.theme.colors, 'accent': color.name()}, 'theme': "custom"})
+            self.theme_combo.setCurrentText("Custom")
+            self.parent.show_notification("Accent color updated.", 2000)
+
+    def on_theme_change(self, theme):
+        try:
+            self.parent.change_theme(theme)
+            self.parent.show_notification(f"Theme changed to {theme}.", 2000)
+        except Exception as e:
+            logging.error(f"Theme change failed: {str(e)}")
+            self.parent.show_notification("Error changing theme.", 3000)
+
+    def on_font_size_change(self, size):
+        try:
+            self.parent.change_font_size(size)
+            self.parent.show_notification(f"Font size changed to {size}.", 2000)
+        except Exception as e:
+            logging.error(f"Font size change failed: {str(e)}")
+            self.parent.show_notification("Error changing font size.", 3000)
+
+    def on_icon_size_change(self, size):
+        try:
+            self.parent.change_icon_size(size)
+            self.parent.show_notification(f"Icon size changed to {size}.", 2000)
+        except Exception as e:
+            logging.error(f"Icon size change failed: {str(e)}")
+            self.parent.show_notification("Error changing icon size.", 3000)
+
+    def on_border_radius_change(self, radius):
+        try:
+            self.parent.change_border_radius(radius)
+            self.parent.show_notification(f"Border radius changed to {radius}.", 2000)
+        except Exception as e:
+            logging.error(f"Border radius change failed: {str(e)}")
+            self.parent.show_notification("Error changing border radius.", 3000)
+
+    def on_anim_speed_change(self, speed):
+        try:
+            self.parent.change_anim_speed(speed)
+            self.parent.show_notification(f"Animation speed set to {speed}ms.", 2000)
+        except Exception as e:
+            logging.error(f"Animation speed change failed: {str(e)}")
+            self.parent.show_notification("Error changing animation speed.", 3000)
+
+    def on_anim_curve_change(self, curve):
+        try:
+            self.parent.change_anim_curve(curve)
+            self.parent.show_notification(f"Animation curve set to {curve}.", 2000)
+        except Exception as e:
+            logging.error(f"Animation curve change failed: {str(e)}")
+            self.parent.show_notification("Error changing animation curve.", 3000)
+
+    def on_grid_columns_change(self, columns):
+        try:
+            self.parent.change_grid_columns(columns)
+            self.parent.show_notification(f"Grid columns set to {columns}.", 2000)
+        except Exception as e:
+            logging.error(f"Grid columns change failed: {str(e)}")
+            self.parent.show_notification("Error changing grid columns.", 3000)
+
+    def on_hotkey_change(self, hotkey):
+        try:
+            self.parent.set_hotkey(hotkey.strip())
+            self.parent.show_notification(f"Hotkey set to {hotkey}.", 2000)
+        except Exception as e:
+            logging.error(f"Hotkey change failed: {str(e)}")
+            self.parent.show_notification("Error changing hotkey.", 3000)
+
+    def on_minimize_to_tray_change(self, state):
+        try:
+            self.parent.apply_settings({'minimize_to_tray': bool(state)})
+            self.parent.show_notification(f"Minimize to tray {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Minimize to tray toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling minimize to tray.", 3000)
+
+    def on_show_tray_icon_change(self, state):
+        try:
+            self.parent.apply_settings({'show_tray_icon': bool(state)})
+            self.parent.show_notification(f"System tray icon {'shown' if state else 'hidden'}.", 2000)
+        except Exception as e:
+            logging.error(f"Show tray icon toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling tray icon.", 3000)
+
+    def on_enable_animations_change(self, state):
+        try:
+            self.parent.apply_settings({'enable_animations': bool(state)})
+            self.parent.show_notification(f"Animations {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Enable animations toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling animations.", 3000)
+
+    def on_reduce_motion_change(self, state):
+        try:
+            self.parent.apply_settings({'reduce_motion': bool(state)})
+            self.parent.show_notification(f"Reduce motion {'on' if state else 'off'}.", 2000)
+        except Exception as e:
+            logging.error(f"Reduce motion toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling reduce motion.", 3000)
+
+    def on_focus_existing_change(self, state):
+        try:
+            self.parent.apply_settings({'focus_existing': bool(state)})
+            self.parent.show_notification(f"Focus running instances {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Focus existing toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling focus running instances.", 3000)
+
+    def on_instant_summon_change(self, state):
+        try:
+            self.parent.apply_settings({'instant_summon': bool(state)})
+            self.parent.show_notification(f"Instant summon {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Instant summon toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling instant summon.", 3000)
+
+    def on_prewarm_change(self, state):
+        try:
+            self.parent.apply_settings({'prewarm': bool(state)})
+            self.parent.show_notification(f"App prewarming {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Prewarm toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling app prewarming.", 3000)
+
+    def on_favicons_change(self, state):
+        try:
+            self.parent.apply_settings({'favicons': bool(state)})
+            self.parent.show_notification(f"Website icons {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Favicon toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling website icons.", 3000)
+
+    def on_prewarm_budget_change(self, budget):
+        try:
+            self.parent.apply_settings({'prewarm_budget': budget})
+            self.parent.show_notification(f"Prewarm budget set to {budget}MB.", 2000)
+        except Exception as e:
+            logging.error(f"Prewarm budget change failed: {str(e)}")
+            self.parent.show_notification("Error changing prewarm budget.", 3000)
+
+    def on_cache_limit_change(self, limit):
+        try:
+            self.parent.change_cache_limit(limit)
+            self.parent.show_notification(f"Cache limit set to {limit}MB.", 2000)
+        except Exception as e:
+            logging.error(f"Cache limit change failed: {str(e)}")
+            self.parent.show_notification("Error changing cache limit.", 3000)
+
+    def on_monitor_interval_change(self, interval):
+        try:
+            self.parent.change_monitor_interval(interval)
+            self.parent.show_notification(f"Resource sample interval set to {interval}ms.", 2000)
+        except Exception as e:
+            logging.error(f"Monitor interval change failed: {str(e)}")
+            self.parent.show_notification("Error changing resource sample interval.", 3000)
+
+    def on_metrics_change(self, state):
+        try:
+            self.parent.apply_settings({'metrics': bool(state)})
+            self.refresh_metrics_view()
+            self.parent.show_notification(f"Latency metrics {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Metrics toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling latency metrics.", 3000)
+
+    def on_metrics_interval_change(self, interval):
+        try:
+            self.parent.apply_settings({'metrics_interval': interval})
+            self.parent.show_notification(f"Metrics export interval set to {interval}s.", 2000)
+        except Exception as e:
+            logging.error(f"Metrics interval change failed: {str(e)}")
+            self.parent.show_notification("Error changing metrics export interval.", 3000)
+
+    def refresh_metrics_view(self):
+        rows = metrics.summary()
+        if rows:
+            lines = [f"{'metric':<34}{'count':>7}{'avg':>9}{'p50':>9}{'p95':>9}"]
+            for name, labels, count, mean, p50, p95 in rows:
+                label = name.replace("_seconds", "") + "".join(f" {v}" for v in labels.values())
+                lines.append(f"{label:<34}{count:>7}{mean * 1000:>8.2f}m{p50 * 1000:>8.2f}m{p95 * 1000:>8.2f}m")
+        else:
+            lines = ["No samples yet." if self.parent.metrics_enabled else "Metrics are disabled."]
+        stalls = self.parent.watchdog.summary()
+        if stalls:
+            lines.append("")
+            lines.append(f"{'stall site':<50}{'count':>7}{'total':>9}{'max':>9}")
+            for site, count, total, worst in stalls:
+                lines.append(f"{site[:49]:<50}{count:>7}{total * 1000:>8.0f}m{worst * 1000:>8.0f}m")
+        lines.append("")
+        lines.append(f"Frames: {self.parent.governor.describe()}")
+        self.metrics_view.setPlainText("\n".join(lines))
+
+    def export_metrics(self):
+        try:
+            metrics.dump()
+            self.parent.show_notification(f"Metrics written to {METRICS_FILE}.", 2000)
+        except Exception as e:
+            logging.error(f"Metrics export failed: {str(e)}")
+            self.parent.show_notification(f"Failed to export metrics: {str(e)}.", 3000)
+
+    def clear_metrics(self):
+        metrics.reset()
+        self.refresh_metrics_view()
+
+    def on_stall_threshold_change(self, threshold):
+        try:
+            self.parent.apply_settings({'stall_threshold': threshold})
+            self.parent.show_notification(f"Stall threshold set to {threshold}ms.", 2000)
+        except Exception as e:
+            logging.error(f"Stall threshold change failed: {str(e)}")
+            self.parent.show_notification("Error changing stall threshold.", 3000)
+
+    def on_log_level_change(self, level):
+        try:
+            self.parent.apply_settings({'log_level': level})
+            self.parent.show_notification(f"Log level set to {level}.", 2000)
+        except Exception as e:
+            logging.error(f"Log level change failed: {str(e)}")
+            self.parent.show_notification("Error changing log level.", 3000)
+
+    def on_log_json_change(self, state):
+        try:
+            self.parent.apply_settings({'log_json': bool(state)})
+            self.parent.show_notification(f"JSON log format {'enabled' if state else 'disabled'}.", 2000)
+        except Exception as e:
+            logging.error(f"Log format toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling JSON log format.", 3000)
+
+    def on_profile_seconds_change(self, seconds):
+        try:
+            self.parent.apply_settings({'profile_seconds': seconds})
+        except Exception as e:
+            logging.error(f"Profile duration change failed: {str(e)}")
+            self.parent.show_notification("Error changing profile duration.", 3000)
+
+    def on_profile_capture(self):
+        try:
+            self.parent.toggle_profile_capture()
+            self.profile_btn.setText("Stop Profile Capture" if self.parent.profile_capturing() else "Capture Profile")
+        except Exception as e:
+            logging.error(f"Profile capture toggle failed: {str(e)}")
+            self.parent.show_notification("Error toggling profile capture.", 3000)
+
+    def reset_settings(self):
+        try:
+            self.parent.reset_settings()
+            self.theme_combo.setCurrentText(self.parent.theme_mode.capitalize())
+            self.font_size.setValue(self.parent.font_settings['size'])
+            self.icon_size.setValue(self.parent.icon_size)
+            self.border_radius.setValue(self.parent.border_radius)
+            self.anim_speed.setValue(self.parent.anim_speed)
+            self.anim_curve.setCurrentText(self.parent.anim_curve)
+            self.grid_columns.setValue(self.parent.grid_columns)
+            self.minimize_to_tray.setChecked(self.parent.minimize_to_tray)
+            self.show_tray_icon.setChecked(self.parent.show_tray_icon)
+            self.enable_animations.setChecked(self.parent.enable_animations)
+            self.reduce_motion.setChecked(self.parent.reduce_motion)
+            self.focus_existing.setChecked(self.parent.focus_existing)
+            self.prewarm.setChecked(self.parent.prewarm_enabled)
+            self.favicons.setChecked(self.parent.favicons_enabled)
+            self.instant_summon.setChecked(self.parent.instant_summon)
+            self.prewarm_budget.setValue(self.parent.prewarm_budget)
+            self.hotkey_input.setText(self.parent.hotkey)
+            self.cache_limit.setValue(self.parent.cache_limit)
+            self.monitor_interval.setValue(self.parent.monitor_interval)
+            self.metrics_enabled.setChecked(self.parent.metrics_enabled)
+            self.metrics_interval.setValue(self.parent.metrics_interval)
+            self.profile_seconds.setValue(self.parent.profile_seconds)
+            self.stall_threshold.setValue(self.parent.stall_threshold)
+            self.log_level.setCurrentText(self.parent.log_level)
+            self.log_json.setChecked(self.parent.log_json)
+            self.parent.show_notification("Settings reset to defaults.", 2000)
+        except Exception as e:
+            logging.error(f"Reset settings failed: {str(e)}")
+            self.parent.show_notification("Error resetting settings.", 3000)
+
+class AppLauncher(QMainWindow):
+    processesChanged = pyqtSignal(list)
+    hotkeyPressed = pyqtSignal(float)
+    hotkeyReverted = pyqtSignal(str)
+    profileCaptured = pyqtSignal(str)
+    faviconResolved = pyqtSignal(str, str)
+    instanceFocused = pyqtSignal(str, bool)
+
+    def __init__(self, single_instance=True):
+        super().__init__()
+        self.setWindowTitle("Quantum Launcher")
+        self.setMinimumSize(750, 550)
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.setAcceptDrops(True)
+
+        # Initialize variables
+        self.apps = {}
+        self.app_count = 0
+        self.links = []
+        self.recent_items = []
+        self.pinned_items = []
+        self.profiles = []
+        self.profile_run = None
+        self.pending_command = None
+        self.instance_server = None
+        self.supervisor = ProcessSupervisor(on_change=self.processesChanged.emit)
+        self.processesChanged.connect(self.on_processes_changed)
+        # The keyboard library calls back on its own thread; a queued signal hands the press to the GUI thread.
+        self.hotkeyPressed.connect(self.on_hotkey, Qt.QueuedConnection)
+        self.profileCaptured.connect(self.on_profile_captured, Qt.QueuedConnection)
+        self.faviconResolved.connect(self.on_favicon_resolved, Qt.QueuedConnection)
+        self.instanceFocused.connect(self.on_instance_focused, Qt.QueuedConnection)
+        self.stack_sampler = None
+        self.pending_effects = set()
+        self.effects_timer = QTimer()
+        self.effects_timer.setSingleShot(True)
+        self.effects_timer.setInterval(30)
+        self.effects_timer.timeout.connect(self.apply_pending_effects)
+        self.settings_save_timer = QTimer()
+        self.settings_save_timer.setSingleShot(True)
+        self.settings_save_timer.setInterval(500)
+        self.settings_save_timer.timeout.connect(self.save_settings)
+        QApplication.instance().aboutToQuit.connect(self.flush_settings)
+        self.registered_hotkey = None
+        self.applied_hotkey = None
+        self.summon_started = None
+        self.last_summon_ms = None
+        self.content_dirty = False
+        self.selected_apps = set()
+        self.selected_links = set()
+        self.selected_recent = set()
+        self.selected_pinned = set()
+        self.selection_refs = {}
+        with profiler.stage("settings"):
+            self.settings = self.load_settings()
+        self.theme_mode = self.settings.get('theme', 'dark')
+        self.custom_colors = self.settings.get('colors', {
+            'bg': '#1e1e1e', 'fg': '#dcdcdc', 'accent': '#4682b4',
+            'pane': '#252525', 'list_text': '#dcdcdc', 'list_bg': '#252525'
+        })
+        self.font_settings = self.settings.get('font', {'family': 'Inter', 'size': 12})
+        self.theme_engine = ThemeEngine()
+        self.theme = None
+        self.anim_speed = self.settings.get('anim_speed', 250)
+        self.anim_curve = self.settings.get('anim_curve', 'InOutQuad')
+        self.icon_size = self.settings.get('icon_size', 32)
+        self.border_radius = self.settings.get('border_radius', 8)
+        self.grid_columns = self.settings.get('grid_columns', 4)
+        self.minimize_to_tray = self.settings.get('minimize_to_tray', True)
+        self.show_tray_icon = self.settings.get('show_tray_icon', True)
+        self.enable_animations = self.settings.get('enable_animations', True)
+        self.reduce_motion = self.settings.get('reduce_motion', False)
+        screen = QApplication.primaryScreen()
+        self.governor = FrameGovernor(budget=1 / max(screen.refreshRate() if screen else 60, 30))
+        self.hotkey = self.settings.get('hotkey', 'ctrl+alt+q')
+        self.instant_summon = self.settings.get('instant_summon', True)
+        self.cache_limit = self.settings.get('cache_limit', 100)
+        self.monitor_interval = self.settings.get('monitor_interval', 1000)
+        self.monitor = ResourceMonitor(interval=self.monitor_interval / 1000)
+        self.monitor_timer = QTimer()
+        self.monitor_timer.setInterval(self.monitor_interval)
+        self.monitor_timer.timeout.connect(self.refresh_resource_view)
+        self.focus_existing = self.settings.get('focus_existing', True)
+        self.process_table = None
+        self.prewarm_enabled = self.settings.get('prewarm', False)
+        self.prewarm_budget = self.settings.get('prewarm_budget', 256)
+        self.prewarm = PrewarmService(self.resolve_executable, budget_mb=self.prewarm_budget)
+        self.metrics_enabled = self.settings.get('metrics', False)
+        self.metrics_interval = self.settings.get('metrics_interval', 30)
+        self.apply_metrics_settings()
+        self.profile_seconds = self.settings.get('profile_seconds', 10)
+        self.stall_threshold = self.settings.get('stall_threshold', 50)
+        self.log_level = self.settings.get('log_level', 'INFO')
+        self.log_json = self.settings.get('log_json', False)
+        log_pipeline.set_level(self.log_level)
+        log_pipeline.set_json(self.log_json)
+        self.watchdog = StallWatchdog(threshold=self.stall_threshold / 1000, on_stall=self.on_stall)
+        self.heartbeat_timer = QTimer()
+        self.heartbeat_timer.setInterval(int(self.watchdog.interval * 1000))
+        self.heartbeat_timer.timeout.connect(self.watchdog.beat)
+        self.icon_cache = {}
+        self.icon_cache_dir = Path("icon_cache")
+        self.icon_cache_dir.mkdir(exist_ok=True)
+        # App icons are resolved in idle slices; rows show a placeholder until theirs is ready.
+        self.icon_queue = deque()
+        self.icon_queued = set()
+        self.icon_rows = {}
+        self.icon_misses = set()
+        self.icon_cache_grown = False
+        self.icon_cleanup_thread = None
+        self.icon_timer = QTimer()
+        self.icon_timer.setInterval(0)
+        self.icon_timer.timeout.connect(self.extract_icons)
+        self.favicons_enabled = self.settings.get('favicons', False)
+        # Origins with no favicon on disk that were already handed to the service; rows skip the stat for them.
+        self.favicon_misses = set()
+        self.link_icon = QIcon.fromTheme("link")
+        self.favicons = FaviconService(self.icon_cache_dir, self.faviconResolved.emit, decode=favicon_png)
+        self.favicon_updates = {}
+        self.favicon_timer = QTimer()
+        self.favicon_timer.setSingleShot(True)
+        self.favicon_timer.setInterval(100)
+        self.favicon_timer.timeout.connect(self.apply_favicons)
+        self.drag_pos = None
+        self.is_maximized = False
+        self.view_mode = "list"
+        self.sort_mode = "name"
+        self.current_tab = 0
+        self.notification_widget = NotificationWidget(self, animation_duration=self.animation_duration)
+        self.notification_widget.clicked.connect(self.show_notification_history)
+        self.notifications = NotificationBus()
+        self.import_thread = None
+        self.link_check_thread = None
+        self.link_health_cache = LinkHealthCache()
+        self.notify_timer = QTimer()
+        self.notify_timer.setSingleShot(True)
+        self.notify_timer.timeout.connect(self.flush_notifications)
+        self.stats_label = QLabel("Initializing...")
+        self.stats_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedHeight(4)
+        self.progress_bar.setTextVisible(False)
+        self.search_timer = QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.filter_all)
+        self.search_cache = {}
+        self.render_items = []
+        self.render_pos = 0
+        self.render_font = None
+        self.render_timer = QTimer()
+        self.render_timer.setInterval(0)
+        self.render_timer.timeout.connect(self.render_next_chunk)
+        self.search_index = []
+        self.search_index_key = None
+        self.catalog_version = 0
+        self.top_hit = None
+        self.last_launch_ms = None
+        self.single_instance = single_instance
+        self.content_loaded = False
+        self.startup_stages = [
+            ("state", self.load_state),
+            ("catalog", self.load_cached_catalog),
+            ("content", self.load_content),
+            ("services", self.start_services),
+        ]
+
+        # Only what the first paint needs is built here; the rest runs in start-up stages.
+        with profiler.stage("shell window"):
+            self.setup_fonts()
+            self.setup_ui()
+            self.center_on_screen()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.startup_stages:
+            QTimer.singleShot(0, self.run_next_startup_stage)
+
+    def run_next_startup_stage(self):
+        if not self.startup_stages:
+            return
+        name, stage = self.startup_stages.pop(0)
+        with profiler.stage(name):
+            try:
+                stage()
+            except Exception as e:
+                logging.error(f"Startup stage {name} failed: {str(e)}")
+        if self.startup_stages:
+            # Yield to the event loop between stages so the window stays responsive.
+            QTimer.singleShot(0, self.run_next_startup_stage)
+        else:
+            profiler.finish()
+
+    def load_state(self):
+        self.links = self.load_links()
+        self.recent_items = self.load_recent()
+        self.pinned_items = self.load_pinned()
+        self.catalog_changed()
+        self.profiles = self.load_profiles()
+        if self.single_instance:
+            self.setup_instance_server()
+
+    def load_cached_catalog(self):
+        # Show the apps from the previous scan right away; the rescan replaces them when it finishes.
+        cached = load_catalog()
+        if cached and not self.apps:
+            self.set_apps(cached)
+        self.load_apps_async()
+
+    def load_content(self):
+        # The one start-up rebuild, once links and the cached catalog are both in.
+        self.content_loaded = True
+        self.update_content()
+
+    def start_services(self):
+        from proctable import ProcessTable
+        self.process_table = ProcessTable()
+        if self.focus_existing:
+            self.process_table.start()
+        self.setup_system_tray()
+        self.setup_hotkey()
+        self.schedule_prewarm()
+        self.heartbeat_timer.start()
+        self.watchdog.start()
+
+    def setup_fonts(self):
+        font_db = QFontDatabase()
+        available_fonts = font_db.families()
+        if "Inter" in available_fonts:
+            self.font_settings['family'] = "Inter"
+        else:
+            self.font_settings['family'] = "Arial"
+
+    def setup_system_tray(self):
+        if not self.show_tray_icon:
+            if hasattr(self, 'tray_icon'):
+                self.tray_icon.hide()
+            return
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.show()
+            return
+        tray_icon = QIcon.fromTheme("system-software-install")
+        if tray_icon.isNull():
+            tray_icon = QIcon.fromTheme("application")
+            logging.warning("System tray icon 'system-software-install' not found, using 'application'.")
+        self.tray_icon = QSystemTrayIcon(tray_icon, self)
+        tray_menu = QMenu()
+        tray_menu.addAction("Show", self.summon)
+        tray_menu.addAction("Quit", QApplication.quit)
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(self.tray_activated)
+        self.tray_icon.show()
+
+    def tray_activated(self, reason):
+        if reason == QSystemTrayIcon.DoubleClick:
+            self.summon()
+
+    def setup_hotkey(self):
+        """Register self.hotkey; a changed hotkey that cannot be registered is rolled back to the previous one."""
+        previous, self.applied_hotkey = self.applied_hotkey, self.hotkey
+        try:
+            import keyboard
+        except ImportError as e:
+            logging.warning(f"Global hotkey unavailable: {str(e)}")
+            return
+        restore = self.registered_hotkey
+        if self.registered_hotkey:
+            try:
+                keyboard.remove_hotkey(self.registered_hotkey)
+            except Exception:
+                pass
+            self.registered_hotkey = None
+        try:
+            keyboard.add_hotkey(self.hotkey, self.emit_hotkey)
+            self.registered_hotkey = self.hotkey
+        except Exception as e:
+            logging.warning(f"Failed to set hotkey {self.hotkey}: {str(e)}")
+            if previous is None or previous == self.hotkey:
+                self.show_notification("Failed to set hotkey.", 3000)
+                return
+            # Keep the last hotkey instead of saving one that never fires.
+            self.hotkey = self.applied_hotkey = previous
+            self.settings_save_timer.start()
+            self.hotkeyReverted.emit(previous)
+            if restore:
+                try:
+                    keyboard.add_hotkey(restore, self.emit_hotkey)
+                    self.registered_hotkey = restore
+                except Exception as e:
+                    logging.warning(f"Failed to restore hotkey {restore}: {str(e)}")
+            self.show_notification(f"Failed to set hotkey, keeping {previous}.", 3000)
+
+    def set_hotkey(self, hotkey):
+        if hotkey:
+            self.apply_settings({'hotkey': hotkey})
+
+    def emit_hotkey(self):
+        # Runs on the keyboard library's thread: touch no widgets here.
+        self.hotkeyPressed.emit(time.perf_counter())
+
+    def on_hotkey(self, pressed_at):
+        if self.isVisible() and self.isActiveWindow():
+            self.hide()
+        else:
+            self.summon(pressed_at)
+
+    def toggle_visibility(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.summon()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.instant_summon:
+            QTimer.singleShot(0, self.prepare_summon)
+
+    def prepare_summon(self):
+        # Finish polish and item layout while hidden so showing the window is just an expose.
+        if self.isVisible():
+            return
+        self.ensurePolished()
+        self.centralWidget().layout().activate()
+        self.content_list.doItemsLayout()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.summon_started is not None:
+            elapsed = time.perf_counter() - self.summon_started
+            self.last_summon_ms = elapsed * 1000
+            self.summon_started = None
+            metrics.observe("summon_seconds", elapsed)
+            logging.debug("Summon latency: %.1fms", self.last_summon_ms)
+            self.update_stats()
+
+    def setup_instance_server(self):
+        from PyQt5.QtNetwork import QLocalServer
+        try:
+            name = server_name()
+        except OSError as e:
+            logging.warning(f"Single-instance server unavailable: {str(e)}")
+            self.instance_server = None
+            return
+        self.instance_server = QLocalServer(self)
+        if not self.instance_server.listen(name):
+            if instance_running():
+                # A live instance that was too slow to answer the forward; taking its socket would orphan it.
+                logging.warning(f"Another instance owns {name}; running without single-instance forwarding")
+                self.instance_server = None
+                return
+            QLocalServer.removeServer(name)
+            if not self.instance_server.listen(name):
+                logging.warning(f"Single-instance server unavailable: {self.instance_server.errorString()}")
+                self.instance_server = None
+                return
+        self.instance_server.newConnection.connect(self.accept_instance_connection)
+
+    def accept_instance_connection(self):
+        while self.instance_server.hasPendingConnections():
+            connection = self.instance_server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.read_instance_command(connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def read_instance_command(self, connection):
+        while connection.canReadLine():
+            line = bytes(connection.readLine()).decode("utf-8", errors="replace")
+            try:
+                message = json.loads(line)
+                self.handle_instance_command(message.get("command", "show"), message.get("arg", ""), message.get("tabs"))
+                reply = "ok"
+            except Exception as e:
+                logging.error(f"Forwarded command failed: {str(e)}")
+                reply = f"error: {str(e)}"
+            connection.write((reply + "\n").encode("utf-8"))
+            connection.flush()
+
+    def handle_instance_command(self, command, arg, tabs=None):
+        if command == "show":
+            self.summon()
+        elif command == "search":
+            self.summon()
+            self.search_bar.setText(arg)
+        elif command == "launch":
+            if tabs is not None and not (isinstance(tabs, list) and set(tabs) <= set(TABS)):
+                raise ValueError(f"Unknown tabs {tabs}")
+            item = self.find_item(arg, tabs or TABS)
+            if not item:
+                raise ValueError(f"No item matches '{arg}'")
+            self.launch_item(item["path"], item["type"])
+            self.add_recent_item(item["name"], item["path"], item.get("category", "General"), item["type"], datetime.now().isoformat())
+        elif command == "profile":
+            if not any(p["name"] == arg for p in self.profiles):
+                raise ValueError(f"No profile named '{arg}'")
+            self.run_profile(arg)
+        else:
+            raise ValueError(f"Unknown command '{command}'")
+
+    def find_item(self, query, tabs=TABS):
+        return best_match(query, catalog_entries(self.apps, self.links, self.recent_items, self.pinned_items, tabs))
+
+    def summon(self, started=None):
+        self.summon_started = started or time.perf_counter()
+        self.show()
+        if self.content_dirty:
+            self.update_content()
+        self.raise_()
+        self.activateWindow()
+        self.search_bar.setFocus()
+        self.search_bar.selectAll()
+
+    def setup_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+
+        # Title Bar
+        self.title_bar = QWidget()
+        self.title_bar.setFixedHeight(48)
+        title_layout = QHBoxLayout(self.title_bar)
+        title_layout.setContentsMargins(16, 0, 16, 0)
+        title_layout.setSpacing(8)
+
+        # App Icon and Title
+        app_icon = QLabel()
+        app_icon.setPixmap(QIcon.fromTheme("system-software-install").pixmap(28, 28))
+        title_layout.addWidget(app_icon)
+        title_label = QLabel("Quantum Launcher")
+        title_label.setObjectName("windowTitle")
+        title_layout.addWidget(title_label)
+        title_layout.addSpacing(20)
+
+        # Tab Buttons
+        self.tab_buttons = []
+        for text, slot in [
+            ("Apps", lambda: self.show_content(0)),
+            ("Links", lambda: self.show_content(1)),
+            ("Recent", lambda: self.show_content(2)),
+            ("Pinned", lambda: self.show_content(3)),
+            ("Settings", self.show_settings)
+        ]:
+            btn = QToolButton()
+            btn.setText(text)
+            btn.setToolTip(f"Switch to {text} view")
+            btn.setFixedSize(100, 36)
+            btn.setCheckable(True)
+            btn.clicked.connect(slot)
+            title_layout.addWidget(btn)
+            self.tab_buttons.append(btn)
+        self.tab_buttons[0].setChecked(True)
+        title_layout.addStretch()
+
+        # Window Controls
+        minimize_btn = QToolButton()
+        minimize_btn.setText("−")
+        minimize_btn.setToolTip("Minimize")
+        minimize_btn.setFixedSize(36, 36)
+
+        maximize_btn = QToolButton()
+        maximize_btn.setText("↔")
+        maximize_btn.setToolTip("Maximize/Restore")
+        maximize_btn.setFixedSize(36, 36)
+
+        close_btn = QToolButton()
+        close_btn.setText("✕")
+        close_btn.setToolTip("Close")
+        close_btn.setFixedSize(36, 36)
+
+        for btn in [minimize_btn, maximize_btn, close_btn]:
+            btn.setObjectName("titleButton")
+        minimize_btn.clicked.connect(self.showMinimized)
+        maximize_btn.clicked.connect(self.toggle_maximize)
+        close_btn.clicked.connect(self.close_window)
+        title_layout.addWidget(minimize_btn)
+        title_layout.addWidget(maximize_btn)
+        title_layout.addWidget(close_btn)
+        main_layout.addWidget(self.title_bar)
+
+        # Main Content
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.setContentsMargins(16, 16, 16, 16)
+        content_layout.setSpacing(12)
+        main_layout.addWidget(content_widget)
+
+        # Search Bar
+        search_layout = QHBoxLayout()
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search apps, links, or pinned items...")
+        self.search_bar.setFixedHeight(40)
+        self.search_bar.setTextMargins(20, 0, 20, 0)
+        self.search_bar.textChanged.connect(self.debounce_search)
+        self.search_bar.returnPressed.connect(self.launch_top_hit)
+        self.setup_completer()
+        search_layout.addWidget(self.search_bar)
+
+        # Search Icon
+        search_icon = QLabel()
+        search_icon.setPixmap(QIcon.fromTheme("edit-find").pixmap(20, 20))
+        search_icon.setStyleSheet("background: none; padding: 0px;")
+        search_icon.setFixedSize(20, 20)
+        search_layout.addWidget(search_icon, alignment=Qt.AlignLeft | Qt.AlignVCenter)
+        search_layout.setAlignment(search_icon, Qt.AlignLeft | Qt.AlignVCenter)
+        search_icon.setGeometry(20, 10, 20, 20)  # Position inside search bar
+
+        # Clear Button
+        clear_btn = QToolButton()
+        clear_btn.setText("×")
+        clear_btn.setToolTip("Clear search")
+        clear_btn.setFixedSize(20, 20)
+        clear_btn.setObjectName("clearSearch")
+        clear_btn.clicked.connect(self.search_bar.clear)
+        search_layout.addWidget(clear_btn, alignment=Qt.AlignRight | Qt.AlignVCenter)
+
+        # Top Hit (what Enter launches)
+        self.top_hit_label = QLabel("")
+        self.top_hit_label.setToolTip("Press Enter to launch the top hit")
+        self.top_hit_label.setMaximumWidth(220)
+        search_layout.addWidget(self.top_hit_label)
+
+        # Sort Combo
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems(["Name", "Category"])
+        self.sort_combo.setFixedWidth(130)
+        self.sort_combo.setToolTip("Sort items")
+        self.sort_combo.currentTextChanged.connect(lambda text: self.set_sort_mode(text.lower()))
+        search_layout.addWidget(self.sort_combo)
+        content_layout.addLayout(search_layout)
+
+        # Action Bar
+        self.action_bar = QWidget()
+        action_layout = QHBoxLayout(self.action_bar)
+        action_layout.setContentsMargins(0, 0, 0, 0)
+        action_layout.setSpacing(8)
+        run_btn = QPushButton("Run")
+        run_btn.setToolTip("Run selected items (Ctrl+R)")
+        run_btn.setFixedSize(90, 36)
+        run_btn.clicked.connect(self.run_selected)
+        action_layout.addWidget(run_btn)
+        add_link_btn = QPushButton("Add Link")
+        add_link_btn.setToolTip("Add a new link (Ctrl+L)")
+        add_link_btn.setFixedSize(90, 36)
+        add_link_btn.clicked.connect(self.add_link_popup)
+        action_layout.addWidget(add_link_btn)
+        view_btn = QPushButton("View")
+        view_btn.setToolTip("Cycle view mode")
+        view_btn.setFixedSize(90, 36)
+        view_btn.clicked.connect(self.toggle_view_mode)
+        action_layout.addWidget(view_btn)
+        self.profiles_btn = QPushButton("Profiles")
+        self.profiles_btn.setToolTip("Save or run launch profiles")
+        self.profiles_btn.setFixedSize(90, 36)
+        self.profiles_btn.clicked.connect(self.show_profiles_menu)
+        action_layout.addWidget(self.profiles_btn)
+        self.running_btn = QPushButton("Running (0)")
+        self.running_btn.setToolTip("Show launched processes and their status")
+        self.running_btn.setFixedSize(110, 36)
+        self.running_btn.clicked.connect(self.show_running_menu)
+        action_layout.addWidget(self.running_btn)
+        action_layout.addStretch()
+        content_layout.addWidget(self.action_bar)
+
+        # Content List
+        self.content_list = ContentListView(self.governor)
+        self.content_list.rowsNeeded.connect(self.finish_rendering)
+        self.content_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.content_list.setViewMode(QListView.ListMode)
+        self.content_list.setIconSize(QSize(self.icon_size, self.icon_size))
+        # Every row in a view mode has the same size hint, so Qt can skip measuring each one,
+        # and batched layout lays out appended rows a slice at a time between events.
+        self.content_list.setUniformItemSizes(True)
+        self.content_list.setLayoutMode(QListView.Batched)
+        self.content_list.setBatchSize(RENDER_CHUNK_ROWS)
+        self.content_model = QStandardItemModel()
+        self.content_list.setModel(self.content_model)
+        self.content_list.setItemDelegate(CustomItemDelegate(self.view_mode, self.icon_size, self.border_radius, monitor=self.monitor))
+        self.content_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.content_list.customContextMenuRequested.connect(self.show_context_menu)
+        self.content_list.selectionModel().selectionChanged.connect(self.update_selection)
+        self.content_list.setMouseTracking(True)
+        content_layout.addWidget(self.content_list)
+        self.setup_animations()
+
+        # Status Bar
+        status_bar = QWidget()
+        status_layout = QHBoxLayout(status_bar)
+        status_layout.setContentsMargins(8, 4, 8, 4)
+        status_layout.addWidget(self.stats_label)
+        status_layout.addWidget(self.progress_bar)
+        status_layout.addStretch()
+        content_layout.addWidget(status_bar)
+
+        # Shortcuts
+        self.add_shortcut('Ctrl+1', lambda: self.show_content(0))
+        self.add_shortcut('Ctrl+2', lambda: self.show_content(1))
+        self.add_shortcut('Ctrl+3', lambda: self.show_content(2))
+        self.add_shortcut('Ctrl+4', lambda: self.show_content(3))
+        self.add_shortcut('Ctrl+5', self.show_settings)
+        self.add_shortcut('Ctrl+R', self.run_selected)
+        self.add_shortcut('Ctrl+L', self.add_link_popup)
+        self.add_shortcut('Ctrl+T', self.toggle_view_mode)
+        self.add_shortcut('Ctrl+Shift+P', self.toggle_profile_capture)
+        self.add_shortcut('Ctrl+Shift+N', self.show_notification_history)
+
+        self.apply_styles()
+
+    def setup_completer(self):
+        completer = QCompleter()
+        self.completer_model = QStringListModel()
+        completer.setModel(self.completer_model)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        self.search_bar.setCompleter(completer)
+        self.update_completer()
+
+    def update_completer(self):
+        completer_list = []
+        for category in self.apps:
+            completer_list.extend(self.apps[category].keys())
+        completer_list.extend(link["name"] for link in self.links)
+        completer_list.extend(item["name"] for item in self.recent_items)
+        completer_list.extend(item["name"] for item in self.pinned_items)
+        self.completer_model.setStringList(completer_list)
+
+    def debounce_search(self, text):
+        self.search_timer.start(100)
+        self.update_top_hit(text)
+
+    def current_search_index(self):
+        key = (self.current_tab, self.catalog_version)
+        if key != self.search_index_key:
+            tab = ("apps", "links", "recent", "pinned")[self.current_tab]
+            self.search_index = catalog_entries(self.apps, self.links, self.recent_items, self.pinned_items, (tab,))
+            self.search_index_key = key
+        return self.search_index
+
+    def update_top_hit(self, text, fuzzy=False):
+        # Literal matching only while typing; a full fuzzy scan is left for Enter when nothing matched literally.
+        with metrics.time("top_hit_seconds"):
+            self.top_hit = best_match(text, self.current_search_index(), fuzzy) if text.strip() else None
+        self.top_hit_label.setText(f"↵ {self.top_hit['name']}" if self.top_hit else "")
+
+    def launch_top_hit(self):
+        started = time.perf_counter()
+        if self.top_hit is None:
+            self.update_top_hit(self.search_bar.text(), fuzzy=True)
+        item = self.top_hit
+        if not item:
+            return
+        self.launch_item(item["path"], item["type"])
+        elapsed = time.perf_counter() - started
+        self.last_launch_ms = elapsed * 1000
+        metrics.observe("keystroke_to_spawn_seconds", elapsed)
+        logging.info("Keystroke-to-spawn for %s: %.1fms", item["name"], self.last_launch_ms)
+        # Bookkeeping and the view refresh happen after the spawn, off the latency path.
+        self.search_timer.stop()
+        QTimer.singleShot(0, lambda: self.finish_top_hit_launch(item))
+
+    def finish_top_hit_launch(self, item):
+        self.add_recent_item(item["name"], item["path"], item.get("category", "General"), item["type"], datetime.now().isoformat())
+        self.update_content()
+        self.schedule_prewarm()
+
+    def apply_styles(self):
+        theme = self.theme_engine.get(self.theme_mode, self.custom_colors, self.font_settings['family'], self.font_settings['size'])
+        previous, self.theme = self.theme, theme
+        if theme is previous:
+            return
+        # Only hand Qt the parts that changed: each setStyleSheet re-polishes the widget's whole subtree.
+        for widget, part in ((self, 'window'), (self.title_bar, 'title_bar'), (self.stats_label, 'stats'),
+                             (self.action_bar, 'action_bar'), (self.notification_widget, 'notification')):
+            if previous is None or getattr(previous, part) != getattr(theme, part):
+                widget.setStyleSheet(getattr(theme, part))
+        if previous is not None and previous.dialog != theme.dialog:
+            for dialog in self.findChildren(QDialog):
+                if dialog.styleSheet() == previous.dialog:
+                    dialog.setStyleSheet(theme.dialog)
+
+    def show_content(self, index):
+        for btn in self.tab_buttons:
+            btn.setChecked(False)
+        self.tab_buttons[index].setChecked(True)
+        self.current_tab = index
+        self.update_top_hit(self.search_bar.text())
+        self.update_content()
+        self.animate_pane()
+        self.fade_in_content()
+
+    def update_content(self):
+        if not self.isVisible() and not self.instant_summon:
+            # Rebuilt on the next summon instead of while nobody can see it.
+            self.content_dirty = True
+            return
+        self.content_dirty = False
+        started = time.perf_counter()
+        # A model reset drops the view's selection without emitting selectionChanged.
+        self.reset_selection_tracking()
+        self.content_model.clear()
+        # Rows of the old model are gone; only the new rows' icons are worth resolving.
+        self.icon_rows.clear()
+        self.icon_queue.clear()
+        self.icon_queued.clear()
+        font = QFont(self.font_settings['family'], self.font_settings['size'])
+        filter_text = self.search_bar.text().lower()
+
+        items = []
+        cache_key = f"{self.current_tab}_{filter_text}"
+        if cache_key in self.search_cache:
+            items = self.search_cache[cache_key]
+        else:
+            search_started = time.perf_counter()
+            if self.current_tab == 0:  # Apps
+                for category in sorted(self.apps.keys()):
+                    app_list = [(app_name, self.apps[category][app_name], category) for app_name in self.apps[category]]
+                    if filter_text:
+                        app_list = [(name, path, cat) for name, path, cat in app_list if matches(filter_text, name)]
+                    items.extend([(name, path, cat, "app", False) for name, path, cat in app_list])
+            elif self.current_tab == 1:  # Links
+                for link in self.links:
+                    if filter_text and not matches(filter_text, link["name"]):
+                        continue
+                    items.append((link["name"], link["url"], link.get("category", "General"), "link", link.get("is_favorite", False)))
+            elif self.current_tab == 2:  # Recent
+                for item in self.recent_items:
+                    if filter_text and not matches(filter_text, item["name"]):
+                        continue
+                    items.append((f"{item['name']} ({item['type']})", item["path"], item.get("category", "General"), item["type"], item.get("is_favorite", False)))
+            elif self.current_tab == 3:  # Pinned
+                for item in self.pinned_items:
+                    if filter_text and not matches(filter_text, item["name"]):
+                        continue
+                    items.append((f"{item['name']} ({item['type']})", item["path"], item.get("category", "General"), item["type"], item.get("is_favorite", False)))
+            if filter_text:
+                metrics.observe("search_seconds", time.perf_counter() - search_started)
+            self.search_cache[cache_key] = items
+            if len(self.search_cache) > 100:
+                self.search_cache.pop(next(iter(self.search_cache)))
+
+        if self.sort_mode == "category":
+            items.sort(key=lambda x: (x[2], x[0]))
+        elif self.sort_mode == "lastused" and self.current_tab in (2, 3):
+            # Reversed so the first matching recent entry wins, as a linear search would.
+            last_used = {(i["name"], i["type"]): i.get("timestamp", "") for i in reversed(self.recent_items)}
+            items.sort(key=lambda x: last_used.get((x[0].split(" (")[0], x[3]), ""), reverse=True)
+        else:  # name
+            items.sort(key=lambda x: x[0])
+
+        # Only the first screenful is built here; the rest streams in from render_timer.
+        self.render_items = items
+        self.render_pos = 0
+        self.render_font = font
+        self.append_rows(FIRST_CHUNK_ROWS)
+
+        self.content_list.setItemDelegate(CustomItemDelegate(self.view_mode, self.icon_size, self.border_radius, monitor=self.monitor))
+        self.content_list.setIconSize(QSize(self.icon_size, self.icon_size))
+        self.update_stats()
+        self.update_completer()
+        if not self.isVisible():
+            self.prepare_summon()
+        metrics.observe("update_content_seconds", time.perf_counter() - started)
+
+    def append_rows(self, count, deadline=None):
+        """Build up to count rows of render_items, stopping early past deadline, and add them in one insert."""
+        batch = []
+        tagged = self.current_tab in (2, 3)
+        for row, (name, path, category, item_type, is_favorite) in enumerate(self.render_items[self.render_pos:self.render_pos + count], self.render_pos):
+            if deadline is not None and batch and len(batch) % BUDGET_CHECK_ROWS == 0 and time.perf_counter() > deadline:
+                break
+            icon = self.row_app_icon(path, row) if item_type == "app" else (self.get_link_icon(path) if item_type == "link" else QIcon.fromTheme("pinned"))
+            item = AppItem(name, path, category, item_type, icon, self.render_font, is_favorite, name.split(" (")[0] if tagged else name)
+            if item_type == "link":
+                health = self.link_health_cache.peek(path)
+                if health:
+                    item.setData(health[0], HEALTH_ROLE)
+                    item.setToolTip(f"{health[0].capitalize()}: {health[1]}")
+            batch.append(item)
+        self.render_pos += len(batch)
+        if batch:
+            self.content_model.invisibleRootItem().appendRows(batch)
+        if self.render_pos < len(self.render_items):
+            self.render_timer.start()
+        else:
+            self.render_timer.stop()
+
+    def render_next_chunk(self):
+        started = time.perf_counter()
+        self.append_rows(RENDER_CHUNK_ROWS, deadline=started + IDLE_SLICE_SECONDS)
+        metrics.observe("render_chunk_seconds", time.perf_counter() - started)
+
+    def finish_rendering(self):
+        """Append every row still queued, for callers that need the whole result set in the model, like Select All."""
+        self.append_rows(len(self.render_items) - self.render_pos)
+
+    def setup_animations(self):
+        # Built once and restarted on each switch instead of allocating new animations every time.
+        self.content_opacity = QGraphicsOpacityEffect(self.content_list)
+        self.content_opacity.setEnabled(False)
+        self.content_list.setGraphicsEffect(self.content_opacity)
+        self.pane_animation = QPropertyAnimation(self.content_list, b"pos", self)
+        self.pane_rest_pos = None
+        self.fade_animation = QPropertyAnimation(self.content_opacity, b"opacity", self)
+        self.fade_animation.setStartValue(0.0)
+        self.fade_animation.setEndValue(1.0)
+        # The effect renders the list through an offscreen pixmap, so it is only on while fading.
+        self.fade_animation.finished.connect(lambda: self.content_opacity.setEnabled(False))
+        self.dialog_animation = QPropertyAnimation(self)
+        self.dialog_animation.setPropertyName(b"windowOpacity")
+        self.dialog_animation.setStartValue(0.0)
+        self.dialog_animation.setEndValue(1.0)
+
+    def animation_duration(self, base_ms):
+        """Duration to animate for: 0 when animations are off, motion is reduced or recent frames are over budget."""
+        if not self.enable_animations or self.reduce_motion:
+            return 0
+        return self.governor.duration(base_ms)
+
+    def animate_pane(self):
+        if self.pane_animation.state() != QPropertyAnimation.Running:
+            self.pane_rest_pos = self.content_list.pos()
+        self.pane_animation.stop()
+        duration = self.animation_duration(self.anim_speed)
+        if not duration:
+            if self.pane_rest_pos is not None:
+                self.content_list.move(self.pane_rest_pos)
+            return
+        rest = self.pane_rest_pos
+        self.pane_animation.setDuration(duration)
+        self.pane_animation.setStartValue(QPoint(rest.x() - 20, rest.y()))
+        self.pane_animation.setEndValue(rest)
+        self.pane_animation.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
+        self.pane_animation.start()
+
+    def fade_in_content(self):
+        self.fade_animation.stop()
+        duration = self.animation_duration(self.anim_speed)
+        if not duration:
+            self.content_opacity.setEnabled(False)
+            return
+        self.content_opacity.setOpacity(0.0)
+        self.content_opacity.setEnabled(True)
+        self.fade_animation.setDuration(duration)
+        self.fade_animation.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
+        self.fade_animation.start()
+
+    def open_dialog(self, dialog):
+        """Show dialog modelessly with a fade, or modally when animations are turned off."""
+        if not self.enable_animations:
+            dialog.exec_()
+            return
+        previous = self.dialog_animation.targetObject()
+        if previous is not None and self.dialog_animation.state() == QPropertyAnimation.Running:
+            previous.setWindowOpacity(1.0)
+        self.dialog_animation.stop()
+        duration = self.animation_duration(self.anim_speed)
+        dialog.setWindowOpacity(0.0 if duration else 1.0)
+        dialog.show()
+        if duration:
+            self.dialog_animation.setTargetObject(dialog)
+            self.dialog_animation.setDuration(duration)
+            self.dialog_animation.setEasingCurve(getattr(QEasingCurve, self.anim_curve))
+            self.dialog_animation.start()
+
+    def show_context_menu(self, point):
+        menu = QMenu()
+        menu.setStyleSheet(self.theme.menu)
+        if self.current_tab == 0:
+            menu.addAction("Refresh Apps", self.refresh_apps)
+            menu.addAction("Open File Location", self.open_app_location)
+            menu.addAction("Pin", self.pin_selected)
+        elif self.current_tab == 1:
+            menu.addAction("Delete Link", self.delete_selected)
+            menu.addAction("Edit Category", self.edit_link_category)
+            menu.addAction("Copy URL", self.copy_link_url)
+            menu.addAction("Pin", self.pin_selected)
+            menu.addAction("Toggle Favorite", self.toggle_favorite)
+            menu.addAction("Import Browser Bookmarks", self.start_bookmark_import)
+            menu.addAction("Check Link Health", self.start_link_check)
+        elif self.current_tab == 2:
+            menu.addAction("Clear Recent", self.clear_recent)
+            menu.addAction("Pin", self.pin_selected)
+            menu.addAction("Toggle Favorite", self.toggle_favorite)
+        elif self.current_tab == 3:
+            menu.addAction("Unpin", self.unpin_selected)
+            menu.addAction("Toggle Favorite", self.toggle_favorite)
+
+        sort_menu = menu.addMenu("Sort By")
+        sort_menu.addAction("Name", lambda: self.set_sort_mode("name")).setCheckable(True)
+        sort_menu.addAction("Category", lambda: self.set_sort_mode("category")).setCheckable(True)
+        if self.current_tab in (2, 3):
+            sort_menu.addAction("Last Used", lambda: self.set_sort_mode("lastused")).setCheckable(True)
+        for action in sort_menu.actions():
+            action.setChecked(action.text().lower() == self.sort_mode)
+
+        menu.exec_(self.content_list.mapToGlobal(point))
+
+    def set_sort_mode(self, mode):
+        self.sort_mode = mode.lower()
+        self.update_content()
+        self.show_notification(f"Sorted by {mode}.", 2000)
+
+    def toggle_favorite(self):
+        for name in self.selected_links:
+            for link in self.links:
+                if link["name"] == name:
+                    link["is_favorite"] = not link.get("is_favorite", False)
+        for name in self.selected_recent:
+            for item in self.recent_items:
+                if item["name"] == name.split(" (")[0]:
+                    item["is_favorite"] = not item.get("is_favorite", False)
+        for name in self.selected_pinned:
+            for item in self.pinned_items:
+                if item["name"] == name.split(" (")[0]:
+                    item["is_favorite"] = not item.get("is_favorite", False)
+        self.save_links()
+        self.save_recent()
+        self.save_pinned()
+        self.update_content()
+        self.show_notification("Favorite status toggled.", 2000)
+
+    def update_stats(self):
+        self.stats_label.setText(
+            f"Apps: {self.app_count} | "
+            f"Links: {len(self.links)} | "
+            f"Recent: {len(self.recent_items)} | "
+            f"Pinned: {len(self.pinned_items)} | "
+            f"Running: {len(self.supervisor.running)} | "
+            f"Selected: {len(self.selected_apps) + len(self.selected_links) + len(self.selected_recent) + len(self.selected_pinned)}"
+            + (f" | Summon: {self.last_summon_ms:.0f}ms" if self.last_summon_ms is not None else "")
+            + (f" | Launch: {self.last_launch_ms:.1f}ms" if self.last_launch_ms is not None else "")
+            + (f" | Stalls: {self.watchdog.count} (max {self.watchdog.worst * 1000:.0f}ms)" if self.watchdog.count else "")
+        )
+
+    def update_selection(self, selected, deselected):
+        # Only the changed ranges are walked; selection_refs counts rows per name since recent/pinned can repeat one.
+        target = (self.selected_apps, self.selected_links, self.selected_recent, self.selected_pinned)[self.current_tab]
+        refs = self.selection_refs
+        for index in deselected.indexes():
+            item_id = index.data(ITEM_ID_ROLE)
+            count = refs.get(item_id, 0) - 1
+            if count > 0:
+                refs[item_id] = count
+            else:
+                refs.pop(item_id, None)
+                target.discard(item_id)
+        for index in selected.indexes():
+            item_id = index.data(ITEM_ID_ROLE)
+            refs[item_id] = refs.get(item_id, 0) + 1
+            target.add(item_id)
+        self.update_stats()
+
+    def reset_selection_tracking(self):
+        self.selected_apps.clear()
+        self.selected_links.clear()
+        self.selected_recent.clear()
+        self.selected_pinned.clear()
+        self.selection_refs.clear()
+
+    def add_shortcut(self, key, slot):
+        from PyQt5.QtGui import QKeySequence
+        from PyQt5.QtWidgets import QShortcut
+        shortcut = QShortcut(QKeySequence(key), self)
+        shortcut.activated.connect(slot)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        width = self.content_list.width()
+        if self.view_mode == "grid":
+            columns = self.grid_columns
+            self.content_list.setGridSize(QSize(width // columns, 160))
+        else:
+            self.content_list.setGridSize(QSize())
+        self.center_on_screen()
+
+    def center_on_screen(self):
+        screen = QApplication.primaryScreen().geometry()
+        size = self.geometry()
+        self.move((screen.width() - size.width()) // 2, (screen.height() - size.height()) // 2)
+
+    def toggle_view_mode(self):
+        modes = ["grid", "list", "compact"]
+        current_idx = modes.index(self.view_mode)
+        self.view_mode = modes[(current_idx + 1) % len(modes)]
+        self.content_list.setViewMode(QListView.IconMode if self.view_mode == "grid" else QListView.ListMode)
+        self.update_content()
+        self.show_notification(f"View mode: {self.view_mode.title()}.", 2000)
+
+    def change_theme(self, theme):
+        self.apply_settings({'theme': theme.lower().replace(" ", "")})
+
+    def change_font_size(self, size):
+        self.apply_settings({'font': {**self.font_settings, 'size': size}})
+
+    def change_icon_size(self, size):
+        self.apply_settings({'icon_size': size})
+
+    def change_border_radius(self, radius):
+        self.apply_settings({'border_radius': radius})
+
+    def change_anim_speed(self, speed):
+        self.apply_settings({'anim_speed': speed})
+
+    def change_anim_curve(self, curve):
+        self.apply_settings({'anim_curve': curve})
+
+    def change_grid_columns(self, columns):
+        self.apply_settings({'grid_columns': columns})
+
+    def change_monitor_interval(self, interval):
+        self.apply_settings({'monitor_interval': interval})
+
+    def change_cache_limit(self, limit):
+        self.apply_settings({'cache_limit': limit})
+
+    def apply_settings(self, changes):
+        """Apply a batch of setting changes as one transaction.
+
+        Only settings whose value actually changed count; their subsystems
+        (SETTING_EFFECTS) are refreshed together on the next effects tick, so
+        a dragged slider re-lays out the list at most once per tick instead of
+        rebuilding the model per step, and the file is written once after
+        changes stop.
+        """
+        for key, value in changes.items():
+            attr = SETTING_ATTRS.get(key, key)
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                self.pending_effects.update(SETTING_EFFECTS.get(key, ()))
+        if self.pending_effects and not self.effects_timer.isActive():
+            self.effects_timer.start()
+        self.settings_save_timer.start()
+
+    def apply_pending_effects(self):
+        effects, self.pending_effects = self.pending_effects, set()
+        if 'styles' in effects:
+            self.apply_styles()
+        if 'item_fonts' in effects:
+            self.apply_item_fonts()
+        if 'delegate' in effects:
+            self.apply_delegate_settings()
+        if 'grid' in effects:
+            self.resizeEvent(None)
+        if 'tray' in effects:
+            self.setup_system_tray()
+        if 'hotkey' in effects:
+            self.setup_hotkey()
+        if 'icon_cache' in effects:
+            self.cleanup_icon_cache()
+        if 'monitor' in effects:
+            self.monitor.interval = self.monitor_interval / 1000
+            self.monitor_timer.setInterval(self.monitor_interval)
+        if 'process_table' in effects and self.focus_existing and self.process_table:
+            self.process_table.start()
+        if 'prewarm' in effects:
+            self.prewarm.budget_mb = self.prewarm_budget
+            if self.prewarm_enabled:
+                self.schedule_prewarm()
+            else:
+                self.prewarm.stop()
+        if 'favicons' in effects:
+            # Forget remembered misses so re-enabling looks at the disk and the service again.
+            self.favicon_misses.clear()
+            if self.current_tab != 0:
+                self.update_content()
+        if 'metrics' in effects:
+            self.apply_metrics_settings()
+        if 'watchdog' in effects:
+            self.watchdog.threshold = self.stall_threshold / 1000
+        if 'logging' in effects:
+            log_pipeline.set_level(self.log_level)
+            log_pipeline.set_json(self.log_json)
+
+    def flush_settings(self):
+        if self.settings_save_timer.isActive():
+            self.save_settings()
+
+    def apply_item_fonts(self):
+        font = QFont(self.font_settings['family'], self.font_settings['size'])
+        self.render_font = font
+        for row in range(self.content_model.rowCount()):
+            self.content_model.item(row).setFont(font)
+
+    def apply_delegate_settings(self):
+        # Icon size and radius only affect painting and item metrics, so the model is kept and just re-laid out.
+        delegate = self.content_list.itemDelegate()
+        delegate.icon_size = self.icon_size
+        delegate.border_radius = self.border_radius
+        self.content_list.setIconSize(QSize(self.icon_size, self.icon_size))
+        self.content_list.doItemsLayout()
+
+    def apply_metrics_settings(self):
+        metrics.enabled = self.metrics_enabled
+        if self.metrics_enabled:
+            metrics.start_export(METRICS_FILE, self.metrics_interval)
+        else:
+            metrics.stop_export()
+
+    def reset_settings(self):
+        self.settings = copy.deepcopy(DEFAULT_SETTINGS)
+        self.apply_settings(self.settings)
+
+    def load_apps_async(self):
+        self.progress_bar.setValue(0)
+        self.loader_thread = AppLoaderThread()
+        self.loader_thread.appsLoaded.connect(self.update_apps)
+        self.loader_thread.statusUpdate.connect(self.stats_label.setText)
+        self.loader_thread.progressUpdate.connect(self.progress_bar.setValue)
+        self.loader_thread.errorSignal.connect(self.show_notification)
+        self.loader_thread.start()
+
+    def set_apps(self, apps):
+        self.apps = apps
+        self.app_count = sum(len(items) for items in apps.values())
+        self.catalog_changed()
+
+    def catalog_changed(self):
+        """Mark apps, links, recent or pinned as changed so search results and the search index are rebuilt."""
+        # Edits rename and recategorize entries in place, which no identity or length check would notice;
+        # every such edit goes through set_apps or a save_* call, which call this.
+        self.catalog_version += 1
+        self.search_cache.clear()
+
+    def update_apps(self, apps):
+        changed = apps != self.apps
+        self.set_apps(apps)
+        # Shortcuts may have been reinstalled with icons since the last scan.
+        self.icon_misses.clear()
+        try:
+            with metrics.time("persist_write_seconds", file="catalog.json"):
+                save_catalog(apps)
+        except Exception as e:
+            logging.error(f"Failed to save app catalog: {str(e)}")
+        # Before the start-up rebuild there is nothing to refresh, and an unchanged scan changes nothing on screen.
+        if self.content_loaded and changed:
+            self.update_content()
+        self.update_stats()
+        self.progress_bar.setValue(100)
+        if self.pending_command:
+            command, self.pending_command = self.pending_command, None
+            try:
+                self.handle_instance_command(command["command"], command["arg"])
+            except Exception as e:
+                self.show_notification(str(e), 3000)
+
+    def load_links(self):
+        try:
+            with open("links.json", "r") as f:
+                links = json.load(f)
+            return [item for item in links if isinstance(item, dict) and "name" in item and "url" in item]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return [{"name": "Example", "url": "https://example.com", "category": "General", "is_favorite": False}]
+
+    def save_links(self):
+        self.catalog_changed()
+        try:
+            with metrics.time("persist_write_seconds", file="links.json"), open("links.json", "w") as f:
+                json.dump(self.links, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save links: {str(e)}")
+            self.show_notification(f"Failed to save links: {str(e)}.", 3000)
+
+    def load_recent(self):
+        try:
+            with open("recent.json", "r") as f:
+                recent = json.load(f)
+            return [item for item in recent[:50] if isinstance(item, dict) and "name" in item and "path" in item and "type" in item]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def save_recent(self):
+        self.catalog_changed()
+        try:
+            with metrics.time("persist_write_seconds", file="recent.json"), open("recent.json", "w") as f:
+                json.dump(self.recent_items, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save recent items: {str(e)}")
+            self.show_notification(f"Failed to save recent items: {str(e)}.", 3000)
+
+    def load_pinned(self):
+        try:
+            with open("pinned.json", "r") as f:
+                pinned = json.load(f)
+            return [item for item in pinned if isinstance(item, dict) and "name" in item and "path" in item and "type" in item]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def save_pinned(self):
+        self.catalog_changed()
+        try:
+            with metrics.time("persist_write_seconds", file="pinned.json"), open("pinned.json", "w") as f:
+                json.dump(self.pinned_items, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save pinned items: {str(e)}")
+            self.show_notification(f"Failed to save pinned items: {str(e)}.", 3000)
+
+    def load_profiles(self):
+        try:
+            with open(PROFILES_FILE, "r") as f:
+                profiles = json.load(f)
+            return [profile for profile in profiles if validate_profile(profile)]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def save_profiles(self):
+        try:
+            with metrics.time("persist_write_seconds", file="profiles.json"), open(PROFILES_FILE, "w") as f:
+                json.dump(self.profiles, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save profiles: {str(e)}")
+            self.show_notification(f"Failed to save profiles: {str(e)}.", 3000)
+
+    def load_settings(self):
+        default_settings = copy.deepcopy(DEFAULT_SETTINGS)
+        try:
+            with open("settings.json", "r") as f:
+                loaded_settings = json.load(f)
+                if 'colors' in loaded_settings:
+                    loaded_settings['colors'] = {**default_settings['colors'], **loaded_settings['colors']}
+                return {**default_settings, **loaded_settings}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default_settings
+
+    def current_settings(self):
+        return {key: getattr(self, SETTING_ATTRS.get(key, key)) for key in DEFAULT_SETTINGS}
+
+    def save_settings(self):
+        self.settings_save_timer.stop()
+        settings = self.current_settings()
+        try:
+            with metrics.time("persist_write_seconds", file="settings.json"), open("settings.json", "w") as f:
+                json.dump(settings, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save settings: {str(e)}")
+            self.show_notification(f"Failed to save settings: {str(e)}.", 3000)
+
+    def cleanup_icon_cache(self):
+        """Trim the disk cache to cache_limit on a worker thread; a trim already running covers this call."""
+        # Icons in icon_cache stay valid after their files go, so rows on screen keep theirs.
+        if self.icon_cleanup_thread is not None and self.icon_cleanup_thread.is_alive():
+            return
+        self.icon_cleanup_thread = threading.Thread(target=self.trim_icon_cache, args=(self.cache_limit,), name="IconCacheCleanup", daemon=True)
+        self.icon_cleanup_thread.start()
+
+    def trim_icon_cache(self, limit_mb):
+        # Runs off the GUI thread, so only the file system is touched here.
+        files = []
+        for f in self.icon_cache_dir.glob("*.png"):
+            try:
+                stat = f.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, f))
+        cache_size = sum(size for _, size, _ in files)
+        limit = limit_mb * 1024 * 1024
+        for _, size, f in sorted(files, key=lambda x: x[0]):
+            if cache_size <= limit:
+                break
+            try:
+                f.unlink()
+                cache_size -= size
+            except OSError as e:
+                logging.debug("Cannot remove cached icon %s: %s", f, e)
+
+    def get_app_icon(self, shortcut_path):
+        started = time.perf_counter()
+        icon, source = self.resolve_app_icon(shortcut_path)
+        metrics.observe("icon_resolve_seconds", time.perf_counter() - started, source=source)
+        return icon
+
+    def resolve_app_icon(self, shortcut_path):
+        # Returns (icon, source) so get_app_icon can tell memory hits, disk hits and extractions apart.
+        if shortcut_path in self.icon_cache:
+            return self.icon_cache[shortcut_path], "memory"
+        win32 = win32_shell()
+        if not win32 or not os.path.exists(str(shortcut_path)):
+            return QIcon.fromTheme("application-x-executable"), "fallback"
+        shell, pythoncom = win32
+
+        cache_file = self.icon_cache_dir / f"{hashlib.md5(str(shortcut_path).encode()).hexdigest()}.png"
+        if cache_file.exists():
+            icon = QIcon(str(cache_file))
+            if not icon.isNull():
+                self.icon_cache[shortcut_path] = icon
+                return icon, "disk"
+
+        try:
+            pythoncom.CoInitialize()
+            shortcut = pythoncom.CoCreateInstance(shell.CLSID_ShellLink, None, pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink)
+            shortcut.QueryInterface(pythoncom.IID_IPersistFile).Load(str(shortcut_path))
+            icon_path, icon_index = shortcut.GetIconLocation()
+            if not icon_path:
+                target_path = shortcut.GetPath(shell.SLGP_RAWPATH)[0]
+                if os.path.exists(target_path):
+                    icon_path = target_path
+                else:
+                    return QIcon.fromTheme("application-x-executable"), "fallback"
+
+            icon = QIcon(icon_path)
+            if not icon.isNull():
+                from PIL import Image
+                pixmap = icon.pixmap(max(self.icon_size, 64))
+                img = Image.fromqpixmap(pixmap)
+                img.save(str(cache_file))
+                self.icon_cache[shortcut_path] = icon
+                self.icon_cache_grown = True
+                return icon, "extraction"
+        except Exception as e:
+            logging.debug("Failed to extract icon for %s: %s", shortcut_path, e)
+        finally:
+            pythoncom.CoUninitialize()
+
+        return QIcon.fromTheme("application-x-executable"), "fallback"
+
+    def row_app_icon(self, path, row):
+        """Icon for the app row being built: the cached one, or a placeholder until extract_icons resolves it."""
+        if path in self.icon_cache:
+            return self.icon_cache[path]
+        if path not in self.icon_misses:
+            self.icon_rows.setdefault(path, []).append(row)
+            if path not in self.icon_queued:
+                self.icon_queued.add(path)
+                self.icon_queue.append(path)
+                self.icon_timer.start()
+        return QIcon.fromTheme("application-x-executable")
+
+    def extract_icons(self):
+        """Resolve queued app icons for one idle slice and set them on the rows waiting for them."""
+        deadline = time.perf_counter() + IDLE_SLICE_SECONDS
+        while self.icon_queue and time.perf_counter() < deadline:
+            path = self.icon_queue.popleft()
+            self.icon_queued.discard(path)
+            icon = self.get_app_icon(path)
+            if path not in self.icon_cache:
+                # Fallback icon; not retried on every rebuild until the next scan.
+                self.icon_misses.add(path)
+            for row in self.icon_rows.pop(path, ()):
+                item = self.content_model.item(row)
+                if item is not None:
+                    item.setIcon(icon)
+        if not self.icon_queue:
+            self.icon_timer.stop()
+            if self.icon_cache_grown:
+                self.icon_cache_grown = False
+                self.cleanup_icon_cache()
+
+    def get_link_icon(self, url):
+        """Cached favicon for url's origin, or the generic link icon while the favicon service looks for one."""
+        origin = origin_of(url) if self.favicons_enabled else None
+        if origin is None:
+            return self.link_icon
+        if origin in self.icon_cache:
+            return self.icon_cache[origin]
+        if origin in self.favicon_misses:
+            return self.link_icon
+        cache_file = favicon_path(self.icon_cache_dir, origin)
+        if cache_file.exists():
+            icon = QIcon(str(cache_file))
+            if not icon.isNull():
+                self.icon_cache[origin] = icon
+                return icon
+        self.favicon_misses.add(origin)
+        self.favicons.request(origin)
+        return self.link_icon
+
+    def on_favicon_resolved(self, origin, path):
+        if not path:
+            return
+        icon = QIcon(path)
+        if icon.isNull():
+            return
+        self.favicon_misses.discard(origin)
+        self.icon_cache[origin] = icon
+        self.favicon_updates[origin] = icon
+        # Icons arrive one origin at a time; rows are updated in one pass per burst.
+        if not self.favicon_timer.isActive():
+            self.favicon_timer.start()
+
+    def apply_favicons(self):
+        """Swap freshly fetched favicons into link rows already in the model."""
+        updates, self.favicon_updates = self.favicon_updates, {}
+        if updates:
+            # Each update is a file the favicon service just wrote.
+            self.cleanup_icon_cache()
+        if self.current_tab == 0 or not self.favicons_enabled:
+            return
+        model = self.content_model
+        for row in range(model.rowCount()):
+            item = model.item(row)
+            data = item.data(Qt.UserRole)
+            if data and data["type"] == "link":
+                icon = updates.get(origin_of(data["path"]))
+                if icon is not None:
+                    item.setIcon(icon)
+
+    def filter_all(self):
+        self.update_content()
+
+    def show_settings(self):
+        try:
+            dialog = SettingsDialog(self)
+            self.open_dialog(dialog)
+            self.tab_buttons[4].setChecked(False)
+        except Exception as e:
+            logging.error(f"Settings dialog failed: {e}")
+            self.show_notification("Unable to open settings.", 3000)
+
+    def run_selected(self):
+        errors = []
+        timestamp = datetime.now().isoformat()
+        for name in self.selected_apps.copy():
+            for category in self.apps:
+                if name in self.apps[category]:
+                    path = self.apps[category][name]
+                    try:
+                        self.launch_item(path, "app")
+                        self.add_recent_item(name, path, category, "app", timestamp)
+                    except Exception as e:
+                        errors.append(f"Failed to open {name}: {str(e)}")
+        for name in self.selected_links.copy():
+            link = next((l for l in self.links if l["name"] == name), None)
+            if link:
+                try:
+                    self.launch_item(link["url"], "link")
+                    self.add_recent_item(name, link["url"], link.get("category", "General"), "link", timestamp)
+                except Exception as e:
+                    errors.append(f"Failed to open {name}: {str(e)}")
+        for name in self.selected_recent.copy():
+            item = next((i for i in self.recent_items if i["name"] == name.split(" (")[0]), None)
+            if item:
+                try:
+                    self.launch_item(item["path"], item["type"])
+                    self.add_recent_item(name.split(" (")[0], item["path"], item.get("category", "General"), item["type"], timestamp)
+                except Exception as e:
+                    errors.append(f"Failed to open {name}: {str(e)}")
+        for name in self.selected_pinned.copy():
+            item = next((i for i in self.pinned_items if i["name"] == name.split(" (")[0]), None)
+            if item:
+                try:
+                    self.launch_item(item["path"], item["type"])
+                    self.add_recent_item(name.split(" (")[0], item["path"], item.get("category", "General"), item["type"], timestamp)
+                except Exception as e:
+                    errors.append(f"Failed to open {name}: {str(e)}")
+        for error in errors:
+            self.show_notification(error, 5000, ok=False)
+        self.clear_selection()
+        self.update_content()
+        self.schedule_prewarm()
+
+    def launch_item(self, path, item_type, focus=True):
+        try:
+            if item_type == "app":
+                try:
+                    command = self.supervisor.build_command(path)
+                    pids = self.process_table.find(command[0]) if focus and self.focus_existing and self.process_table else []
+                    if pids:
+                        self.focus_running_instance(path, pids)
+                        return
+                    record = self.supervisor.spawn(Path(path).stem, path, command)
+                    metrics.observe("launch_spawn_seconds", record.spawn_latency)
+                    if self.process_table:
+                        self.process_table.track(record.pid, record.argv)
+                    self.monitor.track(path, record.pid)
+                    self.monitor_timer.start()
+                    if self.prewarm_enabled:
+                        # Give the app time to map its libraries before recording them.
+                        self.prewarm.learn_later(record.argv[0], record.pid)
+                except OSError:
+                    if not hasattr(os, "startfile"):
+                        raise
+                    # Shortcuts that cannot be resolved without pywin32 still open via the shell association.
+                    os.startfile(path)
+                self.on_processes_changed([])
+            else:
+                open_document(path)
+            logging.info("Launched %s: %s", item_type, path)
+            self.show_notification(f"Launched {item_type}: {Path(path).name}", 2000, category="launch")
+        except Exception as e:
+            logging.error("Failed to launch %s: %s", path, e)
+            self.show_notification(f"Failed to launch {item_type} {Path(path).name}: {str(e)}.", 4000, category="launch", ok=False)
+
+    def collect_selected_items(self):
+        items = []
+        for name in self.selected_apps:
+            for category in self.apps:
+                if name in self.apps[category]:
+                    items.append({"name": name, "path": self.apps[category][name], "category": category, "type": "app"})
+                    break
+        for name in self.selected_links:
+            link = next((l for l in self.links if l["name"] == name), None)
+            if link:
+                items.append({"name": name, "path": link["url"], "category": link.get("category", "General"), "type": "link"})
+        for name in self.selected_recent | self.selected_pinned:
+            source = self.recent_items if name in self.selected_recent else self.pinned_items
+            item = next((i for i in source if i["name"] == name.split(" (")[0]), None)
+            if item and not any(i["name"] == item["name"] and i["type"] == item["type"] for i in items):
+                items.append({"name": item["name"], "path": item["path"], "category": item.get("category", "General"), "type": item["type"]})
+        return items
+
+    def show_profiles_menu(self):
+        menu = QMenu()
+        menu.setStyleSheet(self.theme.menu)
+        menu.addAction("Save Selection as Profile...", self.save_profile_popup)
+        if self.profiles:
+            menu.addSeparator()
+        for profile in self.profiles:
+            profile_menu = menu.addMenu(f"{profile['name']} ({len(profile['items'])})")
+            profile_menu.addAction("Run", lambda name=profile["name"]: self.run_profile(name))
+            profile_menu.addAction("Edit Dependencies...", lambda name=profile["name"]: self.edit_profile_dependencies(name))
+            profile_menu.addAction("Delete", lambda name=profile["name"]: self.delete_profile(name))
+        menu.exec_(self.profiles_btn.mapToGlobal(QPoint(0, self.profiles_btn.height())))
+
+    def save_profile_popup(self):
+        items = self.collect_selected_items()
+        if not items:
+            self.show_notification("Select items to save as a profile.", 3000)
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Save Profile")
+        dialog.setFixedSize(350, 180)
+        dialog.setStyleSheet(self.theme.dialog)
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(12)
+        layout.addWidget(QLabel(f"Profile Name ({len(items)} items):"))
+        name_entry = QLineEdit()
+        name_entry.setToolTip("Enter a name for the launch profile")
+        layout.addWidget(name_entry)
+        save_btn = QPushButton("Save")
+        save_btn.setToolTip("Save profile")
+        save_btn.clicked.connect(lambda: self.save_profile(dialog, name_entry.text(), items))
+        layout.addWidget(save_btn)
+        dialog.exec_()
+
+    def save_profile(self, dialog, name, items):
+        name = name.strip()
+        if not name:
+            self.show_notification("Please enter a profile name.", 3000)
+            return
+        existing = next((p for p in self.profiles if p["name"] == name), None)
+        if existing:
+            existing["items"] = items
+        else:
+            self.profiles.append({"name": name, "items": items})
+        self.save_profiles()
+        self.show_notification(f"Profile {name} saved.", 2000)
+        dialog.accept()
+
+    def delete_profile(self, name):
+        self.profiles = [p for p in self.profiles if p["name"] != name]
+        self.save_profiles()
+        self.show_notification(f"Profile {name} deleted.", 2000)
+
+    def edit_profile_dependencies(self, name):
+        profile = next((p for p in self.profiles if p["name"] == name), None)
+        if not profile:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Profile Dependencies")
+        dialog.setFixedWidth(420)
+        dialog.setStyleSheet(self.theme.dialog)
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(8)
+        layout.addWidget(QLabel("Start each item after (comma-separated item names):"))
+        entries = []
+        for item in profile["items"]:
+            layout.addWidget(QLabel(item["name"]))
+            entry = QLineEdit(", ".join(item.get("after", [])))
+            entry.setPlaceholderText("e.g., VPN Client")
+            layout.addWidget(entry)
+            entries.append((item, entry))
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(lambda: self.save_profile_dependencies(dialog, profile, entries))
+        layout.addWidget(save_btn)
+        dialog.exec_()
+
+    def save_profile_dependencies(self, dialog, profile, entries):
+        # Keyed by position like plan_waves, since item names need not be unique.
+        previous = [item.get("after", []) for item, _ in entries]
+        for item, entry in entries:
+            item["after"] = [dep.strip() for dep in entry.text().split(",") if dep.strip()]
+        try:
+            plan_waves(profile["items"])
+        except ValueError as e:
+            for (item, _), after in zip(entries, previous):
+                item["after"] = after
+            self.show_notification(f"Invalid dependencies: {str(e)}.", 4000)
+            return
+        self.save_profiles()
+        self.show_notification(f"Dependencies for {profile['name']} saved.", 2000)
+        dialog.accept()
+
+    def run_profile(self, name):
+        profile = next((p for p in self.profiles if p["name"] == name), None)
+        if not profile:
+            self.show_notification(f"Profile {name} not found.", 3000)
+            return
+        if self.profile_run:
+            self.show_notification(f"Profile {self.profile_run['name']} is still launching.", 3000)
+            return
+        try:
+            waves = plan_waves(profile["items"], max_wave_size=4)
+        except ValueError as e:
+            self.show_notification(f"Cannot run {name}: {str(e)}.", 4000)
+            return
+        self.profile_run = {
+            "name": name, "waves": waves, "index": 0, "waited": 0.0,
+            "throttle": LoadThrottle(), "errors": [], "timestamp": datetime.now().isoformat()
+        }
+        self.launch_profile_wave()
+
+    def launch_profile_wave(self):
+        run = self.profile_run
+        for item in run["waves"][run["index"]]:
+            try:
+                self.launch_item(item["path"], item["type"])
+                self.add_recent_item(item["name"], item["path"], item.get("category", "General"), item["type"], run["timestamp"])
+            except Exception as e:
+                run["errors"].append(f"Failed to open {item['name']}: {str(e)}")
+        run["index"] += 1
+        if run["index"] >= len(run["waves"]):
+            self.finish_profile_run()
+            return
+        run["waited"] = 0.0
+        self.schedule_profile_wave()
+
+    def schedule_profile_wave(self):
+        run = self.profile_run
+        delay = run["throttle"].next_delay(run["waited"])
+        if delay is None:
+            self.launch_profile_wave()
+            return
+        run["waited"] += delay
+        self.stats_label.setText(f"Profile {run['name']}: wave {run['index'] + 1}/{len(run['waves'])} waiting for system load...")
+        QTimer.singleShot(int(delay * 1000), self.schedule_profile_wave)
+
+    def finish_profile_run(self):
+        run = self.profile_run
+        self.profile_run = None
+        if run["errors"]:
+            self.show_notification("\n".join(run["errors"]), 5000)
+        else:
+            self.show_notification(f"Profile {run['name']} launched.", 2000)
+        self.update_content()
+        self.schedule_prewarm()
+
+    def resolve_executable(self, path):
+        return self.supervisor.build_command(path)[0][0]
+
+    def schedule_prewarm(self):
+        if self.prewarm_enabled:
+            self.prewarm.schedule(predict_launches(self.recent_items, self.pinned_items))
+
+    def focus_running_instance(self, path, pids):
+        """Raise a window of pids off the GUI thread; on_instance_focused launches path if there is none."""
+        from proctable import FOCUS_ERRORS, focus_process
+
+        def run():
+            focused = False
+            try:
+                focused = focus_process(pids)
+            except FOCUS_ERRORS as e:
+                logging.warning(f"Failed to focus running instance of {path}: {str(e)}")
+            finally:
+                self.instanceFocused.emit(path, focused)
+        threading.Thread(target=run, name="FocusInstance", daemon=True).start()
+
+    def on_instance_focused(self, path, focused):
+        if not focused:
+            # Running, but without a window to raise (a tray app, a server): start another one as asked.
+            self.launch_item(path, "app", focus=False)
+            return
+        logging.info("Focused running instance of %s", path)
+        self.show_notification(f"Switched to running {Path(path).stem}.", 2000)
+
+    def on_processes_changed(self, finished):
+        for record in finished:
+            self.monitor.untrack_pid(record.pid)
+        running, _ = self.supervisor.snapshot()
+        self.running_btn.setText(f"Running ({len(running)})")
+        self.update_stats()
+        failed = [r for r in finished if r.status == "failed" and r.uptime() < 5]
+        if failed:
+            self.show_notification("\n".join(f"{r.name} exited with code {r.returncode}" for r in failed), 4000)
+
+    def refresh_resource_view(self):
+        if not self.monitor.items:
+            self.monitor_timer.stop()
+        self.content_list.viewport().update()
+
+    def on_stall(self, site, seconds):
+        metrics.observe("stall_seconds", seconds)
+        self.update_stats()
+
+    def profile_capturing(self):
+        return self.stack_sampler is not None and self.stack_sampler.running
+
+    def toggle_profile_capture(self):
+        if self.profile_capturing():
+            self.stack_sampler.stop()
+            return
+        snapshot = {
+            "apps": self.app_count,
+            "categories": len(self.apps),
+            "links": len(self.links),
+            "recent": len(self.recent_items),
+            "pinned": len(self.pinned_items),
+            "profiles": len(self.profiles),
+            "running": len(self.supervisor.running),
+            "icon_cache_memory": len(self.icon_cache),
+            "icon_cache_dir": str(self.icon_cache_dir),
+            "favicons": {"fetched": self.favicons.fetched, "failed": self.favicons.failed, "pending": len(self.favicons.pending)},
+            "search_cache": len(self.search_cache),
+            "search_index": len(self.search_index),
+            "view_mode": self.view_mode,
+            "metrics": [
+                {"name": name, "labels": labels, "count": count, "mean_ms": mean * 1000, "p95_ms": p95 * 1000}
+                for name, labels, count, mean, _, p95 in metrics.summary()
+            ],
+        }
+        self.stack_sampler = StackSampler(self.profile_seconds, snapshot=snapshot, on_done=lambda path: self.profileCaptured.emit(path or ""))
+        self.stack_sampler.start()
+        logging.info(f"Profile capture started for {self.profile_seconds}s")
+        self.show_notification(f"Profiling for {self.profile_seconds}s... (Ctrl+Shift+P to stop)", 2000)
+
+    def on_profile_captured(self, path):
+        if path:
+            self.show_notification(f"Profile written to {path}", 4000)
+        else:
+            self.show_notification("Profile capture failed; see the log.", 4000)
+
+    def show_running_menu(self):
+        running, history = self.supervisor.snapshot()
+        menu = QMenu()
+        menu.setStyleSheet(self.theme.menu)
+        if not running and not history:
+            menu.addAction("No launched processes").setEnabled(False)
+        for record in running:
+            menu.addAction(f"{record.describe()} | spawn {record.spawn_latency * 1000:.0f}ms").setEnabled(False)
+        if running and history:
+            menu.addSeparator()
+        for record in history[:10]:
+            menu.addAction(record.describe()).setEnabled(False)
+        menu.exec_(self.running_btn.mapToGlobal(QPoint(0, self.running_btn.height())))
+
+    def add_recent_item(self, name, path, category, item_type, timestamp):
+        previous = next((i for i in self.recent_items if i["name"] == name and i["type"] == item_type), {})
+        self.recent_items = [i for i in self.recent_items if not (i["name"] == name and i["type"] == item_type)]
+        self.recent_items.insert(0, {
+            "name": name,
+            "path": path,
+            "category": category,
+            "type": item_type,
+            "timestamp": timestamp,
+            "launch_count": previous.get("launch_count", 1) + 1 if previous else 1,
+            "is_favorite": any(i["name"] == name and i["type"] == item_type and i.get("is_favorite", False) for i in self.pinned_items + self.links)
+        })
+        self.recent_items = self.recent_items[:50]
+        self.save_recent()
+        self.update_stats()
+
+    def pin_selected(self):
+        for name in self.selected_apps:
+            for category in self.apps:
+                if name in self.apps[category]:
+                    if not any(i["name"] == name and i["type"] == "app" for i in self.pinned_items):
+                        self.pinned_items.append({"name": name, "path": self.apps[category][name], "category": category, "type": "app", "is_favorite": False})
+        for name in self.selected_links:
+            link = next((l for l in self.links if l["name"] == name), None)
+            if link and not any(i["name"] == name and i["type"] == "link" for i in self.pinned_items):
+                self.pinned_items.append({"name": name, "path": link["url"], "category": link.get("category", "General"), "type": "link", "is_favorite": link.get("is_favorite", False)})
+        for name in self.selected_recent:
+            item = next((i for i in self.recent_items if i["name"] == name.split(" (")[0]), None)
+            if item and not any(i["name"] == name.split(" (")[0] and i["type"] == item["type"] for i in self.pinned_items):
+                self.pinned_items.append({"name": name.split(" (")[0], "path": item["path"], "category": item.get("category", "General"), "type": item["type"], "is_favorite": item.get("is_favorite", False)})
+        self.save_pinned()
+        self.update_content()
+        self.show_notification("Items pinned.", 2000)
+
+    def unpin_selected(self):
+        self.pinned_items = [item for item in self.pinned_items if item["name"] not in [n.split(" (")[0] for n in self.selected_pinned]]
+        self.save_pinned()
+        self.update_content()
+        self.show_notification("Items unpinned.", 2000)
+
+    def clear_selection(self):
+        self.content_list.clearSelection()
+        self.reset_selection_tracking()
+        self.update_stats()
+
+    def add_link_popup(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Add Link")
+        dialog.setFixedSize(350, 240)
+        dialog.setStyleSheet(self.theme.dialog)
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(12)
+        layout.addWidget(QLabel("Link Name:"))
+        name_entry = QLineEdit()
+        name_entry.setToolTip("Enter the name for the link")
+        layout.addWidget(name_entry)
+        layout.addWidget(QLabel("URL or Path:"))
+        url_entry = QLineEdit()
+        url_entry.setToolTip("Enter the URL or file path")
+        layout.addWidget(url_entry)
+        save_btn = QPushButton("Save")
+        save_btn.setToolTip("Save link")
+        save_btn.clicked.connect(lambda: self.save_link(dialog, name_entry.text(), url_entry.text(), "General"))
+        layout.addWidget(save_btn)
+        self.open_dialog(dialog)
+
+    def save_link(self, dialog, name, url, category):
+        if not name.strip() or not url.strip():
+            self.show_notification("Please enter name and URL.", 3000)
+            return
+        if any(link["name"] == name.strip() for link in self.links):
+            self.show_notification("Link name already exists.", 3000)
+            return
+        self.links.append({"name": name.strip(), "url": url.strip(), "category": category, "is_favorite": False})
+        self.save_links()
+        self.update_content()
+        self.show_notification("Link added.", 2000)
+        dialog.accept()
+
+    def delete_selected(self):
+        if self.selected_links:
+            for link_name in self.selected_links.copy():
+                self.links = [link for link in self.links if link["name"] != link_name]
+                self.recent_items = [item for item in self.recent_items if item["name"] != link_name or item["type"] != "link"]
+                self.pinned_items = [item for item in self.pinned_items if item["name"] != link_name or item["type"] != "link"]
+            self.save_links()
+            self.save_recent()
+            self.save_pinned()
+            self.update_content()
+            self.show_notification("Links deleted.", 2000)
+
+    def edit_link_category(self):
+        if self.selected_links:
+            link_name = next(iter(self.selected_links))
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Edit Category")
+            dialog.setFixedSize(350, 200)
+            dialog.setStyleSheet(self.theme.dialog)
+            layout = QVBoxLayout(dialog)
+            layout.setSpacing(12)
+            layout.addWidget(QLabel("Category:"))
+            category_combo = QComboBox()
+            category_combo.addItems(["General"] + sorted({l.get("category", "General") for l in self.links}))
+            category_combo.setEditable(True)
+            category_combo.setToolTip("Select or enter a category")
+            layout.addWidget(category_combo)
+            save_btn = QPushButton("Save")
+            save_btn.setToolTip("Save category changes")
+            save_btn.clicked.connect(lambda: self.save_link_category(dialog, link_name, category_combo.currentText()))
+            layout.addWidget(save_btn)
+            self.open_dialog(dialog)
+
+    def save_link_category(self, dialog, link_name, category):
+        try:
+            for link in self.links:
+                if link["name"] == link_name:
+                    link["category"] = category.strip() or "General"
+            for item in self.recent_items + self.pinned_items:
+                if item["name"] == link_name and item["type"] == "link":
+                    item["category"] = category.strip() or "General"
+            self.save_links()
+            self.save_recent()
+            self.save_pinned()
+            self.update_content()
+            self.show_notification(f"Category updated to {category}.", 2000)
+            dialog.accept()
+        except Exception as e:
+            logging.error(f"Failed to update category: {str(e)}")
+            self.show_notification(f"Error updating category: {str(e)}.", 3000)
+
+    def copy_link_url(self):
+        try:
+            if self.selected_links:
+                link = next((l for l in self.links if l["name"] in self.selected_links), None)
+                if link:
+                    QApplication.clipboard().setText(link["url"])
+                    self.show_notification("URL copied to clipboard.", 2000)
+        except Exception as e:
+            logging.error(f"Failed to copy URL: {str(e)}")
+            self.show_notification(f"Error copying URL: {str(e)}.", 3000)
+
+    def open_app_location(self):
+        try:
+            for name in self.selected_apps:
+                for category in self.apps:
+                    if name in self.apps[category]:
+                        path = self.apps[category][name]
+                        folder = str(Path(path).parent)
+                        subprocess.Popen(f'explorer.exe /select,"{path}"', shell=True)
+                        self.show_notification(f"Opened location for {name}.", 2000)
+                        break
+        except Exception as e:
+            logging.error(f"Failed to open app location: {str(e)}")
+            self.show_notification(f"Error opening location: {str(e)}.", 3000)
+
+    def clear_recent(self):
+        try:
+            self.recent_items = []
+            self.save_recent()
+            self.update_content()
+            self.show_notification("Recent items cleared.", 2000)
+        except Exception as e:
+            logging.error(f"Failed to clear recent items: {str(e)}")
+            self.show_notification(f"Error clearing recent items: {str(e)}.", 3000)
+
+    def refresh_apps(self):
+        try:
+            self.load_apps_async()
+            self.show_notification("Apps refreshed.", 2000)
+        except Exception as e:
+            logging.error(f"Failed to refresh apps: {str(e)}")
+            self.show_notification(f"Error refreshing apps: {str(e)}.", 3000)
+
+    def show_notification(self, message, duration=3000, category=None, ok=True):
+        # Queued on the bus; everything posted before the timer fires is shown as one summary.
+        self.notifications.post(message, duration, category, ok)
+        if not self.notify_timer.isActive():
+            self.notify_timer.start(int(self.notifications.delay() * 1000))
+
+    def flush_notifications(self):
+        summary = self.notifications.flush()
+        if summary is None:
+            return
+        try:
+            self.notification_widget.show_message(*summary)
+        except Exception as e:
+            logging.error(f"Failed to show notification: {str(e)}")
+
+    def show_notification_history(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Notifications")
+        dialog.setFixedSize(480, 360)
+        dialog.setStyleSheet(self.theme.dialog)
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(12)
+        layout.addWidget(QLabel(f"Last {self.notifications.history.maxlen} notifications (! = failure):"))
+        history_view = QPlainTextEdit()
+        history_view.setReadOnly(True)
+        history_view.setStyleSheet("font: 11px monospace;")
+        history_view.setPlainText("\n".join(self.notifications.details()) or "No notifications yet.")
+        history_view.moveCursor(QTextCursor.End)
+        layout.addWidget(history_view)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.close)
+        layout.addWidget(close_btn)
+        self.open_dialog(dialog)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.title_bar.geometry().contains(event.pos()):
+            self.drag_pos = event.globalPos() - self.pos()
+            event.accept()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton and self.drag_pos is not None:
+            self.move(event.globalPos() - self.drag_pos)
+            event.accept()
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_pos = None
+            event.accept()
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        bookmark_files = [path for path in paths if os.path.basename(path) in ("Bookmarks", "places.sqlite")]
+        if bookmark_files:
+            self.start_bookmark_import([(os.path.basename(os.path.dirname(path)) or path, path) for path in bookmark_files])
+        elif paths:
+            self.start_import(paths)
+
+    def start_import(self, paths):
+        if self.import_thread is not None and self.import_thread.isRunning():
+            self.show_notification("An import is already running.", 2000)
+            return
+        # Snapshots only; deduplication against them happens on the worker.
+        self.import_thread = ImportThread(paths, [link["url"] for link in self.links],
+                                          [item["path"] for item in self.pinned_items if item["type"] == "app"])
+        self.import_thread.progressUpdate.connect(lambda count: self.stats_label.setText(f"Importing... {count} files read"))
+        self.import_thread.importFinished.connect(self.finish_import)
+        self.import_thread.errorSignal.connect(self.on_import_error)
+        self.progress_bar.setRange(0, 0)
+        self.stats_label.setText("Importing...")
+        self.import_thread.start()
+
+    def finish_import(self, result):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(100)
+        # Links and pinned items are addressed by name, so imported names are made unique.
+        if result.links:
+            names = {link["name"] for link in self.links}
+            for link in result.links:
+                link["name"] = unique_name(link["name"], names)
+                names.add(link["name"])
+            self.links.extend(result.links)
+            self.save_links()
+        if result.apps:
+            names = {item["name"] for item in self.pinned_items}
+            for item in result.apps:
+                item["name"] = unique_name(item["name"], names)
+                names.add(item["name"])
+            self.pinned_items.extend(result.apps)
+            self.save_pinned()
+        if result.links or result.apps:
+            self.update_content()
+        else:
+            self.update_stats()
+        logging.info("Import: %s scanned, %s links, %s shortcuts, %s duplicates, %s failed",
+                     result.scanned, len(result.links), len(result.apps), result.duplicates, len(result.failed))
+        self.show_notification(result.summary(), 4000, ok=not result.failed)
+
+    def start_bookmark_import(self, sources=None):
+        if self.import_thread is not None and self.import_thread.isRunning():
+            self.show_notification("An import is already running.", 2000)
+            return
+        self.import_thread = BookmarkImportThread(sources)
+        self.import_thread.progressUpdate.connect(lambda count: self.stats_label.setText(f"Importing bookmarks... {count} read"))
+        self.import_thread.importFinished.connect(self.finish_bookmark_import)
+        self.import_thread.errorSignal.connect(self.on_import_error)
+        self.progress_bar.setRange(0, 0)
+        self.stats_label.setText("Importing bookmarks...")
+        self.import_thread.start()
+
+    def finish_bookmark_import(self, changes):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(100)
+        if not changes.sources:
+            self.update_stats()
+            self.show_notification("No Chrome, Edge or Firefox profiles found.", 3000)
+            return
+        by_url = {normalize_url(link["url"]): link for link in self.links}
+        names = {link["name"] for link in self.links}
+        added = updated = 0
+        for key, url, name, category in changes.added:
+            # Already a link, added by hand or imported from another browser.
+            if key in by_url:
+                continue
+            link = {"name": unique_name(name, names), "url": url, "category": category, "is_favorite": False}
+            names.add(link["name"])
+            by_url[key] = link
+            self.links.append(link)
+            # unique_name may have suffixed it; the state has to hold the name the link really has.
+            changes.record(key, link["name"], category)
+            added += 1
+        # Renames, moves and deletions only touch links still as they were imported; local edits win.
+        # Recent and pinned entries refer to links by name, so they follow along.
+        renamed = {}
+        for key, old, new in changes.updated:
+            link = by_url.get(key)
+            if link and [link["name"], link.get("category")] == old:
+                previous_name = link["name"]
+                names.discard(link["name"])
+                link["name"] = unique_name(new[0], names)
+                link["category"] = new[1]
+                names.add(link["name"])
+                changes.record(key, link["name"], link["category"])
+                renamed[previous_name] = (link["name"], link["category"])
+                updated += 1
+        gone = set()
+        gone_names = set()
+        for key, old in changes.removed:
+            link = by_url.get(key)
+            if link and [link["name"], link.get("category")] == old and not link.get("is_favorite", False):
+                gone.add(key)
+                gone_names.add(link["name"])
+        if gone:
+            self.links = [link for link in self.links if normalize_url(link["url"]) not in gone]
+        if renamed or gone_names:
+            for item in self.recent_items + self.pinned_items:
+                if item["type"] == "link" and item["name"] in renamed:
+                    item["name"], item["category"] = renamed[item["name"]]
+            self.recent_items = [item for item in self.recent_items if item["name"] not in gone_names or item["type"] != "link"]
+            self.pinned_items = [item for item in self.pinned_items if item["name"] not in gone_names or item["type"] != "link"]
+            self.save_recent()
+            self.save_pinned()
+        if added or updated or gone:
+            self.save_links()
+            self.update_content()
+        else:
+            self.update_stats()
+        try:
+            with metrics.time("persist_write_seconds", file=BOOKMARKS_STATE_FILE):
+                save_state(changes.state)
+        except Exception as e:
+            logging.error(f"Failed to save bookmark import state: {str(e)}")
+        for label, error in changes.failed:
+            logging.warning("Bookmarks from %s skipped: %s", label, error)
+        self.show_notification(changes.summary(added, updated, len(gone)), 4000, ok=not changes.failed)
+
+    def start_link_check(self):
+        if self.link_check_thread is not None and self.link_check_thread.isRunning():
+            self.show_notification("A link check is already running.", 2000)
+            return
+        urls = [link["url"] for link in self.links]
+        if not urls:
+            self.show_notification("No links to check.", 2000)
+            return
+        self.link_check_done = 0
+        self.link_check_thread = LinkCheckThread(urls, self.link_health_cache)
+        self.link_check_thread.linksChecked.connect(self.apply_link_health)
+        self.link_check_thread.checkFinished.connect(self.finish_link_check)
+        self.link_check_thread.errorSignal.connect(self.on_import_error)
+        self.progress_bar.setRange(0, len(set(urls)))
+        self.progress_bar.setValue(0)
+        self.stats_label.setText(f"Checking {len(urls)} links...")
+        self.link_check_thread.start()
+
+    def apply_link_health(self, batch):
+        """Mark checked links on the Links tab; rows not built yet pick the result up from the cache."""
+        self.link_check_done += len(batch)
+        self.progress_bar.setValue(self.link_check_done)
+        if self.current_tab != 1:
+            return
+        by_name = {link["name"]: batch[link["url"]] for link in self.links if link["url"] in batch}
+        if not by_name:
+            return
+        model = self.content_model
+        for row in range(model.rowCount()):
+            result = by_name.get(model.data(model.index(row, 0), ITEM_ID_ROLE))
+            if result:
+                item = model.item(row)
+                item.setData(result[0], HEALTH_ROLE)
+                item.setToolTip(f"{result[0].capitalize()}: {result[1]}")
+
+    def finish_link_check(self, results):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(100)
+        self.update_stats()
+        counts = {status: 0 for status in (HEALTHY, REDIRECTED, BROKEN)}
+        for status, _ in results.values():
+            if status in counts:
+                counts[status] += 1
+        logging.info("Link check: %s links, %s healthy, %s redirected, %s broken",
+                     len(results), counts[HEALTHY], counts[REDIRECTED], counts[BROKEN])
+        self.show_notification(f"Checked {len(results)} links: {counts[HEALTHY]} healthy, {counts[REDIRECTED]} redirected, "
+                               f"{counts[BROKEN]} broken.", 4000)
+
+    def on_import_error(self, message):
+        self.progress_bar.setRange(0, 100)
+        self.update_stats()
+        logging.error(message)
+        self.show_notification(message, 4000, ok=False)
+
+    def toggle_maximize(self):
+        if self.is_maximized:
+            self.showNormal()
+            self.is_maximized = False
+        else:
+            self.showMaximized()
+            self.is_maximized = True
+
+    def close_window(self):
+        if self.minimize_to_tray:
+            self.hide()
+        else:
+            QApplication.quit()
+
+    def closeEvent(self, event):
+        if self.minimize_to_tray:
+            event.ignore()
+            self.hide()
+        else:
+            event.accept()
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    # A profiling run starts fresh and must not take over the resident instance's socket.
+    launcher = AppLauncher(single_instance=not {"--new-instance", "--profile-startup"} & set(sys.argv))
+    launcher.show()
+    command = parse_command(sys.argv[1:])
+    if command and command["command"] != "show":
+        # Launch/search targets may live in the app catalog, which is still loading.
+        launcher.pending_command = command
+    sys.exit(app.exec_())
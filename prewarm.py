@@ -0,0 +1,253 @@
+import os
+import json
+import math
+import time
+import threading
+import logging
+from datetime import datetime
+from profiles import read_pressure
+
+PREWARM_FILE = "prewarm.json"
+READ_CHUNK = 1024 * 1024
+
+
+def predict_launches(recent_items, pinned_items, limit=5, half_life_hours=72.0, now=None):
+    """Rank app launch targets by how likely they are to be launched next.
+
+    Each recent item contributes its launch count decayed by the age of its
+    last launch; pinned apps get a flat bonus so they are warmed even before
+    they build up history. Returns a list of paths, most likely first.
+    """
+    now = now or datetime.now()
+    scores = {}
+    for item in recent_items:
+        if item.get("type") != "app":
+            continue
+        try:
+            age_hours = max((now - datetime.fromisoformat(item.get("timestamp", ""))).total_seconds() / 3600, 0.0)
+        except ValueError:
+            age_hours = half_life_hours * 4
+        decay = math.pow(0.5, age_hours / half_life_hours)
+        scores[item["path"]] = scores.get(item["path"], 0.0) + item.get("launch_count", 1) * decay
+    for item in pinned_items:
+        if item.get("type") == "app":
+            scores[item["path"]] = scores.get(item["path"], 0.0) + 0.5
+    return [path for path, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]]
+
+
+def mapped_files(pid, proc_root="/proc"):
+    """Return the regular files a running process has mapped (its binary and shared libraries)."""
+    files = []
+    seen = set()
+    try:
+        with open(f"{proc_root}/{pid}/maps", "r") as f:
+            for line in f:
+                parts = line.split(None, 5)
+                if len(parts) == 6:
+                    path = parts[5].strip()
+                    if path.startswith("/") and not path.endswith("(deleted)") and path not in seen:
+                        seen.add(path)
+                        files.append(path)
+    except OSError:
+        pass
+    return files
+
+
+def available_memory_mb():
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def warm_file(path, budget_bytes):
+    """Pull path into the page cache, spending at most budget_bytes; returns bytes requested."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+    length = min(size, budget_bytes)
+    if length <= 0:
+        return 0
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return 0
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Asks the kernel to start readahead without copying anything into our process.
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        else:
+            remaining = length
+            while remaining > 0:
+                chunk = os.read(fd, min(READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+    except OSError as e:
+        logging.debug("Prewarm of %s failed: %s", path, e)
+        return 0
+    finally:
+        os.close(fd)
+    return length
+
+
+class PrewarmService:
+    """Opt-in background service that warms the page cache for likely launches.
+
+    The set of files per executable is learned from /proc/<pid>/maps of apps
+    we launched (falling back to the executable alone) and kept in
+    prewarm.json. Each cycle stays within budget_mb, skips files warmed in the
+    last rewarm_after seconds and backs off exponentially while memory is
+    scarce or under pressure, so warming never competes with real work.
+    """
+    def __init__(self, resolve, budget_mb=256, interval=300, rewarm_after=900, max_pressure=10.0, manifest_file=PREWARM_FILE):
+        self.resolve = resolve
+        self.budget_mb = budget_mb
+        self.interval = interval
+        self.rewarm_after = rewarm_after
+        self.max_pressure = max_pressure
+        self.manifest_file = manifest_file
+        self.manifest = self.load_manifest()
+        self.candidates = []
+        self.cycle_requested = False
+        self.pending_learns = []
+        self.warmed = {}
+        self.backoff = 1
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_cycle = None
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_file, "r") as f:
+                manifest = json.load(f)
+            return {k: v for k, v in manifest.items() if isinstance(v, list)} if isinstance(manifest, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_manifest(self):
+        try:
+            with self.lock:
+                manifest = dict(self.manifest)
+            with open(self.manifest_file, "w") as f:
+                json.dump(manifest, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save prewarm manifest: {str(e)}")
+
+    def learn(self, executable, pid):
+        """Record the files a freshly launched process mapped."""
+        files = mapped_files(pid)
+        if not files:
+            return
+        with self.lock:
+            changed = self.manifest.get(executable) != files
+            self.manifest[executable] = files
+        if changed:
+            self.save_manifest()
+
+    def learn_later(self, executable, pid, delay=5.0):
+        """Have the worker learn pid's mapped files once it has had delay seconds to load them."""
+        with self.lock:
+            self.pending_learns.append((time.monotonic() + delay, executable, pid))
+        self.start()
+        self.wakeup.set()
+
+    def learn_due(self):
+        now = time.monotonic()
+        with self.lock:
+            due = [entry for entry in self.pending_learns if entry[0] <= now]
+            self.pending_learns = [entry for entry in self.pending_learns if entry[0] > now]
+        for _, executable, pid in due:
+            try:
+                self.learn(executable, pid)
+            except Exception as e:
+                logging.error(f"Prewarm learning for {executable} failed: {str(e)}")
+
+    def schedule(self, paths):
+        """Replace the candidate launch paths and run a cycle soon."""
+        with self.lock:
+            self.candidates = list(paths)
+            self.cycle_requested = True
+        self.start()
+        self.wakeup.set()
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive() and self.stop_event.is_set():
+            # A stopped worker exits at its next check; wait for it so the restart is not lost.
+            self.thread.join()
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name="Prewarm", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wakeup.set()
+
+    def run(self):
+        deadline = time.monotonic() + self.interval * self.backoff
+        while not self.stop_event.is_set():
+            with self.lock:
+                due = min([entry[0] for entry in self.pending_learns], default=deadline)
+            self.wakeup.wait(max(min(due, deadline) - time.monotonic(), 0))
+            self.wakeup.clear()
+            if self.stop_event.is_set():
+                break
+            self.learn_due()
+            with self.lock:
+                requested, self.cycle_requested = self.cycle_requested, False
+            if not requested and time.monotonic() < deadline:
+                continue
+            try:
+                self.cycle()
+            except Exception as e:
+                logging.error(f"Prewarm cycle failed: {str(e)}")
+            deadline = time.monotonic() + self.interval * self.backoff
+
+    def memory_constrained(self):
+        pressure = read_pressure("memory")
+        if pressure is not None and pressure > self.max_pressure:
+            return True
+        available = available_memory_mb()
+        return available is not None and available < self.budget_mb * 4
+
+    def cycle(self):
+        """Warm files for the current candidates; returns the number of bytes requested."""
+        if self.memory_constrained():
+            self.backoff = min(self.backoff * 2, 16)
+            logging.info(f"Prewarm skipped under memory pressure, backing off x{self.backoff}")
+            return 0
+        self.backoff = 1
+        budget = self.budget_mb * 1024 * 1024
+        spent = 0
+        now = time.monotonic()
+        with self.lock:
+            candidates = list(self.candidates)
+        for path in candidates:
+            if self.stop_event.is_set():
+                break
+            try:
+                executable = self.resolve(path)
+            except Exception as e:
+                logging.debug("Cannot resolve %s for prewarm: %s", path, e)
+                continue
+            with self.lock:
+                files = self.manifest.get(executable) or [executable]
+            for file in files:
+                if spent >= budget:
+                    break
+                if now - self.warmed.get(file, -self.rewarm_after) < self.rewarm_after:
+                    continue
+                spent += warm_file(file, budget - spent)
+                self.warmed[file] = now
+        self.last_cycle = {"time": time.time(), "bytes": spent, "candidates": len(candidates)}
+        if spent:
+            logging.info(f"Prewarmed {spent / (1024 * 1024):.1f}MB for {len(candidates)} likely launches")
+        return spent
@@ -0,0 +1,190 @@
+import os
+import time
+import threading
+import logging
+from array import array
+
+PROC_ROOT = "/proc"
+
+
+class RingBuffer:
+    """Fixed-size array-backed ring of floats; appending never allocates."""
+    def __init__(self, capacity):
+        self.data = array("f", bytes(4 * capacity))
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def latest(self):
+        return self.data[self.head - 1] if self.count else 0.0
+
+    def values(self):
+        """Return samples oldest first."""
+        if self.count < self.capacity:
+            return self.data[:self.count]
+        return self.data[self.head:] + self.data[:self.head]
+
+
+def read_stat(pid, proc_root=PROC_ROOT):
+    """Return (ppid, utime + stime in clock ticks, rss pages) from /proc/<pid>/stat, or None if exited."""
+    try:
+        with open(f"{proc_root}/{pid}/stat", "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces and parentheses, so split after the last ')'.
+    fields = raw[raw.rfind(b")") + 2:].split()
+    if fields[:1] == [b"Z"]:
+        return None
+    try:
+        return int(fields[1]), int(fields[11]) + int(fields[12]), int(fields[21])
+    except (IndexError, ValueError):
+        return None
+
+
+class TrackedItem:
+    def __init__(self, capacity):
+        self.roots = set()
+        self.pids = set()
+        self.cpu = RingBuffer(capacity)
+        self.rss = RingBuffer(capacity)
+        self.last_ticks = {}
+
+
+class ResourceMonitor:
+    """Samples CPU and resident memory of launched process trees from /proc.
+
+    Items are keyed by launch path and may own several root pids; descendants
+    are discovered by a full /proc scan only every tree_refresh samples, so a
+    regular sample reads one stat file per tracked pid (its rss field is the
+    same counter statm reports, so statm is not opened separately). Samples
+    land in per-item RingBuffers (CPU percent of one core, RSS in MB).
+    """
+    def __init__(self, interval=1.0, capacity=60, tree_refresh=5, proc_root=PROC_ROOT):
+        self.interval = interval
+        self.capacity = capacity
+        self.tree_refresh = tree_refresh
+        self.proc_root = proc_root
+        self.available = os.path.isdir(os.path.join(proc_root, "self"))
+        self.clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.page_mb = (os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096) / (1024 * 1024)
+        self.items = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.samples = 0
+        self.last_sample_time = None
+        self.cpu_time = 0.0
+
+    def track(self, key, pid):
+        if not self.available:
+            return
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                item = self.items[key] = TrackedItem(self.capacity)
+            item.roots.add(pid)
+            item.pids.add(pid)
+        self.start()
+
+    def untrack_pid(self, pid):
+        """Forget an exited root pid; its item stays while any known descendant still runs."""
+        with self.lock:
+            for key, item in list(self.items.items()):
+                item.roots.discard(pid)
+                item.pids.discard(pid)
+                if not item.roots and not item.pids:
+                    del self.items[key]
+
+    def series(self, key):
+        """Return (cpu RingBuffer, rss RingBuffer) for key, or None if untracked."""
+        item = self.items.get(key)
+        return (item.cpu, item.rss) if item else None
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name="ResourceMonitor", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            with self.lock:
+                idle = not self.items
+            if idle:
+                continue
+            try:
+                self.sample_once()
+            except Exception as e:
+                logging.error(f"Resource sample failed: {str(e)}")
+
+    def refresh_trees(self):
+        children = {}
+        try:
+            entries = os.listdir(self.proc_root)
+        except OSError:
+            return
+        alive = set()
+        for entry in entries:
+            if entry.isdigit():
+                stat = read_stat(entry, self.proc_root)
+                if stat:
+                    children.setdefault(stat[0], []).append(int(entry))
+                    alive.add(int(entry))
+        with self.lock:
+            items = list(self.items.values())
+        for item in items:
+            pids = set()
+            # Descendants orphaned by an exited root are reparented, so keep walking from the ones already known.
+            stack = list(item.roots | (item.pids & alive))
+            while stack:
+                pid = stack.pop()
+                if pid not in pids:
+                    pids.add(pid)
+                    stack.extend(children.get(pid, ()))
+            item.pids = pids
+
+    def sample_once(self):
+        cpu_start = time.thread_time()
+        now = time.monotonic()
+        elapsed = now - self.last_sample_time if self.last_sample_time else None
+        self.last_sample_time = now
+        if self.samples % self.tree_refresh == 0:
+            self.refresh_trees()
+        self.samples += 1
+        with self.lock:
+            items = list(self.items.items())
+        finished = []
+        for key, item in items:
+            total_delta = 0
+            rss_pages = 0
+            ticks = {}
+            for pid in item.pids:
+                stat = read_stat(pid, self.proc_root)
+                if stat is None:
+                    continue
+                ticks[pid] = stat[1]
+                total_delta += stat[1] - item.last_ticks.get(pid, stat[1])
+                rss_pages += stat[2]
+            item.pids = set(ticks) | item.roots
+            item.last_ticks = ticks
+            cpu = total_delta / self.clock_ticks / elapsed * 100 if elapsed else 0.0
+            item.cpu.append(cpu)
+            item.rss.append(rss_pages * self.page_mb)
+            if not item.pids:
+                finished.append((key, item))
+        if finished:
+            with self.lock:
+                for key, item in finished:
+                    if self.items.get(key) is item and not item.roots and not item.pids:
+                        del self.items[key]
+        self.cpu_time += time.thread_time() - cpu_start
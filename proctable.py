@@ -0,0 +1,223 @@
+import os
+import sys
+import time
+import shutil
+import threading
+import subprocess
+import logging
+try:
+    import win32api
+    import win32con
+    import win32gui
+    import win32process
+    import pywintypes
+    HAS_WIN32 = True
+    # win32gui reports failures (say SetForegroundWindow being refused) as pywintypes.error, which is not an OSError.
+    FOCUS_ERRORS = (OSError, subprocess.SubprocessError, pywintypes.error)
+except ImportError:
+    HAS_WIN32 = False
+    FOCUS_ERRORS = (OSError, subprocess.SubprocessError)
+
+PROC_ROOT = "/proc"
+MAX_FOCUS_PIDS = 4
+
+
+def normalize_path(path):
+    return os.path.normcase(os.path.realpath(path))
+
+
+def argv_key(argv):
+    """Match key for a command line: the resolved executable plus its arguments.
+
+    Arguments are part of the key so "python3 a.py" and "java -jar b.jar" are
+    not mistaken for any other script running under the same interpreter.
+    """
+    return (normalize_path(argv[0]),) + tuple(argv[1:])
+
+
+class ProcessTable:
+    """Cache of running processes keyed by resolved command line.
+
+    refresh() only inspects pids that appeared since the previous refresh and
+    forgets the ones that vanished, so keeping the table current costs one
+    directory listing plus a few small /proc reads per new process. find() is
+    a dict lookup followed by a start-time check of the candidate pids, so a
+    recycled pid is never taken for the process it replaced.
+    """
+    def __init__(self, max_age=2.0, proc_root=PROC_ROOT):
+        self.max_age = max_age
+        self.proc_root = proc_root
+        self.available = os.path.isdir(os.path.join(proc_root, "self")) or HAS_WIN32
+        self.by_pid = {}
+        self.by_key = {}
+        self.refreshed = 0.0
+        self.lock = threading.Lock()
+        self.thread = None
+        self.own_pid = os.getpid()
+
+    def add(self, pid, keys, started):
+        with self.lock:
+            self.by_pid[pid] = (keys, started)
+            for key in keys:
+                self.by_key.setdefault(key, set()).add(pid)
+
+    def track(self, pid, argv):
+        """Register a process we just spawned so it is found before the next refresh."""
+        started = self.start_time(pid)
+        if started is not None:
+            self.add(pid, [argv_key(argv)], started)
+
+    def remove(self, pid):
+        with self.lock:
+            keys, _ = self.by_pid.pop(pid, ((), None))
+            for key in keys:
+                pids = self.by_key.get(key)
+                if pids:
+                    pids.discard(pid)
+                    if not pids:
+                        del self.by_key[key]
+
+    def list_pids(self):
+        if HAS_WIN32 and sys.platform == "win32":
+            return set(win32process.EnumProcesses())
+        return {int(entry) for entry in os.listdir(self.proc_root) if entry.isdigit()}
+
+    def start_time(self, pid):
+        """An opaque process start time, or None once the pid is gone."""
+        if HAS_WIN32 and sys.platform == "win32":
+            try:
+                handle = win32api.OpenProcess(win32con.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+                try:
+                    return str(win32process.GetProcessTimes(handle)["CreationTime"])
+                finally:
+                    win32api.CloseHandle(handle)
+            except Exception:
+                return None
+        try:
+            with open(f"{self.proc_root}/{pid}/stat", "rb") as f:
+                # Field 22 (starttime), counted after the parenthesised command name, which may contain spaces.
+                return int(f.read().rsplit(b")", 1)[1].split()[19])
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def read_keys(self, pid):
+        """Return the command-line keys a process is known by."""
+        keys = []
+        if HAS_WIN32 and sys.platform == "win32":
+            # Other processes' arguments are not readable here, so only plain executables match.
+            try:
+                handle = win32api.OpenProcess(win32con.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+                try:
+                    keys.append(argv_key([win32process.GetModuleFileNameEx(handle, 0)]))
+                finally:
+                    win32api.CloseHandle(handle)
+            except Exception:
+                pass
+            return keys
+        try:
+            with open(f"{self.proc_root}/{pid}/cmdline", "rb") as f:
+                argv = [arg.decode(errors="replace") for arg in f.read().split(b"\0")[:-1]]
+        except OSError:
+            return keys
+        if not argv:
+            return keys
+        try:
+            keys.append((normalize_path(os.readlink(f"{self.proc_root}/{pid}/exe")),) + tuple(argv[1:]))
+        except OSError:
+            pass
+        # Interpreted launchers (scripts, wrappers) only show their real target in argv[0],
+        # and a script started through its shebang shows up as "interpreter /path/to/script ...".
+        for start in (0, 1):
+            if len(argv) > start and os.path.isabs(argv[start]):
+                key = argv_key(argv[start:])
+                if key not in keys:
+                    keys.append(key)
+        return keys
+
+    def refresh(self):
+        """Incrementally sync the table with the running processes."""
+        if not self.available:
+            return
+        try:
+            current = self.list_pids()
+        except OSError as e:
+            logging.warning(f"Process table refresh failed: {str(e)}")
+            return
+        with self.lock:
+            known = set(self.by_pid)
+        for pid in known - current:
+            self.remove(pid)
+        for pid in current - known:
+            if pid != self.own_pid:
+                started = self.start_time(pid)
+                if started is not None:
+                    self.add(pid, self.read_keys(pid), started)
+        self.refreshed = time.monotonic()
+
+    def start(self):
+        """Keep the table fresh from a background thread."""
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="ProcessTable", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.error(f"Process table refresh failed: {str(e)}")
+            time.sleep(self.max_age)
+
+    def find(self, argv):
+        """Return the pids running exactly the command line argv (possibly empty)."""
+        key = argv_key(argv)
+        with self.lock:
+            candidates = [(pid, self.by_pid[pid][1]) for pid in self.by_key.get(key, ())]
+        live = []
+        for pid, started in candidates:
+            if self.start_time(pid) == started:
+                live.append(pid)
+            else:
+                self.remove(pid)
+        return live
+
+
+def focus_process(pids):
+    """Raise a top-level window owned by one of pids; returns True on success."""
+    pids = set(pids)
+    if HAS_WIN32 and sys.platform == "win32":
+        windows = []
+
+        def collect(hwnd, _):
+            if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd):
+                if win32process.GetWindowThreadProcessId(hwnd)[1] in pids:
+                    windows.append(hwnd)
+            return True
+
+        win32gui.EnumWindows(collect, None)
+        if not windows:
+            return False
+        hwnd = windows[0]
+        if win32gui.IsIconic(hwnd):
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        win32gui.SetForegroundWindow(hwnd)
+        return True
+
+    xdotool = shutil.which("xdotool")
+    if xdotool:
+        # Newest first, and only a few: each search is a subprocess.
+        for pid in sorted(pids, reverse=True)[:MAX_FOCUS_PIDS]:
+            result = subprocess.run([xdotool, "search", "--onlyvisible", "--pid", str(pid)], capture_output=True, text=True, timeout=1)
+            window_ids = result.stdout.split()
+            if window_ids:
+                subprocess.run([xdotool, "windowactivate", window_ids[0]], capture_output=True, timeout=1)
+                return True
+    wmctrl = shutil.which("wmctrl")
+    if wmctrl:
+        result = subprocess.run([wmctrl, "-lp"], capture_output=True, text=True, timeout=1)
+        for line in result.stdout.splitlines():
+            fields = line.split(None, 3)
+            if len(fields) >= 3 and fields[2].isdigit() and int(fields[2]) in pids:
+                subprocess.run([wmctrl, "-i", "-a", fields[0]], capture_output=True, timeout=1)
+                return True
+    return False
@@ -0,0 +1,149 @@
+import os
+import time
+import logging
+
+PROFILES_FILE = "profiles.json"
+
+
+def validate_profile(profile):
+    """Return True if profile looks like {"name": str, "items": [item, ...]}."""
+    if not isinstance(profile, dict) or not isinstance(profile.get("name"), str):
+        return False
+    items = profile.get("items")
+    if not isinstance(items, list):
+        return False
+    return all(isinstance(i, dict) and "name" in i and "path" in i and "type" in i for i in items)
+
+
+def plan_waves(items, max_wave_size=None):
+    """Group profile items into dependency-ordered waves.
+
+    Each item may list the names of items it must start after in "after".
+    Items in the same wave have no dependencies on each other and can be
+    launched together; waves larger than max_wave_size are split so the
+    throttle gets a chance to run between them. Unknown dependencies are
+    ignored; cycles raise ValueError. Items may share a name (an app and a
+    link called the same, say): all of them are launched, and depending on
+    that name waits for every one of them.
+    """
+    indices = {}
+    for index, item in enumerate(items):
+        indices.setdefault(item["name"], []).append(index)
+    pending = {}
+    for index, item in enumerate(items):
+        deps = set()
+        for dep in item.get("after", []) or []:
+            if dep == item["name"]:
+                continue
+            if dep in indices:
+                deps.update(indices[dep])
+            else:
+                logging.warning(f"Profile item {item['name']} depends on unknown item {dep}, ignoring.")
+        pending[index] = deps
+
+    waves = []
+    done = set()
+    while pending:
+        ready = [index for index, deps in pending.items() if deps <= done]
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {', '.join(sorted({items[index]['name'] for index in pending}))}")
+        wave = [items[index] for index in ready]
+        step = max_wave_size or len(wave)
+        waves.extend(wave[start:start + step] for start in range(0, len(wave), step))
+        for index in ready:
+            del pending[index]
+        done.update(ready)
+    return waves
+
+
+def read_pressure(resource, proc_root="/proc"):
+    """Return the PSI "some avg10" percentage for cpu/io/memory, or None if unavailable."""
+    try:
+        with open(os.path.join(proc_root, "pressure", resource), "r") as f:
+            for line in f:
+                if line.startswith("some"):
+                    for field in line.split()[1:]:
+                        key, _, value = field.partition("=")
+                        if key == "avg10":
+                            return float(value)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def sample_system_load(proc_root="/proc"):
+    """Return (normalized 1-minute loadavg, worst PSI avg10 percentage or None)."""
+    try:
+        load = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        load = 0.0
+    pressures = [p for p in (read_pressure(r, proc_root) for r in ("io", "cpu", "memory")) if p is not None]
+    return load, (max(pressures) if pressures else None)
+
+
+class LoadThrottle:
+    """Decides how long to hold back the next launch wave based on system load.
+
+    PSI (/proc/pressure) reacts within seconds and is preferred when present;
+    the 1-minute loadavg is only used as a fallback because it lags far behind
+    a burst of cold starts.
+    """
+    def __init__(self, max_load=0.9, max_pressure=25.0, min_gap=0.2, poll_interval=0.25, max_wait=5.0, sampler=None):
+        self.max_load = max_load
+        self.max_pressure = max_pressure
+        self.min_gap = min_gap
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.sampler = sampler or sample_system_load
+
+    def overloaded(self):
+        load, pressure = self.sampler()
+        if pressure is not None:
+            return pressure > self.max_pressure
+        return load > self.max_load
+
+    def next_delay(self, waited):
+        """Return seconds to wait before re-checking, or None if the next wave may start."""
+        if self.min_gap - waited > 1e-3:
+            return self.min_gap - waited
+        if self.max_wait - waited <= 1e-3 or not self.overloaded():
+            return None
+        return min(self.poll_interval, self.max_wait - waited)
+
+
+class WaveRunner:
+    """Launches profile items wave by wave, throttling between waves.
+
+    This is the blocking variant used outside the GUI; AppLauncher drives the
+    same throttle from a QTimer so the event loop is never put to sleep.
+    """
+    def __init__(self, launch, throttle=None, max_wave_size=4, sleep=time.sleep, clock=time.monotonic):
+        self.launch = launch
+        self.throttle = throttle or LoadThrottle()
+        self.max_wave_size = max_wave_size
+        self.sleep = sleep
+        self.clock = clock
+
+    def wait_for_capacity(self):
+        start = self.clock()
+        while True:
+            delay = self.throttle.next_delay(self.clock() - start)
+            if delay is None:
+                return self.clock() - start
+            self.sleep(delay)
+
+    def run(self, items):
+        """Launch all items; returns a list of (item, error or None)."""
+        results = []
+        waves = plan_waves(items, self.max_wave_size)
+        for index, wave in enumerate(waves):
+            if index:
+                self.wait_for_capacity()
+            for item in wave:
+                try:
+                    self.launch(item)
+                    results.append((item, None))
+                except Exception as e:
+                    logging.error(f"Failed to launch profile item {item['name']}: {str(e)}")
+                    results.append((item, str(e)))
+        return results
@@ -0,0 +1,118 @@
+"""On-demand sampling profiler for field reports.
+
+A background thread reads every thread's stack with sys._current_frames() at
+a fixed interval for a bounded duration; nothing is traced between samples,
+so the launcher keeps running at close to full speed while a capture is in
+progress. Stacks are written in the collapsed format read by flamegraph.pl
+and speedscope, next to a JSON snapshot of catalog and cache sizes.
+"""
+import os
+import sys
+import json
+import time
+import threading
+import logging
+from collections import Counter
+
+CAPTURE_DIR = "captures"
+MAX_DEPTH = 128
+
+
+def frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse(frame, thread_name):
+    """Return the root-first ';'-joined stack for frame, prefixed with the thread name."""
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def directory_stats(path):
+    """Return {"files", "mb"} for the regular files directly in path."""
+    files, size = 0, 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files += 1
+                    size += entry.stat().st_size
+    except OSError:
+        pass
+    return {"files": files, "mb": round(size / (1024 * 1024), 2)}
+
+
+class StackSampler:
+    """Samples all Python thread stacks for duration seconds on its own thread.
+
+    on_done(folded_path) is called from the sampler thread once the capture
+    has been written; callers that touch widgets must marshal it themselves.
+    """
+    def __init__(self, duration=10.0, interval=0.01, snapshot=None, output_dir=CAPTURE_DIR, on_done=None):
+        self.duration = duration
+        self.interval = interval
+        self.snapshot = snapshot or {}
+        self.output_dir = output_dir
+        self.on_done = on_done
+        self.stacks = Counter()
+        self.samples = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="StackSampler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """End the capture early; whatever was sampled so far is still written."""
+        self.stop_event.set()
+
+    def sample_once(self):
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident != own:
+                self.stacks[collapse(frame, names.get(ident, f"thread-{ident}"))] += 1
+        self.samples += 1
+
+    def run(self):
+        started = time.perf_counter()
+        deadline = started + self.duration
+        try:
+            while not self.stop_event.is_set() and time.perf_counter() < deadline:
+                self.sample_once()
+                self.stop_event.wait(self.interval)
+            path = self.write(time.perf_counter() - started)
+        except Exception as e:
+            logging.error(f"Profile capture failed: {str(e)}")
+            path = None
+        if self.on_done:
+            self.on_done(path)
+
+    def write(self, elapsed):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, time.strftime("capture-%Y%m%d-%H%M%S"))
+        with open(f"{base}.folded", "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        snapshot = dict(self.snapshot)
+        snapshot["profile"] = {"seconds": round(elapsed, 3), "samples": self.samples, "interval": self.interval, "stacks": len(self.stacks)}
+        snapshot["platform"] = {"python": sys.version.split()[0], "os": sys.platform}
+        if "icon_cache_dir" in snapshot:
+            snapshot["icon_cache_disk"] = directory_stats(snapshot["icon_cache_dir"])
+        with open(f"{base}.json", "w") as f:
+            json.dump(snapshot, f, indent=4)
+        logging.info(f"Profile capture: {self.samples} samples in {elapsed:.1f}s written to {base}.folded")
+        return f"{base}.folded"
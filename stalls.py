@@ -0,0 +1,105 @@
+"""Event-loop stall detection.
+
+The GUI calls beat() from a repeating QTimer. A watchdog thread wakes every
+threshold seconds and, if the beat is overdue, grabs the main thread's Python
+stack once for that stall. When the late beat finally arrives its lateness
+is charged to the captured call site. While the loop is healthy the thread
+only compares two floats per wake-up.
+"""
+import os
+import sys
+import time
+import threading
+import logging
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def call_site(frame):
+    """Return (site, stack) for frame: the innermost launcher frame and the full stack, innermost first."""
+    stack = []
+    site = None
+    while frame is not None:
+        code = frame.f_code
+        label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+        stack.append(label)
+        if site is None and os.path.dirname(os.path.abspath(code.co_filename)) == PACKAGE_DIR:
+            site = label
+        frame = frame.f_back
+    return site or (stack[0] if stack else "unknown"), stack
+
+
+class StallWatchdog:
+    """Aggregates event-loop stalls longer than threshold by call site.
+
+    Gaps above max_stall (suspend/resume, a debugger pause) are ignored.
+    """
+    def __init__(self, threshold=0.05, interval=0.1, max_stall=30.0, on_stall=None, clock=time.monotonic):
+        self.threshold = threshold
+        self.interval = interval
+        self.max_stall = max_stall
+        self.on_stall = on_stall
+        self.clock = clock
+        self.main_ident = threading.main_thread().ident
+        self.last_beat = clock()
+        self.pending = None
+        self.sites = {}
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def beat(self):
+        now = self.clock()
+        late = now - self.last_beat - self.interval
+        self.last_beat = now
+        pending, self.pending = self.pending, None
+        if self.threshold < late < self.max_stall:
+            site, stack = pending or ("unknown (stack not captured)", [])
+            self.record(site, stack, late)
+
+    def record(self, site, stack, seconds):
+        entry = self.sites.get(site)
+        if entry is None:
+            entry = self.sites[site] = {"count": 0, "total": 0.0, "max": 0.0, "stack": stack}
+        entry["count"] += 1
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+        self.count += 1
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+        logging.warning("Event loop stalled %.0fms at %s", seconds * 1000, site)
+        if self.on_stall:
+            self.on_stall(site, seconds)
+
+    def check(self):
+        """Capture the main thread's stack if the current beat is overdue; runs on the watchdog thread."""
+        if self.pending is not None or self.clock() - self.last_beat - self.interval <= self.threshold:
+            return
+        frame = sys._current_frames().get(self.main_ident)
+        if frame is not None:
+            self.pending = call_site(frame)
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.last_beat = self.clock()
+        self.thread = threading.Thread(target=self.run, name="StallWatchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.wait(self.threshold):
+            try:
+                self.check()
+            except Exception as e:
+                logging.error(f"Stall watchdog check failed: {str(e)}")
+
+    def summary(self, limit=10):
+        """Return (site, count, total, max) for the worst call sites by total stalled time."""
+        rows = [(site, e["count"], e["total"], e["max"]) for site, e in self.sites.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)[:limit]
@@ -0,0 +1,48 @@
+"""Start-up timing for --profile-startup.
+
+open.py marks the end of each import group and wraps every start-up stage in
+profiler.stage(), so a regression in either shows up in the printed breakdown.
+Only the standard library is imported here because it runs before PyQt5.
+"""
+import sys
+import time
+import logging
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.last = self.origin
+        self.imports = []
+        self.stages = []
+        self.enabled = "--profile-startup" in sys.argv
+
+    def mark_import(self, label):
+        now = time.perf_counter()
+        self.imports.append((label, now - self.last))
+        self.last = now
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.stages.append((name, end - start, end - self.origin))
+
+    def report(self):
+        lines = ["Import time:"]
+        lines.extend(f"  {label:<28}{seconds * 1000:8.1f}ms" for label, seconds in self.imports)
+        lines.append("Start-up stages (duration / since start-up):")
+        lines.extend(f"  {name:<28}{seconds * 1000:8.1f}ms {at * 1000:8.1f}ms" for name, seconds, at in self.stages)
+        return "\n".join(lines)
+
+    def finish(self):
+        logging.info("Startup profile:\n%s", self.report())
+        if self.enabled:
+            print(self.report(), file=sys.stderr)
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,291 @@
+import os
+import sys
+import shlex
+import shutil
+import threading
+import subprocess
+import time
+import logging
+import webbrowser
+from collections import deque
+try:
+    from win32com.shell import shell
+    import pythoncom
+    import pywintypes
+    HAS_WIN32 = True
+    # A corrupt or unreadable .lnk fails inside COM with com_error, which is not an OSError.
+    SHORTCUT_ERRORS = (OSError, ValueError, pywintypes.com_error)
+except ImportError:
+    HAS_WIN32 = False
+    SHORTCUT_ERRORS = (OSError, ValueError)
+
+DESKTOP_FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+
+
+class ExecutableResolver:
+    """Caches PATH lookups; the whole cache is dropped whenever PATH changes."""
+    def __init__(self):
+        self.path_value = None
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def which(self, name):
+        path_value = os.environ.get("PATH", "")
+        with self.lock:
+            if path_value != self.path_value:
+                self.cache.clear()
+                self.path_value = path_value
+            if name in self.cache:
+                return self.cache[name]
+        resolved = shutil.which(name, path=path_value)
+        with self.lock:
+            if path_value == self.path_value:
+                self.cache[name] = resolved
+        return resolved
+
+
+def read_shortcut(path):
+    """Return (target, arguments, working_dir) of a Windows .lnk shortcut."""
+    if not HAS_WIN32:
+        raise OSError("Resolving .lnk shortcuts requires pywin32")
+    pythoncom.CoInitialize()
+    try:
+        link = pythoncom.CoCreateInstance(shell.CLSID_ShellLink, None, pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink)
+        link.QueryInterface(pythoncom.IID_IPersistFile).Load(str(path))
+        # The raw path keeps variables like %ProgramFiles% unexpanded, which Popen cannot start.
+        target = os.path.expandvars(link.GetPath(shell.SLGP_RAWPATH)[0])
+        work_dir = link.GetWorkingDirectory()
+        return target, link.GetArguments(), os.path.expandvars(work_dir) if work_dir else None
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def split_windows_args(text):
+    """Split a Windows argument string the way CommandLineToArgvW does."""
+    args = []
+    current = []
+    in_arg = quoted = False
+    backslashes = 0
+    for ch in text:
+        if ch == "\\":
+            backslashes += 1
+            in_arg = True
+            continue
+        if ch == '"':
+            # 2n backslashes before a quote are n backslashes and a quote toggle; 2n+1 are n and a literal quote.
+            current.append("\\" * (backslashes // 2))
+            if backslashes % 2:
+                current.append('"')
+            else:
+                quoted = not quoted
+            backslashes = 0
+            in_arg = True
+            continue
+        current.append("\\" * backslashes)
+        backslashes = 0
+        if ch in " \t" and not quoted:
+            if in_arg:
+                args.append("".join(current))
+                current = []
+                in_arg = False
+            continue
+        current.append(ch)
+        in_arg = True
+    current.append("\\" * backslashes)
+    if in_arg:
+        args.append("".join(current))
+    return args
+
+
+class ShortcutArgv(list):
+    """argv of a .lnk target that also keeps the shortcut's argument string as written.
+
+    The list is what the child will see and is used for bookkeeping; Windows is
+    handed command_line() so the arguments reach the program unchanged instead
+    of being re-quoted by list2cmdline.
+    """
+    def __init__(self, target, arguments):
+        super().__init__([target] + split_windows_args(arguments or ""))
+        self.arguments = arguments or ""
+
+    def command_line(self):
+        return subprocess.list2cmdline(self[:1]) + (f" {self.arguments}" if self.arguments else "")
+
+
+def read_desktop_entry(path):
+    """Return (argv, working_dir) from the Exec/Path keys of a .desktop file."""
+    exec_line = None
+    work_dir = None
+    in_entry = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                in_entry = line == "[Desktop Entry]"
+            elif in_entry and line.startswith("Exec=") and exec_line is None:
+                exec_line = line[5:]
+            elif in_entry and line.startswith("Path="):
+                work_dir = line[5:] or None
+    if not exec_line:
+        raise ValueError(f"No Exec entry in {path}")
+    argv = [arg.replace("%%", "%") for arg in shlex.split(exec_line) if arg not in DESKTOP_FIELD_CODES]
+    return argv, work_dir
+
+
+def open_document(path):
+    """Open a URL, document or folder with the desktop's default handler."""
+    if path.startswith(("http://", "https://")):
+        webbrowser.open(path)
+    elif hasattr(os, "startfile"):
+        os.startfile(path)
+    else:
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        subprocess.Popen([opener, path], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+class LaunchRecord:
+    """Bookkeeping for one supervised launch."""
+    def __init__(self, name, path, argv):
+        self.name = name
+        self.path = path
+        self.argv = argv
+        self.pid = None
+        self.process = None
+        self.started = time.time()
+        self.spawn_latency = None
+        self.ended = None
+        self.returncode = None
+        self.status = "starting"
+        self.error = None
+
+    def uptime(self):
+        return (self.ended or time.time()) - self.started
+
+    def describe(self):
+        if self.status == "running":
+            return f"{self.name} (pid {self.pid}) running {int(self.uptime())}s"
+        if self.status == "spawn_failed":
+            return f"{self.name} failed to start: {self.error}"
+        return f"{self.name} (pid {self.pid}) {self.status}, exit code {self.returncode}"
+
+
+class ProcessSupervisor:
+    """Spawns launched apps without an intermediate shell and reaps them.
+
+    Targets are resolved once into an argv list (.lnk and .desktop files are
+    read, bare commands are looked up through a cached PATH resolver), the
+    child handle is kept, and a single background thread polls tracked
+    children so they never linger as zombies. on_change is called from that
+    thread whenever a child exits, so GUI callers must marshal it themselves.
+    """
+    def __init__(self, on_change=None, reap_interval=0.5, history_size=50):
+        self.on_change = on_change
+        self.reap_interval = reap_interval
+        self.resolver = ExecutableResolver()
+        self.running = {}
+        self.history = deque(maxlen=history_size)
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.reaper = None
+
+    def build_command(self, path):
+        """Return (argv, working_dir) for a launch target."""
+        lower = str(path).lower()
+        if lower.endswith(".lnk"):
+            target, arguments, work_dir = read_shortcut(path)
+            argv = ShortcutArgv(target, arguments)
+        elif lower.endswith(".desktop"):
+            argv, work_dir = read_desktop_entry(path)
+        elif os.path.exists(path):
+            argv, work_dir = [str(path)], None
+        else:
+            argv, work_dir = shlex.split(path, posix=os.name != "nt"), None
+        if not argv:
+            raise ValueError(f"Nothing to launch for {path}")
+        if not os.path.isabs(argv[0]) and os.sep not in argv[0]:
+            resolved = self.resolver.which(argv[0])
+            if not resolved:
+                raise FileNotFoundError(f"{argv[0]} not found on PATH")
+            argv[0] = resolved
+        return argv, work_dir
+
+    def spawn(self, name, path, command=None):
+        """Start path directly and track it; raises on failure.
+
+        command may carry an (argv, working_dir) pair already produced by
+        build_command so callers that inspected the target don't resolve it twice.
+        """
+        start = time.perf_counter()
+        record = LaunchRecord(name, path, None)
+        try:
+            record.argv, work_dir = command or self.build_command(path)
+            kwargs = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "cwd": work_dir}
+            if sys.platform == "win32":
+                kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+            else:
+                kwargs["start_new_session"] = True
+            args = record.argv.command_line() if isinstance(record.argv, ShortcutArgv) and sys.platform == "win32" else record.argv
+            record.process = subprocess.Popen(args, **kwargs)
+        except Exception as e:
+            record.status = "spawn_failed"
+            record.error = str(e)
+            record.ended = time.time()
+            record.spawn_latency = time.perf_counter() - start
+            with self.lock:
+                self.history.appendleft(record)
+            raise
+        record.spawn_latency = time.perf_counter() - start
+        record.pid = record.process.pid
+        record.status = "running"
+        with self.lock:
+            self.running[record.pid] = record
+        self.ensure_reaper()
+        logging.info("Spawned %s (pid %d) in %.1fms: %s", name, record.pid, record.spawn_latency * 1000, record.argv)
+        return record
+
+    def ensure_reaper(self):
+        self.wakeup.set()
+        if self.reaper is None or not self.reaper.is_alive():
+            self.reaper = threading.Thread(target=self.reap_loop, name="ProcessReaper", daemon=True)
+            self.reaper.start()
+
+    def reap_loop(self):
+        while True:
+            with self.lock:
+                idle = not self.running
+            if idle:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+            self.reap()
+            time.sleep(self.reap_interval)
+
+    def reap(self):
+        """Collect exited children; returns the records that finished."""
+        with self.lock:
+            records = list(self.running.values())
+        finished = []
+        for record in records:
+            returncode = record.process.poll()
+            if returncode is None:
+                continue
+            record.returncode = returncode
+            record.ended = time.time()
+            record.status = "exited" if returncode == 0 else "failed"
+            record.process = None
+            finished.append(record)
+        if finished:
+            with self.lock:
+                for record in finished:
+                    self.running.pop(record.pid, None)
+                    self.history.appendleft(record)
+            for record in finished:
+                logging.info("%s (pid %d) exited with code %s after %.1fs", record.name, record.pid, record.returncode, record.uptime())
+            if self.on_change:
+                self.on_change(finished)
+        return finished
+
+    def snapshot(self):
+        """Return (running records, finished records), newest first."""
+        with self.lock:
+            return sorted(self.running.values(), key=lambda r: r.started, reverse=True), list(self.history)
@@ -0,0 +1,100 @@
+"""Theme compilation: stylesheets built once per theme.
+
+Building the stylesheet f-strings is cheap, but handing Qt a new stylesheet
+string makes it re-parse and re-polish every widget under it. ThemeEngine
+compiles each (colors, font) combination once and returns the same Theme
+object afterwards, so callers can skip setStyleSheet entirely when a part
+did not change, and dialogs and menus reuse the cached strings instead of
+formatting their own on every open.
+"""
+from PyQt5.QtGui import QColor
+
+# "dark" and "custom" render the user's colors, whose defaults are the dark palette.
+PRESETS = {
+    "light": {
+        'bg': '#f5f5f5', 'fg': '#1a1a1a', 'accent': '#0077b6',
+        'pane': '#e0e0e0', 'list_text': '#1a1a1a', 'list_bg': '#e0e0e0'
+    },
+    "highcontrast": {
+        'bg': '#000000', 'fg': '#00ff00', 'accent': '#00ff00',
+        'pane': '#111111', 'list_text': '#00ff00', 'list_bg': '#111111'
+    },
+}
+
+
+def shade(color, delta):
+    c = QColor(color)
+    return QColor(max(0, min(255, c.red() + delta)), max(0, min(255, c.green() + delta)), max(0, min(255, c.blue() + delta))).name()
+
+
+class Theme:
+    """Compiled stylesheets for one set of colors and font."""
+    def __init__(self, colors, font_family, font_size):
+        self.colors = dict(colors)
+        bg, fg, accent, pane, list_text, list_bg = (colors[k] for k in ('bg', 'fg', 'accent', 'pane', 'list_text', 'list_bg'))
+        hover = QColor(accent).lighter(125).name()
+        pane_dark = shade(pane, -20)
+        font = f"{font_family} {font_size}pt"
+        self.pane_dark = pane_dark
+
+        self.window = f"""
+            QMainWindow {{ background: {bg}; border: 1px solid {accent}; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }}
+            QLineEdit {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 20px; padding: 8px 32px; font: {font}; }}
+            QLineEdit:focus {{ border: 2px solid {accent}; background: {pane}; }}
+            QListView {{ background: {list_bg}; color: {list_text}; border: none; padding: 12px; font: {font}; }}
+            QToolButton {{ background: {pane}; color: {fg}; border: none; border-radius: 8px; font: bold 13px Inter; }}
+            QToolButton:checked, QToolButton:hover {{ background: {accent}; color: #ffffff; }}
+            QLabel#windowTitle {{ font: bold 16px Inter; color: {fg}; }}
+            QToolButton#titleButton {{ border-radius: 18px; font: bold 14px; }}
+            QToolButton#clearSearch {{ background: none; color: {fg}; font: bold 14px; }}
+            QPushButton {{ background: {accent}; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 13px Inter; }}
+            QPushButton:hover {{ background: {hover}; }}
+            QComboBox {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 8px; padding: 6px; font: 12px Inter; }}
+            QComboBox::drop-down {{ border: none; }}
+            QComboBox::down-arrow {{ image: none; }}
+            QLabel {{ color: {fg}; font: 12px Inter; padding: 4px; }}
+            QProgressBar {{ background: {pane}; border: 1px solid {accent}; border-radius: 2px; }}
+            QProgressBar::chunk {{ background: {accent}; }}
+        """
+        self.title_bar = f"""
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {pane}, stop:1 {pane_dark});
+            border-bottom: 1px solid {accent};
+        """
+        self.stats = f"color: {fg}; font: 11px Inter;"
+        self.action_bar = f"background: {pane}; border-radius: 8px; padding: 6px;"
+        self.notification = f"background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 8px; padding: 10px; font: 12px Inter;"
+        self.dialog = f"""
+            QDialog {{ background: {bg}; border: 1px solid {accent}; border-radius: 12px; box-shadow: 0 8px 16px rgba(0,0,0,0.5); }}
+            QLabel {{ color: {fg}; font: bold 13px Inter; }}
+            QComboBox, QSpinBox, QSlider, QLineEdit, QPlainTextEdit {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 8px; padding: 6px; font: 12px Inter; }}
+            QPushButton {{ background: {accent}; color: #ffffff; border-radius: 8px; padding: 8px; font: bold 12px Inter; }}
+            QPushButton:hover {{ background: {hover}; }}
+            QCheckBox {{ color: {fg}; font: 12px Inter; }}
+            QTabWidget::pane {{ border: 1px solid {accent}; background: {list_bg}; }}
+            QTabWidget::tab-bar {{ alignment: center; }}
+            QTabBar::tab {{ background: {pane}; color: {fg}; padding: 8px 16px; border: none; font: bold 12px Inter; }}
+            QTabBar::tab:selected {{ background: {accent}; color: #ffffff; }}
+        """
+        self.menu = f"""
+            QMenu {{ background: {pane}; color: {fg}; border: 1px solid {accent}; border-radius: 8px; }}
+            QMenu::item:selected {{ background: {accent}; color: #ffffff; }}
+            QMenu::item:disabled {{ color: {shade(fg, -80) if QColor(fg).lightness() > 128 else shade(fg, 80)}; }}
+        """
+        self.title = f"font: bold 16px Inter; color: {accent};"
+
+
+class ThemeEngine:
+    """Hands out compiled Themes, compiling each combination only once."""
+    def __init__(self, limit=8):
+        self.limit = limit
+        self.themes = {}
+
+    def get(self, mode, custom_colors, font_family, font_size):
+        colors = PRESETS.get(mode, custom_colors)
+        key = (tuple(sorted(colors.items())), font_family, font_size)
+        theme = self.themes.get(key)
+        if theme is None:
+            theme = self.themes[key] = Theme(colors, font_family, font_size)
+            if len(self.themes) > self.limit:
+                self.themes.pop(next(iter(self.themes)))
+        return theme